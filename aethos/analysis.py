@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from aethos.config import shell
+from aethos.stats.correlation import correlation_engine
 from aethos.stats.stats import Stats
 from aethos.util import (
     CLEANING_CHECKLIST,
@@ -51,6 +52,7 @@ class Analysis(Visualizations, Stats):
         self.x_test = x_test
         self.target = target
         self.target_mapping = None
+        self.fitted_transformers = {}
 
     def __repr__(self):
 
@@ -80,6 +82,7 @@ class Analysis(Visualizations, Stats):
         )
 
         new_inst.target_mapping = self.target_mapping
+        new_inst.fitted_transformers = self.fitted_transformers
 
         return new_inst
 
@@ -547,6 +550,8 @@ class Analysis(Visualizations, Stats):
         """
         Plots a correlation matrix of all the numerical variables.
 
+        The correlations are computed in float32 blocks and reuse the ones cached by `drop_correlated_features`.
+
         For more information on possible kwargs please see: https://seaborn.pydata.org/generated/seaborn.heatmap.html
         
         Parameters
@@ -566,8 +571,14 @@ class Analysis(Visualizations, Stats):
         >>> data.correlation_matrix(data_labels=True, output_file='corr.png')
         """
 
+        columns = self.x_train.select_dtypes([np.number, "bool"]).columns.tolist()
+        engine = correlation_engine(
+            self.x_train, engine=self.fitted_transformers.get("correlation")
+        )
+        self.fitted_transformers["correlation"] = engine
+
         return self._viz.viz_correlation_matrix(
-            self.x_train.corr(),
+            engine.matrix(columns),
             data_labels=data_labels,
             hide_mirror=hide_mirror,
             output_file=output_file,
@@ -507,3 +507,31 @@ def is_type_factory(_type):
 
 is_bool = is_type_factory(bool)
 is_list = is_type_factory(list)
+is_int = is_type_factory(int)
+
+
+def is_one_of_factory(legal_values):
+    """
+    Parameters
+    ----------
+    `legal_values` - list of values the option is allowed to take
+    Returns
+    -------
+    validator - a function of a single argument x , which raises
+                ValueError if x is not one of `legal_values`
+    """
+
+    def inner(x):
+        if x not in legal_values:
+            pp_values = "|".join(map(str, legal_values))
+            msg = "Value must be one of {pp_values}"
+            raise ValueError(msg.format(pp_values=pp_values))
+
+    return inner
+
+
+def is_ratio(x):
+    """Validator which raises ValueError if x is not a number between 0 and 1."""
+
+    if isinstance(x, bool) or not isinstance(x, (int, float)) or not 0 <= x <= 1:
+        raise ValueError("Value must be a number between 0 and 1")
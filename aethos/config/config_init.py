@@ -1,6 +1,12 @@
 import aethos.config.config as cf
 from aethos.config import cfg, shell
-from aethos.config.config import is_bool, is_list
+from aethos.config.config import (
+    is_bool,
+    is_int,
+    is_list,
+    is_one_of_factory,
+    is_ratio,
+)
 from aethos.config.user_config import _make_experiment_dir
 from aethos.util import _make_dir
 
@@ -81,6 +87,76 @@ track_experiments_doc = """
     Valid values: False, True
 """
 
+text_dtype_doc = """
+: str
+    Storage dtype of the text columns created by Preprocess methods.
+    'string[pyarrow]' stores text in Arrow buffers instead of Python objects,
+    which uses far less memory, pickles faster and lets string methods run in Arrow compute kernels.
+    Requires pyarrow (`pip install aethos[arrow]`).
+    Default value is 'object'
+    Valid values: 'object', 'string', 'string[pyarrow]'
+"""
+
+text_dedup_ratio_doc = """
+: float
+    Minimum share of duplicated values in a text column for per row text transforms
+    (clean_text, stem_nltk, spaCy and TextBlob features, etc.) to process each distinct value once
+    and broadcast the result back to every row.
+    Set to 1.0 to always process every row.
+    Default value is 0.2
+    Valid values: float between 0.0 and 1.0
+"""
+
+spacy_model_doc = """
+: str
+    Name of the spaCy model used by the spaCy features (postag_spacy, nounphrases_spacy, etc.).
+    Models are loaded once per process for each set of enabled pipeline components.
+    Default value is 'en_core_web_sm'
+"""
+
+spacy_batch_size_doc = """
+: int
+    Number of texts spaCy processes per batch with `nlp.pipe`.
+    Default value is 256
+"""
+
+spacy_n_process_doc = """
+: int
+    Number of processes spaCy uses with `nlp.pipe`, -1 uses every CPU.
+    Default value is 1
+"""
+
+feature_cache_doc = """
+: bool
+    Cache the columns added by expensive Feature methods (tfidf, pca, polynomial_features, spaCy features, etc.)
+    on disk, keyed by a hash of the data, the method parameters and the options.
+    Running the same method on the same data again loads the cached columns instead of recomputing them.
+    Cached features are stored in `~/.aethos/cache` unless another directory is set in `config.yml`.
+    Default value is False
+    Valid values: False, True
+"""
+
+feature_cache_size_doc = """
+: int
+    Maximum size of the feature cache in bytes, the least recently used features are deleted above it.
+    Default value is 2147483648 (2 GB)
+"""
+
+n_jobs_doc = """
+: int
+    Number of workers Feature methods run independent per column jobs with (tfidf, bag_of_words, text_hash,
+    spaCy and TextBlob features), -1 uses every CPU.
+    Methods also take an `n_jobs` argument that overrides it.
+    Default value is 1
+"""
+
+memory_budget_doc = """
+: int
+    Maximum memory in bytes the per column jobs running at once may use, estimated from the memory of their input columns.
+    The number of workers is reduced to fit in it, 0 means no limit.
+    Default value is 0
+"""
+
 
 def use_qgrid(key):
     import qgrid
@@ -101,6 +177,16 @@ def use_itable(key):
     opt.maxBytes = 0
 
 
+def check_text_dtype(key):
+    if cf.get_option(key) == "string[pyarrow]":
+        try:
+            import pyarrow
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "Arrow text storage requires pyarrow, install it with `pip install aethos[arrow]`."
+            )
+
+
 def create_experiment_dir(key):
     _make_experiment_dir()
 
@@ -132,3 +218,42 @@ cf.register_option(
     validator=is_bool,
     cb=create_experiment_dir,
 )
+
+cf.register_option(
+    "text_dtype",
+    default="object",
+    doc=text_dtype_doc,
+    validator=is_one_of_factory(["object", "string", "string[pyarrow]"]),
+    cb=check_text_dtype,
+)
+
+cf.register_option(
+    "text_dedup_ratio", default=0.2, doc=text_dedup_ratio_doc, validator=is_ratio
+)
+
+cf.register_option("spacy_model", default="en_core_web_sm", doc=spacy_model_doc)
+
+cf.register_option(
+    "spacy_batch_size", default=256, doc=spacy_batch_size_doc, validator=is_int
+)
+
+cf.register_option(
+    "spacy_n_process", default=1, doc=spacy_n_process_doc, validator=is_int
+)
+
+cf.register_option(
+    "feature_cache", default=False, doc=feature_cache_doc, validator=is_bool
+)
+
+cf.register_option(
+    "feature_cache_size",
+    default=2 * 1024 ** 3,
+    doc=feature_cache_size_doc,
+    validator=is_int,
+)
+
+cf.register_option("n_jobs", default=1, doc=n_jobs_doc, validator=is_int)
+
+cf.register_option(
+    "memory_budget", default=0, doc=memory_budget_doc, validator=is_int
+)
@@ -27,6 +27,16 @@ def _make_image_dir():
     return image_dir
 
 
+def _make_cache_dir():
+
+    # Config files created before the feature cache have no cache section
+    cache_dir = (cfg.get("cache") or {}).get("dir") or DEFAULT_CACHE_DIR
+
+    _make_dir(cache_dir)
+
+    return cache_dir
+
+
 def _make_experiment_dir():  # pragma: no cover
 
     if not cfg["mlflow"]["dir"]:
@@ -42,6 +52,7 @@ def _make_experiment_dir():  # pragma: no cover
 
 DEFAULT_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".aethos", "models")
 DEFAULT_IMAGE_DIR = os.path.join(os.path.expanduser("~"), ".aethos", "images")
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".aethos", "cache")
 DEFAULT_EXPERIMENTS_DIR = "file:" + os.path.join(
     os.path.expanduser("~"), ".aethos", "experiments", "mlruns"
 )
@@ -0,0 +1,241 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+STRATEGIES = ["vectorized", "numba", "rows"]
+
+# Row function of the running process pool apply, inherited by the forked workers so lambdas work
+_ROW_FUNC = None
+
+# Errors raised when a function does not support the vectorized or numba strategy
+_UNSUPPORTED_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+def apply_rows(
+    func, df, strategies=STRATEGIES, n_jobs=-1, chunksize=10000, n_check=100
+):
+    """
+    Applies a row function to a Dataframe with the fastest strategy that gives the same results as `df.apply(func, axis=1)`.
+
+    - vectorized: `func` is called once with the whole Dataframe, e.g. `lambda x: x['a'] > 0` becomes a column comparison
+    - numba: `func` is compiled with numba and run over a record array of only the columns it reads
+    - rows: `df.apply(func, axis=1)` in chunks of `chunksize` rows over a pool of `n_jobs` processes
+
+    The vectorized and numba results are checked against the row apply on `n_check` rows before they are accepted.
+    The numba strategy requires numba (`pip install aethos[numba]`).
+
+    Parameters
+    ----------
+    func : Function
+        Function of a row
+
+    df : Dataframe
+        Data
+
+    strategies : list, optional
+        Strategies to try, in order, by default all of them
+
+    n_jobs : int, optional
+        Number of processes of the row strategy, -1 uses every CPU, by default -1
+
+    chunksize : int, optional
+        Number of rows sent to a process at a time by the row strategy, by default 10000
+
+    n_check : int, optional
+        Number of rows the vectorized and numba results are checked on, by default 100
+
+    Returns
+    -------
+    Series, str, float
+        Result, strategy used and rows processed per second
+    """
+
+    if any(strategy not in STRATEGIES for strategy in strategies):
+        raise ValueError(f"Invalid strategy, choose from {STRATEGIES}.")
+
+    positions = np.unique(
+        np.linspace(0, len(df) - 1, min(n_check, len(df))).astype(int)
+    )
+    expected = df.iloc[positions].apply(func, axis=1) if len(positions) else None
+
+    for strategy in strategies:
+        start = time.perf_counter()
+
+        if strategy == "rows":
+            result = _apply_rows(func, df, n_jobs, chunksize)
+        else:
+            try:
+                result = (
+                    _apply_vectorized(func, df)
+                    if strategy == "vectorized"
+                    else _apply_numba(func, df)
+                )
+            except _UNSUPPORTED_ERRORS:
+                # The function does not support this strategy
+                continue
+
+            if not _matches(result, expected, positions):
+                continue
+
+        elapsed = time.perf_counter() - start
+
+        return result, strategy, len(df) / elapsed if elapsed else float("inf")
+
+    raise ValueError(f"None of the strategies {strategies} could apply the function.")
+
+
+def _apply_vectorized(func, df):
+    """Calls func with the whole Dataframe, accepted if it returns one value per row."""
+
+    result = func(df)
+
+    if not isinstance(result, (pd.Series, np.ndarray)) or np.ndim(result) != 1:
+        raise TypeError("Function is not vectorizable.")
+
+    if len(result) != len(df):
+        raise TypeError("Function is not vectorizable.")
+
+    if isinstance(result, pd.Series):
+        if not result.index.equals(df.index):
+            raise TypeError("Function is not vectorizable.")
+
+        return result
+
+    return pd.Series(result, index=df.index)
+
+
+def _apply_numba(func, df):
+    """Compiles func with numba and runs it over a record array of the columns it reads."""
+
+    numba = _numba()
+
+    # Columns named in the function's code, plus the ones read on the first row through variables
+    recorder = _ColumnRecorder(df.iloc[0])
+    first = func(recorder)
+    names = _code_constants(func.__code__) | set(recorder.columns)
+    columns = [col for col in df.columns if col in names]
+
+    if not columns or any(
+        not pd.api.types.is_numeric_dtype(df[col]) for col in columns
+    ):
+        raise TypeError("Function does not only read numeric columns.")
+
+    records = df[columns].to_records(index=False)
+    out = np.empty(len(df), dtype=np.asarray(first).dtype)
+
+    try:
+        _numba_kernel(numba, func)(records, out)
+    except numba.core.errors.NumbaError as e:
+        raise TypeError("Function can not be compiled with numba.") from e
+
+    return pd.Series(out, index=df.index)
+
+
+def _numba():
+    """Imports numba, an optional dependency."""
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The numba strategy requires numba, install it with `pip install aethos[numba]` "
+            "or leave it out of `strategies`."
+        )
+
+    return numba
+
+
+def _code_constants(code):
+    """String constants of a code object and the code objects nested in it."""
+
+    constants = set()
+
+    for const in code.co_consts:
+        if isinstance(const, str):
+            constants.add(const)
+        elif hasattr(const, "co_consts"):
+            constants |= _code_constants(const)
+
+    return constants
+
+
+def _numba_kernel(numba, func):
+    """Compiled loop calling the compiled row function on every record."""
+
+    row_func = numba.njit(func)
+
+    @numba.njit
+    def kernel(records, out):
+        for i in range(len(records)):
+            out[i] = row_func(records[i])
+
+    return kernel
+
+
+def _apply_rows(func, df, n_jobs, chunksize):
+    """Row apply, in chunks over a pool of forked processes when there is more than one chunk."""
+
+    global _ROW_FUNC
+
+    chunks = [
+        df.iloc[start : start + chunksize] for start in range(0, len(df), chunksize)
+    ]
+
+    if (
+        n_jobs == 1
+        or len(chunks) < 2
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return df.apply(func, axis=1)
+
+    _ROW_FUNC = func
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs if n_jobs > 0 else None,
+            mp_context=multiprocessing.get_context("fork"),
+        ) as pool:
+            return pd.concat(pool.map(_apply_chunk, chunks))
+    finally:
+        _ROW_FUNC = None
+
+
+def _apply_chunk(chunk):
+
+    return chunk.apply(_ROW_FUNC, axis=1)
+
+
+def _matches(result, expected, positions):
+    """True if the result equals the row apply result on the checked rows."""
+
+    if expected is None:
+        return True
+
+    try:
+        pd.testing.assert_series_equal(
+            result.iloc[positions].reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_dtype=False,
+            check_names=False,
+        )
+    except (AssertionError, TypeError, ValueError):
+        return False
+
+    return True
+
+
+class _ColumnRecorder(object):
+    """Row that records the columns a function reads."""
+
+    def __init__(self, row):
+
+        self._row = row
+        self.columns = []
+
+    def __getitem__(self, key):
+
+        self.columns.append(key)
+
+        return self._row[key]
@@ -0,0 +1,280 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from aethos.util import QuantileSketch
+
+STRATEGIES = ["quantile", "uniform", "tree"]
+
+
+class Binner(object):
+    """
+    Discretizes numeric columns into integer bin codes.
+
+    - quantile: equal frequency bins, edges from mergeable quantile sketches
+    - uniform: equal width bins between the running minimum and maximum
+    - tree: edges are the split thresholds of a decision tree with `n_bins` leaves fit on the target
+
+    The quantile and uniform edges are fit in one pass and can be fit over chunks with `partial_fit`
+    or on separate workers and combined with `merge`.
+
+    Values are assigned to bins with a binary search of the edges. Bin codes are uint8, or uint16
+    above 255 bins, and missing values get their own code, `n_bins`.
+
+    Parameters
+    ----------
+    strategy : str {'quantile', 'uniform', 'tree'}, optional
+        Binning strategy, by default 'quantile'
+
+    n_bins : int, optional
+        Maximum number of bins, by default 10
+
+    n_jobs : int, optional
+        Number of threads processing columns, -1 uses every CPU, by default 1
+
+    sketch_size : int, optional
+        Compactor capacity of the quantile sketches, by default 2048
+
+    random_state : int, optional
+        Seed of the decision trees, by default 42
+    """
+
+    def __init__(
+        self,
+        strategy="quantile",
+        n_bins=10,
+        n_jobs=1,
+        sketch_size=2048,
+        random_state=42,
+    ):
+
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Invalid binning strategy, choose from {STRATEGIES}.")
+
+        if not 1 < n_bins < 2 ** 16 - 1:
+            raise ValueError("Number of bins must be between 2 and 65534.")
+
+        self.strategy = strategy
+        self.n_bins = n_bins
+        self.n_jobs = n_jobs
+        self.sketch_size = sketch_size
+        self.random_state = random_state
+
+        self.sketches_ = None
+        self.data_min_ = None
+        self.data_max_ = None
+        self.edges_ = None
+
+    def partial_fit(self, X):
+        """
+        Updates the quantile sketches or the running minimum and maximum with a chunk of data.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Chunk of data
+
+        Returns
+        -------
+        Binner
+            The fitted binner
+        """
+
+        if self.strategy == "tree":
+            raise ValueError("Tree binning needs a target, use fit.")
+
+        X = np.asarray(X, dtype=np.float64)
+        n_features = X.shape[1]
+
+        if self.sketches_ is None:
+            self.sketches_ = [
+                QuantileSketch(self.sketch_size) for _ in range(n_features)
+            ]
+            self.data_min_ = np.full(n_features, np.inf)
+            self.data_max_ = np.full(n_features, -np.inf)
+
+        if self.strategy == "quantile":
+            self._map(lambda i: self.sketches_[i].update(X[:, i]), range(n_features))
+        elif len(X):
+            with np.errstate(invalid="ignore"):
+                self.data_min_ = np.fmin(self.data_min_, np.nanmin(X, axis=0))
+                self.data_max_ = np.fmax(self.data_max_, np.nanmax(X, axis=0))
+
+        self.edges_ = None
+
+        return self
+
+    def fit(self, X, y=None, chunksize=None):
+        """
+        Computes the bin edges of every column.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Dataset
+
+        y : Series or array like, optional
+            Target, required by the tree strategy
+
+        chunksize : int, optional
+            Number of rows per chunk for the quantile and uniform strategies, by default all rows at once
+
+        Returns
+        -------
+        Binner
+            The fitted binner
+        """
+
+        X = np.asarray(X, dtype=np.float64)
+
+        if self.strategy == "tree":
+            if y is None:
+                raise ValueError("Tree binning needs a target.")
+
+            self.edges_ = self._map(
+                lambda i: self._tree_edges(X[:, i], y), range(X.shape[1])
+            )
+
+            return self
+
+        chunksize = chunksize or max(len(X), 1)
+
+        for start in range(0, len(X), chunksize):
+            self.partial_fit(X[start : start + chunksize])
+
+        return self
+
+    def merge(self, other):
+        """
+        Merges the state of a binner fit on another chunk or worker into this one.
+
+        Parameters
+        ----------
+        other : Binner
+            Binner using the same strategy, fit on other data
+
+        Returns
+        -------
+        Binner
+            The merged binner
+        """
+
+        if other.strategy != self.strategy or self.strategy == "tree":
+            raise ValueError(
+                "Can only merge quantile or uniform binners using the same strategy."
+            )
+
+        if other.sketches_ is None:
+            return self
+
+        if self.sketches_ is None:
+            self.sketches_ = [QuantileSketch(self.sketch_size) for _ in other.sketches_]
+            self.data_min_ = np.full(len(other.sketches_), np.inf)
+            self.data_max_ = np.full(len(other.sketches_), -np.inf)
+
+        for sketch, other_sketch in zip(self.sketches_, other.sketches_):
+            sketch.merge(other_sketch)
+
+        self.data_min_ = np.fmin(self.data_min_, other.data_min_)
+        self.data_max_ = np.fmax(self.data_max_, other.data_max_)
+        self.edges_ = None
+
+        return self
+
+    def bin_edges(self):
+        """
+        Inner bin edges of every column, computed from the sketches or the running minimum and maximum.
+
+        Returns
+        -------
+        list
+            Sorted edges of every column, a value `x` is in bin `i` if `edges[i - 1] <= x < edges[i]`
+        """
+
+        if self.edges_ is None:
+            if self.sketches_ is None:
+                raise ValueError("Binner has not been fit yet.")
+
+            inner = np.linspace(0, 1, self.n_bins + 1)[1:-1]
+
+            if self.strategy == "quantile":
+                edges = [sketch.quantile(inner) for sketch in self.sketches_]
+            else:
+                edges = [
+                    low + inner * (high - low)
+                    for low, high in zip(self.data_min_, self.data_max_)
+                ]
+
+            # Empty bins of skewed columns are merged
+            self.edges_ = [np.unique(edge[~np.isnan(edge)]) for edge in edges]
+
+        return self.edges_
+
+    def transform(self, X):
+        """
+        Assigns every value to its bin.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Data to bin
+
+        Returns
+        -------
+        ndarray
+            uint8 or uint16 bin codes, missing values are coded `n_bins`
+        """
+
+        X = np.asarray(X, dtype=np.float64)
+        edges = self.bin_edges()
+        codes = np.empty(X.shape, dtype=self.dtype)
+
+        def bin_column(i):
+            codes[:, i] = np.searchsorted(edges[i], X[:, i], side="right")
+            codes[np.isnan(X[:, i]), i] = self.n_bins
+
+        self._map(bin_column, range(X.shape[1]))
+
+        return codes
+
+    def fit_transform(self, X, y=None, chunksize=None):
+        """Fits the binner over `X` and returns the bin codes."""
+
+        return self.fit(X, y, chunksize=chunksize).transform(X)
+
+    @property
+    def dtype(self):
+        """Smallest unsigned integer dtype holding every bin code and the missing code."""
+
+        return np.uint8 if self.n_bins < 2 ** 8 else np.uint16
+
+    def _tree_edges(self, x, y):
+        """Split thresholds of a decision tree with `n_bins` leaves fit on one column."""
+
+        from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+        y = pd.Series(y).to_numpy()
+        observed = ~np.isnan(x)
+        tree = (
+            DecisionTreeRegressor
+            if pd.api.types.is_float_dtype(y)
+            else DecisionTreeClassifier
+        )(max_leaf_nodes=self.n_bins, random_state=self.random_state)
+
+        if not observed.any():
+            return np.empty(0)
+
+        tree.fit(x[observed, None], y[observed])
+
+        # Leaves have a feature of -2
+        return np.unique(tree.tree_.threshold[tree.tree_.feature >= 0])
+
+    def _map(self, func, iterable):
+        """Runs func over the columns in a thread pool."""
+
+        with ThreadPoolExecutor(
+            max_workers=os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        ) as pool:
+            return list(pool.map(func, iterable))
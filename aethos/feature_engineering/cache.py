@@ -0,0 +1,286 @@
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from aethos.config.user_config import _make_cache_dir
+
+META_FILE = "meta.pkl"
+
+# Bumped when the layout of the entries or the output of a cached method changes
+CACHE_VERSION = 2
+
+
+def cache_feature(method):
+    """
+    Caches the columns a Feature method adds on disk, keyed by a hash of the data, the method name,
+    its parameters and the global options.
+
+    Enabled with the `feature_cache` option, the cache is stored under `~/.aethos/cache`
+    (`cache: dir` in `config.yml`) and the least recently used entries are evicted once it is
+    larger than the `feature_cache_size` option.
+
+    The whole data is stored after the method runs, so columns it overwrites are cached too.
+    Dense numeric columns are stored as .npy blocks and loaded memory mapped without a copy,
+    other columns and the fitted transformers are pickled.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+
+        from aethos.config.config import _global_config
+
+        if not _global_config["feature_cache"]:
+            return method(self, *args, **kwargs)
+
+        try:
+            key = _cache_key(method.__name__, self, args, kwargs)
+        except TypeError:
+            # Data that can not be hashed, e.g. lists in object columns
+            return method(self, *args, **kwargs)
+
+        path = os.path.join(_make_cache_dir(), key)
+
+        if os.path.exists(os.path.join(path, META_FILE)):
+            _load_entry(self, path)
+            print(f"{method.__name__}: loaded from the feature cache.")
+
+            return self
+
+        before = dict(self.fitted_transformers)
+
+        result = method(self, *args, **kwargs)
+
+        _store_entry(self, path, before)
+        _evict(os.path.dirname(path), _global_config["feature_cache_size"])
+
+        return result
+
+    return wrapper
+
+
+def _cache_key(name, data, args, kwargs):
+    """Hash of the method call and the data it runs on."""
+
+    from aethos.config.config import _global_config
+
+    key = hashlib.blake2b(digest_size=20)
+    _update_key(
+        key,
+        (
+            _code_version(),
+            name,
+            args,
+            sorted(kwargs.items()),
+            data.target,
+            sorted(_global_config.items()),
+            data.x_train,
+            data.x_test,
+        ),
+    )
+
+    return key.hexdigest()
+
+
+def _update_key(key, value):
+    """Hashes a value into the key, arrays and Dataframes by their contents."""
+
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        columns = value.columns.tolist() if isinstance(value, pd.DataFrame) else []
+        dtypes = value.dtypes if isinstance(value, pd.DataFrame) else [value.dtype]
+        key.update(repr((type(value), columns, [str(d) for d in dtypes])).encode())
+        key.update(_hash_values(value))
+    elif isinstance(value, np.ndarray):
+        key.update(repr((value.dtype.str, value.shape)).encode())
+
+        if value.dtype.hasobject:
+            key.update(_hash_values(pd.Series(value.ravel()), index=False))
+        else:
+            key.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        key.update(f"{type(value).__name__}{len(value)}(".encode())
+
+        for item in value:
+            _update_key(key, item)
+
+        key.update(b")")
+    elif isinstance(value, dict):
+        _update_key(key, sorted(value.items()))
+    else:
+        key.update(repr(value).encode())
+
+
+def _hash_values(value, index=True):
+    """Row hashes of a pandas object as bytes."""
+
+    hashes = pd.util.hash_pandas_object(value, index=index)
+
+    return hashes.to_numpy().tobytes()
+
+
+def _code_version():
+    """Version of the installed aethos package and of the cache layout."""
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("aethos")
+    except PackageNotFoundError:
+        package_version = None
+
+    return package_version, CACHE_VERSION
+
+
+def _store_entry(data, path, before):
+    """Writes the data after a method ran and the transformers it fitted to a cache entry."""
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(tmp_path)
+
+    meta = {
+        "fitted_transformers": {
+            name: transformer
+            for name, transformer in data.fitted_transformers.items()
+            if before.get(name) is not transformer
+        }
+    }
+
+    for split in ["x_train", "x_test"]:
+        df = getattr(data, split)
+
+        if df is None:
+            meta[split] = None
+            continue
+
+        meta[split] = _store_columns(df, tmp_path, split)
+        meta[split]["index"] = df.index
+
+    with open(os.path.join(tmp_path, META_FILE), "wb") as f:
+        pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        # Another process stored the same entry first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _store_columns(df, path, split):
+    """
+    Stores runs of adjacent dense numeric columns with the same dtype as Fortran ordered .npy blocks,
+    the other runs of columns are pickled.
+    """
+
+    parts = []
+
+    for cols in _runs(df):
+        file_name = f"{split}_{len(parts)}"
+        dtype = df[cols[0]].dtype
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            file_name += ".npy"
+            np.save(
+                os.path.join(path, file_name),
+                np.asfortranarray(df[cols].to_numpy(dtype=dtype)),
+            )
+        else:
+            file_name += ".pkl"
+            df[cols].to_pickle(os.path.join(path, file_name))
+
+        parts.append((file_name, cols))
+
+    return {"parts": parts}
+
+
+def _runs(df):
+    """Groups adjacent columns with the same dtype."""
+
+    runs = []
+
+    for col, dtype in df.dtypes.items():
+        if runs and df[runs[-1][-1]].dtype == dtype:
+            runs[-1].append(col)
+        else:
+            runs.append([col])
+
+    return runs
+
+
+def _load_entry(data, path):
+    """
+    Replaces the data with a cache entry, numeric blocks are memory mapped copy on write,
+    so the data can be edited without changing the entry.
+
+    The blocks are stored in column order and concatenated without a copy, reordering
+    the columns afterwards would copy the memory mapped blocks.
+    """
+
+    with open(os.path.join(path, META_FILE), "rb") as f:
+        meta = pickle.load(f)
+
+    os.utime(os.path.join(path, META_FILE))
+
+    for split in ["x_train", "x_test"]:
+        if meta[split] is None:
+            continue
+
+        index = meta[split]["index"]
+        frames = [
+            _load_block(os.path.join(path, file_name), cols, index)
+            for file_name, cols in meta[split]["parts"]
+        ]
+
+        if not frames:
+            combined = pd.DataFrame(index=index)
+        elif len(frames) == 1:
+            combined = frames[0]
+        else:
+            combined = pd.concat(frames, axis=1, copy=False)
+
+        setattr(data, split, combined)
+
+    data.fitted_transformers.update(meta["fitted_transformers"])
+
+
+def _load_block(path, columns, index):
+    """Loads a stored block of columns, .npy blocks are memory mapped without a copy."""
+
+    if not path.endswith(".npy"):
+        return pd.read_pickle(path)
+
+    values = np.load(path, mmap_mode="c")
+
+    return pd.DataFrame(values, columns=columns, index=index, copy=False)
+
+
+def _evict(cache_dir, max_size):
+    """Deletes the least recently used entries until the cache is at most `max_size` bytes."""
+
+    entries = []
+
+    for name in os.listdir(cache_dir):
+        entry = os.path.join(cache_dir, name)
+        meta = os.path.join(entry, META_FILE)
+
+        if not os.path.exists(meta):
+            continue
+
+        size = sum(
+            os.path.getsize(os.path.join(entry, file_name))
+            for file_name in os.listdir(entry)
+        )
+        entries.append((os.path.getmtime(meta), size, entry))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, entry in sorted(entries):
+        if total <= max_size:
+            break
+
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
@@ -0,0 +1,278 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from sklearn.model_selection import KFold
+from sklearn.utils import murmurhash3_32
+
+
+class HashEncoder(object):
+    """
+    Encodes categorical columns into a fixed number of columns with the hashing trick.
+
+    Every `column=value` token is hashed with signed 32-bit Murmurhash3, the same hash as
+    sklearn's FeatureHasher. Only the distinct values of a column are hashed, rows are
+    mapped to the hashed indices through their codes.
+
+    Parameters
+    ----------
+    n_features : int, optional
+        Number of output columns, by default 1024
+
+    alternate_sign : bool, optional
+        Use the sign of the hash as the value to reduce the effect of collisions, by default True
+
+    dtype : numpy dtype, optional
+        Output dtype, by default np.float64
+
+    prefix : str, optional
+        Prefix of the output column names, by default 'hash'
+    """
+
+    def __init__(
+        self, n_features=1024, alternate_sign=True, dtype=np.float64, prefix="hash"
+    ):
+
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+        self.dtype = dtype
+        self.prefix = prefix
+
+    def fit(self, X, y=None):
+        """
+        Stores the columns to encode, hashing has no other state.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        Returns
+        -------
+        HashEncoder
+        """
+
+        self.columns_ = list(X.columns)
+
+        return self
+
+    def transform(self, X):
+        """
+        Hashes the categorical columns into a sparse matrix.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        Returns
+        -------
+        csr_matrix
+            Matrix of shape (n_rows, n_features)
+        """
+
+        n_rows = len(X)
+        indices = np.empty((n_rows, len(self.columns_)), dtype=np.int32)
+        data = np.empty((n_rows, len(self.columns_)), dtype=self.dtype)
+
+        for i, col in enumerate(self.columns_):
+            codes, uniques = pd.factorize(X[col], use_na_sentinel=False)
+            hashes = np.array(
+                [murmurhash3_32(f"{col}={value}", seed=0) for value in uniques],
+                dtype=np.int64,
+            )
+
+            indices[:, i] = (np.abs(hashes) % self.n_features)[codes]
+            data[:, i] = (
+                np.where(hashes >= 0, 1, -1)[codes] if self.alternate_sign else 1
+            )
+
+        matrix = sp.csr_matrix(
+            (
+                data.ravel(),
+                indices.ravel(),
+                np.arange(0, indices.size + 1, max(len(self.columns_), 1)),
+            ),
+            shape=(n_rows, self.n_features),
+        )
+        # Collisions within a row are summed
+        matrix.sum_duplicates()
+
+        return matrix
+
+    def fit_transform(self, X, y=None):
+
+        return self.fit(X).transform(X)
+
+    def get_feature_names_out(self):
+
+        return [f"{self.prefix}_{i}" for i in range(self.n_features)]
+
+
+class TargetEncoder(object):
+    """
+    Encodes categorical columns with the smoothed mean of the target per category.
+
+    The encoding of a category is (sum + smoothing * prior) / (count + smoothing), where prior is
+    the mean of the target. Unseen categories are encoded with the prior.
+
+    `fit_transform` encodes every row with statistics from the other folds only, so the training
+    encoding does not leak the row's own target. `transform` uses statistics from all the training data.
+
+    Parameters
+    ----------
+    smoothing : int or float, optional
+        Weight of the prior, higher values shrink rare categories towards it, by default 10
+
+    n_folds : int, optional
+        Number of folds for the out of fold training encoding, by default 5
+
+    random_state : int, optional
+        Seed of the fold assignment, by default 42
+    """
+
+    def __init__(self, smoothing=10, n_folds=5, random_state=42):
+
+        self.smoothing = smoothing
+        self.n_folds = n_folds
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        """
+        Computes the encoding of every category.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        y : Series or array like
+            Target
+
+        Returns
+        -------
+        TargetEncoder
+        """
+
+        y = self._check_target(y)
+
+        self.columns_ = list(X.columns)
+        self.prior_ = y.mean()
+        self.categories_ = []
+        self.encodings_ = []
+
+        for col in self.columns_:
+            codes, uniques = pd.factorize(X[col], use_na_sentinel=False)
+            sums = np.bincount(codes, weights=y, minlength=len(uniques))
+            counts = np.bincount(codes, minlength=len(uniques))
+
+            self.categories_.append(pd.Index(uniques))
+            self.encodings_.append(self._smooth(sums, counts, self.prior_))
+
+        return self
+
+    def transform(self, X):
+        """
+        Encodes the categorical columns.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        Returns
+        -------
+        ndarray
+            Encoded columns
+        """
+
+        encoded = np.empty((len(X), len(self.columns_)), dtype=np.float64)
+
+        for i, col in enumerate(self.columns_):
+            codes = self.categories_[i].get_indexer(X[col])
+            encodings = np.append(self.encodings_[i], self.prior_)
+            # Unseen categories (-1) index the appended prior
+            encoded[:, i] = encodings[codes]
+
+        return encoded
+
+    def fit_transform(self, X, y):
+        """
+        Fits the encoder on all the data and encodes every row out of fold.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        y : Series or array like
+            Target
+
+        Returns
+        -------
+        ndarray
+            Out of fold encoded columns
+        """
+
+        self.fit(X, y)
+
+        y = self._check_target(y)
+        folds = np.empty(len(y), dtype=np.int64)
+        kfold = KFold(
+            n_splits=self.n_folds, shuffle=True, random_state=self.random_state
+        )
+
+        for fold, (_, index) in enumerate(kfold.split(y)):
+            folds[index] = fold
+
+        fold_sums = np.bincount(folds, weights=y, minlength=self.n_folds)
+        fold_counts = np.bincount(folds, minlength=self.n_folds)
+        fold_priors = (y.sum() - fold_sums) / (len(y) - fold_counts)
+
+        encoded = np.empty((len(X), len(self.columns_)), dtype=np.float64)
+
+        for i, col in enumerate(self.columns_):
+            codes = self.categories_[i].get_indexer(X[col])
+            n_categories = len(self.categories_[i])
+
+            # Statistics per (fold, category) pair, the out of fold statistics are the totals minus the fold's own
+            pairs = folds * n_categories + codes
+            sums = np.bincount(
+                pairs, weights=y, minlength=self.n_folds * n_categories
+            ).reshape(self.n_folds, n_categories)
+            counts = np.bincount(pairs, minlength=self.n_folds * n_categories).reshape(
+                self.n_folds, n_categories
+            )
+
+            oof_sums = sums.sum(axis=0) - sums
+            oof_counts = counts.sum(axis=0) - counts
+
+            encoded[:, i] = self._smooth(
+                oof_sums[folds, codes], oof_counts[folds, codes], fold_priors[folds]
+            )
+
+        return encoded
+
+    def get_feature_names_out(self, suffix="_target_enc"):
+
+        return [col + suffix for col in self.columns_]
+
+    def _smooth(self, sums, counts, prior):
+
+        return (sums + self.smoothing * prior) / (counts + self.smoothing)
+
+    def _check_target(self, y):
+
+        y = pd.Series(y)
+
+        if pd.api.types.is_numeric_dtype(y):
+            return y.to_numpy(dtype=np.float64)
+
+        codes, uniques = pd.factorize(y, sort=True)
+
+        if len(uniques) != 2:
+            raise ValueError(
+                "Target encoding requires a numeric or binary target, encode the target first."
+            )
+
+        return codes.astype(np.float64)
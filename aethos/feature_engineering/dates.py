@@ -0,0 +1,250 @@
+from numbers import Integral
+
+import numpy as np
+import pandas as pd
+
+# Part name: (function of the .dt accessor, output dtype)
+DATETIME_PARTS = {
+    "year": (lambda dt: dt.year, np.int16),
+    "quarter": (lambda dt: dt.quarter, np.int8),
+    "month": (lambda dt: dt.month, np.int8),
+    "day": (lambda dt: dt.day, np.int8),
+    "dayofyear": (lambda dt: dt.dayofyear, np.int16),
+    "weekofyear": (lambda dt: dt.isocalendar().week, np.int8),
+    "dayofweek": (lambda dt: dt.dayofweek, np.int8),
+    "hour": (lambda dt: dt.hour, np.int8),
+    "minute": (lambda dt: dt.minute, np.int8),
+    "second": (lambda dt: dt.second, np.int8),
+    "is_weekend": (lambda dt: dt.dayofweek >= 5, np.int8),
+    "is_month_start": (lambda dt: dt.is_month_start, np.int8),
+    "is_month_end": (lambda dt: dt.is_month_end, np.int8),
+}
+
+# Part name: (function of the .dt accessor returning the 0 based position in the cycle, cycle length)
+CYCLIC_PARTS = {
+    "month": (lambda dt: dt.month - 1, 12),
+    "day": (lambda dt: dt.day - 1, lambda dt: dt.days_in_month),
+    "dayofyear": (
+        lambda dt: dt.dayofyear - 1,
+        lambda dt: 365 + dt.is_leap_year.astype(np.int64),
+    ),
+    "dayofweek": (lambda dt: dt.dayofweek, 7),
+    "hour": (lambda dt: dt.hour, 24),
+    "minute": (lambda dt: dt.minute, 60),
+}
+
+NULLABLE_DTYPES = {np.int8: "Int8", np.int16: "Int16"}
+
+DEFAULT_PARTS = ["year", "month", "day", "dayofweek", "hour", "is_weekend"]
+
+ROLLING_AGGS = ["mean", "sum", "std"]
+
+
+def datetime_parts(series, parts=DEFAULT_PARTS):
+    """
+    Extracts calendar parts of a datetime column with the vectorized .dt accessors.
+
+    Integer parts are stored in the smallest dtype that fits them (int8 or int16),
+    or the nullable Int8/Int16 dtype if the column has missing dates.
+    `<part>_cyclic` parts are encoded as float32 `<part>_sin` and `<part>_cos` columns,
+    so that the end of a cycle is next to its start, e.g. December and January.
+
+    Parameters
+    ----------
+    series : Series
+        Datetime column, other columns are converted with `pd.to_datetime`
+
+    parts : list, optional
+        Parts to extract, by default year, month, day, dayofweek, hour and is_weekend
+
+    Returns
+    -------
+    Dataframe
+        One column per part, `<column>_<part>`
+    """
+
+    _check_parts(parts)
+
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series)
+
+    dt = series.dt
+    missing = series.isna().to_numpy()
+    columns = {}
+
+    for part in parts:
+        name = f"{series.name}_{part}"
+
+        if part in DATETIME_PARTS:
+            func, dtype = DATETIME_PARTS[part]
+            values = pd.Series(func(dt))
+
+            if not missing.any():
+                columns[name] = values.to_numpy(dtype=dtype)
+            else:
+                values = values.astype(np.float64).to_numpy()
+                values[missing] = np.nan
+                columns[name] = pd.array(values, dtype=NULLABLE_DTYPES[dtype])
+        else:
+            cycle_part = part[: -len("_cyclic")]
+            cycle_name = f"{series.name}_{cycle_part}"
+            func, period = CYCLIC_PARTS[cycle_part]
+            period = period(dt) if callable(period) else period
+            angle = (
+                2
+                * np.pi
+                * np.asarray(func(dt), dtype=np.float64)
+                / np.asarray(period, dtype=np.float64)
+            )
+
+            columns[cycle_name + "_sin"] = np.sin(angle).astype(np.float32)
+            columns[cycle_name + "_cos"] = np.cos(angle).astype(np.float32)
+
+    return pd.DataFrame(columns, index=series.index)
+
+
+def lag_rolling_features(
+    df,
+    list_of_cols,
+    time_col=None,
+    entity_col=None,
+    lags=[1],
+    windows=[],
+    aggs=["mean"],
+):
+    """
+    Lags and rolling statistics of columns per entity, ordered by time.
+
+    Rows are sorted once by entity and time, lags are shifts of the sorted values and rolling
+    statistics are differences of cumulative sums, both cut at the boundaries of the entity groups.
+    The cumulative sums are taken over the values minus the mean of their group, so that large
+    offsets do not cancel out the precision of the statistics.
+
+    Rolling statistics include the current row and skip missing values, like pandas
+    `rolling(window, min_periods=1)`, the standard deviation is the sample standard deviation.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Data
+
+    list_of_cols : list
+        Numeric columns
+
+    time_col : str, optional
+        Column to order the rows of an entity by, by default the row order
+
+    entity_col : str, optional
+        Column identifying the entities, by default all the rows are one entity
+
+    lags : list, optional
+        Lags in number of rows, by default [1]
+
+    windows : list, optional
+        Rolling window lengths in number of rows, by default []
+
+    aggs : list, optional
+        Rolling statistics, any of 'mean', 'sum', 'std', by default ['mean']
+
+    Returns
+    -------
+    Dataframe
+        `<column>_lag_<lag>` and `<column>_rolling_<agg>_<window>` columns
+    """
+
+    if any(agg not in ROLLING_AGGS for agg in aggs):
+        raise ValueError(f"Invalid rolling statistic, choose from {ROLLING_AGGS}.")
+
+    if any(not isinstance(k, Integral) or k < 1 for k in list(lags) + list(windows)):
+        raise ValueError("Lags and windows must be positive integers.")
+
+    n = len(df)
+    entities = (
+        pd.factorize(df[entity_col])[0]
+        if entity_col is not None
+        else np.zeros(n, dtype=np.int64)
+    )
+    order = (
+        np.lexsort((df[time_col].to_numpy(), entities))
+        if time_col is not None
+        else np.argsort(entities, kind="stable")
+    )
+
+    # Position of every sorted row in its entity group
+    sorted_entities = entities[order]
+    starts = np.flatnonzero(np.r_[True, sorted_entities[1:] != sorted_entities[:-1]])
+    group_sizes = np.diff(np.r_[starts, n])
+    group = np.repeat(np.arange(len(starts)), group_sizes)
+    group_start = starts[group]
+    position = np.arange(n) - group_start
+
+    columns = {}
+
+    for col in list_of_cols:
+        values = df[col].to_numpy(dtype=np.float64)[order]
+
+        for lag in lags:
+            lagged = np.full(n, np.nan)
+            lagged[lag:] = values[: n - lag]
+            lagged[position < lag] = np.nan
+
+            columns[f"{col}_lag_{lag}"] = _unsort(lagged, order)
+
+        if not windows:
+            continue
+
+        observed = ~np.isnan(values)
+        filled = np.where(observed, values, 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            group_mean = np.bincount(group, weights=filled) / np.bincount(
+                group, weights=observed
+            )
+
+        offset = np.nan_to_num(group_mean)[group]
+        filled = np.where(observed, values - offset, 0)
+        sums = np.r_[0, np.cumsum(filled)]
+        counts = np.r_[0, np.cumsum(observed)]
+        squares = np.r_[0, np.cumsum(filled ** 2)] if "std" in aggs else None
+
+        for window in windows:
+            # Window of every row, cut at the start of its group
+            lo = np.maximum(np.arange(n) - window + 1, group_start)
+            hi = np.arange(1, n + 1)
+            total = sums[hi] - sums[lo]
+            count = counts[hi] - counts[lo]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                for agg in aggs:
+                    if agg == "sum":
+                        result = np.where(count > 0, total + count * offset, np.nan)
+                    elif agg == "mean":
+                        result = np.where(count > 0, total / count + offset, np.nan)
+                    else:
+                        var = (squares[hi] - squares[lo] - total ** 2 / count) / (
+                            count - 1
+                        )
+                        result = np.where(
+                            count > 1, np.sqrt(np.maximum(var, 0)), np.nan
+                        )
+
+                    columns[f"{col}_rolling_{agg}_{window}"] = _unsort(result, order)
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _unsort(values, order):
+    """Puts values computed on the sorted rows back in the original row order."""
+
+    out = np.empty_like(values)
+    out[order] = values
+
+    return out
+
+
+def _check_parts(parts):
+
+    valid = list(DATETIME_PARTS) + [f"{part}_cyclic" for part in CYCLIC_PARTS]
+
+    if any(part not in valid for part in parts):
+        raise ValueError(f"Invalid datetime part, choose from {valid}.")
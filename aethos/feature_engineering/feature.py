@@ -1,21 +1,38 @@
 import pandas as pd
 import numpy as np
-import spacy
+import scipy.sparse as sp
 
 from sklearn.feature_extraction.text import (
     CountVectorizer,
     HashingVectorizer,
     TfidfVectorizer,
 )
-from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
-from sklearn.feature_selection import SelectKBest, chi2
-from sklearn.preprocessing import PolynomialFeatures
+from sklearn.preprocessing import OneHotEncoder, PolynomialFeatures
 
 from aethos.feature_engineering import text
+from aethos.feature_engineering.apply import STRATEGIES, apply_rows
+from aethos.feature_engineering.cache import cache_feature
+from aethos.feature_engineering.binning import Binner
+from aethos.feature_engineering.categorical import HashEncoder, TargetEncoder
+from aethos.feature_engineering.dates import (
+    DEFAULT_PARTS,
+    datetime_parts,
+    lag_rolling_features,
+)
+from aethos.feature_engineering.parallel import (
+    column_bytes,
+    concat_columns,
+    map_columns,
+)
+from aethos.feature_engineering.selection import FeatureSelector
 from aethos.feature_engineering import util
+from aethos.stats.correlation import correlation_engine
 from aethos.util import (
+    CategoryEncoder,
     _input_columns,
     _get_columns,
+    _model_input,
+    _to_frame,
     drop_replace_columns,
     _numeric_input_conditions,
 )
@@ -23,11 +40,22 @@ from aethos.util import (
 
 class Feature(object):
     def onehot_encode(
-        self, *list_args, list_of_cols=[], keep_col=True, **onehot_kwargs
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        sparse=False,
+        min_frequency=None,
+        max_categories=None,
+        dtype=np.float64,
+        **onehot_kwargs
     ):
         """
         Creates a matrix of converted categorical columns into binary columns of ones and zeros.
 
+        Rare levels of high cardinality columns can be grouped into a single infrequent column per feature
+        with `min_frequency` and `max_categories`, unseen levels in the test set are then assigned to it.
+
         For more info see: https://scikit-learn.org/stable/modules/generated/sklearn.preprocessing.OneHotEncoder.html
 
         If a list of columns is provided use the list, otherwise use arguments.
@@ -44,6 +72,19 @@ class Feature(object):
             A parameter to specify whether to drop the column being transformed, by default
             keep the column, True
 
+        sparse : bool, optional
+            True to store the output as Sparse columns instead of densifying it, by default False
+            Sparse columns are passed to models as a sparse matrix.
+
+        min_frequency : int or float, optional
+            Levels with a count (int) or a proportion of rows (float) below this are grouped into an infrequent column, by default None
+
+        max_categories : int, optional
+            Upper limit of output columns per feature, including the infrequent column, by default None
+
+        dtype : number type, optional
+            Desired dtype of output, np.uint8 for the smallest footprint, by default np.float64
+
         categories : 'auto' or a list of array-like, default='auto'
             Categories (unique values) per feature:
 
@@ -62,16 +103,11 @@ class Feature(object):
 
                 array : drop[i] is the category in feature X[:, i] that should be dropped.
 
-        sparsebool : default=True
-            Will return sparse matrix if set True else will return an array.
-
-        dtype : number type, default=np.float
-            Desired dtype of output.
-
-        handle_unknown: {'error', 'ignore'}, default='ignore'
+        handle_unknown: {'error', 'ignore', 'infrequent_if_exist'}, default='ignore'
             Whether to raise an error or ignore if an unknown categorical feature is present during transform (default is to raise).
             When this parameter is set to 'ignore' and an unknown category is encountered during transform, the resulting one-hot encoded columns for this feature will be all zeros.
             In the inverse transform, an unknown category will be denoted as None.
+            Defaults to 'infrequent_if_exist' when `min_frequency` or `max_categories` is set.
 
         Returns
         -------
@@ -82,32 +118,500 @@ class Feature(object):
         --------
         >>> data.onehot_encode('col1', 'col2', 'col3')
         >>> data.onehot_encode('col1', 'col2', 'col3', drop='first')
+        >>> data.onehot_encode('merchant_id', sparse=True, min_frequency=10, dtype=np.uint8)
+        >>> data.fitted_transformers['onehot_encode'].infrequent_categories_
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        enc = OneHotEncoder(handle_unknown="ignore", **onehot_kwargs)
+        if min_frequency is not None or max_categories is not None:
+            onehot_kwargs.setdefault("handle_unknown", "infrequent_if_exist")
+        else:
+            onehot_kwargs.setdefault("handle_unknown", "ignore")
+
+        # The encoder always outputs a sparse matrix, it is only densified by _to_frame
+        enc = OneHotEncoder(
+            min_frequency=min_frequency,
+            max_categories=max_categories,
+            dtype=dtype,
+            **onehot_kwargs,
+        )
+        list_of_cols = _get_columns(list_of_cols, self.x_train)
+
+        enc_data = enc.fit_transform(self.x_train[list_of_cols])
+        enc_df = _to_frame(
+            enc_data,
+            columns=enc.get_feature_names_out(list_of_cols),
+            index=self.x_train.index,
+            sparse=sparse,
+        )
+        self.x_train = drop_replace_columns(
+            self.x_train, list_of_cols, enc_df, keep_col
+        )
+
+        if self.x_test is not None:
+            enc_test = enc.transform(self.x_test[list_of_cols])
+            enc_test_df = _to_frame(
+                enc_test,
+                columns=enc.get_feature_names_out(list_of_cols),
+                index=self.x_test.index,
+                sparse=sparse,
+            )
+            self.x_test = drop_replace_columns(
+                self.x_test, list_of_cols, enc_test_df, keep_col
+            )
+
+        self.fitted_transformers["onehot_encode"] = enc
+
+        return self
+
+    def hash_encode(
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        n_features=1024,
+        alternate_sign=True,
+        sparse=True,
+        dtype=np.float64,
+        prefix="hash",
+    ):
+        """
+        Hashes categorical columns into a fixed number of columns with the hashing trick.
+
+        All the columns are hashed together into one block, so its width does not depend on the number of categories.
+
+        The hasher is stored in `fitted_transformers['hash_encode']`.
+
+        This function exists in `feature-extraction/categorical.py`
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        keep_col : bool, optional
+            True if you want to keep the column(s) or False if you want to drop the column(s), by default True
+
+        n_features : int, optional
+            Number of output columns, by default 1024
+
+        alternate_sign : bool, optional
+            Use the sign of the hash as the value to reduce the effect of collisions, by default True
+
+        sparse : bool, optional
+            True to store the output as Sparse columns instead of densifying it, by default True
+            Sparse columns are passed to models as a sparse matrix.
+
+        dtype : number type, optional
+            Desired dtype of output, by default np.float64
+
+        prefix : str, optional
+            Prefix of the output column names, by default 'hash'
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.hash_encode('col1', 'col2', n_features=256)
+        >>> data.hash_encode('merchant_id', alternate_sign=False, dtype=np.float32)
+        """
+
+        # If a list of columns is provided use the list, otherwise use arguemnts.
+        list_of_cols = _input_columns(list_args, list_of_cols)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        enc_data = enc.fit_transform(self.x_train[list_of_cols]).toarray()
-        enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names_out(list_of_cols))
+        enc = HashEncoder(
+            n_features=n_features,
+            alternate_sign=alternate_sign,
+            dtype=dtype,
+            prefix=prefix,
+        )
+
+        enc_data = enc.fit_transform(self.x_train[list_of_cols])
+        enc_df = _to_frame(
+            enc_data,
+            columns=enc.get_feature_names_out(),
+            index=self.x_train.index,
+            sparse=sparse,
+        )
+        self.x_train = drop_replace_columns(
+            self.x_train, list_of_cols, enc_df, keep_col
+        )
+
+        if self.x_test is not None:
+            enc_test = enc.transform(self.x_test[list_of_cols])
+            enc_test_df = _to_frame(
+                enc_test,
+                columns=enc.get_feature_names_out(),
+                index=self.x_test.index,
+                sparse=sparse,
+            )
+            self.x_test = drop_replace_columns(
+                self.x_test, list_of_cols, enc_test_df, keep_col
+            )
+
+        self.fitted_transformers["hash_encode"] = enc
+
+        return self
+
+    def target_encode(
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        smoothing=10,
+        n_folds=5,
+        random_state=42,
+        new_col_name="_target_enc",
+    ):
+        """
+        Encodes categorical columns with the smoothed mean of the target per category.
+
+        The encoding of a category is (sum + smoothing * prior) / (count + smoothing), where prior is the mean of the target.
+        The training data is encoded out of fold, every row only sees the target of the other folds.
+        The test data is encoded with the statistics of all the training data, unseen categories are encoded with the prior.
+
+        The target must be numeric or binary.
+
+        The encoder is stored in `fitted_transformers['target_encode']`.
+
+        This function exists in `feature-extraction/categorical.py`
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        keep_col : bool, optional
+            True if you want to keep the column(s) or False if you want to drop the column(s), by default True
+
+        smoothing : int or float, optional
+            Weight of the prior, higher values shrink rare categories towards it, by default 10
+
+        n_folds : int, optional
+            Number of folds for the out of fold training encoding, by default 5
+
+        random_state : int, optional
+            Seed of the fold assignment, by default 42
+
+        new_col_name : str, optional
+            New column name suffix, by default `COLUMN_target_enc`
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.target_encode('col1', 'col2')
+        >>> data.target_encode('merchant_id', smoothing=50, keep_col=False)
+        """
+
+        # If a list of columns is provided use the list, otherwise use arguemnts.
+        list_of_cols = _input_columns(list_args, list_of_cols)
+        list_of_cols = _get_columns(list_of_cols, self.x_train)
+
+        enc = TargetEncoder(
+            smoothing=smoothing, n_folds=n_folds, random_state=random_state
+        )
+        enc_columns = [col + new_col_name for col in list_of_cols]
+
+        enc_df = pd.DataFrame(
+            enc.fit_transform(self.x_train[list_of_cols], self.y_train),
+            columns=enc_columns,
+            index=self.x_train.index,
+        )
         self.x_train = drop_replace_columns(
             self.x_train, list_of_cols, enc_df, keep_col
         )
 
         if self.x_test is not None:
-            enc_test = enc.transform(self.x_test[list_of_cols]).toarray()
             enc_test_df = pd.DataFrame(
-                enc_test, columns=enc.get_feature_names_out(list_of_cols)
+                enc.transform(self.x_test[list_of_cols]),
+                columns=enc_columns,
+                index=self.x_test.index,
             )
             self.x_test = drop_replace_columns(
                 self.x_test, list_of_cols, enc_test_df, keep_col
             )
 
+        self.fitted_transformers["target_encode"] = enc
+
         return self
 
-    def tfidf(self, *list_args, list_of_cols=[], keep_col=True, **tfidf_kwargs):
+    def datetime_features(
+        self, *list_args, list_of_cols=[], parts=DEFAULT_PARTS, keep_col=True
+    ):
+        """
+        Extracts calendar features from datetime columns with vectorized datetime accessors.
+
+        Available parts are year, quarter, month, day, dayofyear, weekofyear, dayofweek, hour, minute, second,
+        is_weekend, is_month_start and is_month_end.
+
+        Parts are stored as int8 (int16 for year and dayofyear), columns with missing dates use the nullable Int8/Int16 dtypes.
+
+        Cyclic encodings of month, day, dayofyear, dayofweek, hour and minute are added with the `<part>_cyclic` parts,
+        as float32 `COLUMN_<part>_sin` and `COLUMN_<part>_cos` columns.
+
+        Columns that are not datetimes are converted with `pd.to_datetime`.
+
+        This function exists in `feature-extraction/dates.py`
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        parts : list, optional
+            Parts to extract, by default ['year', 'month', 'day', 'dayofweek', 'hour', 'is_weekend']
+
+        keep_col : bool, optional
+            True if you want to keep the column(s) or False if you want to drop the column(s), by default True
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.datetime_features('signup_date')
+        >>> data.datetime_features('timestamp', parts=['hour', 'dayofweek', 'hour_cyclic'], keep_col=False)
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+
+        for col in list_of_cols:
+            self.x_train = drop_replace_columns(
+                self.x_train, col, datetime_parts(self.x_train[col], parts), keep_col
+            )
+
+            if self.x_test is not None:
+                self.x_test = drop_replace_columns(
+                    self.x_test, col, datetime_parts(self.x_test[col], parts), keep_col
+                )
+
+        return self
+
+    def bin(
+        self,
+        *list_args,
+        list_of_cols=[],
+        strategy="quantile",
+        n_bins=10,
+        keep_col=True,
+        n_jobs=1,
+        chunksize=None,
+        new_col_name="_bin",
+    ):
+        """
+        Creates binned versions of numeric columns.
+
+        Strategies:
+
+        - quantile: Equal frequency bins, edges are estimated in one pass with mergeable quantile sketches
+        - uniform: Equal width bins between the minimum and maximum
+        - tree: Edges are the split thresholds of a decision tree with `n_bins` leaves fit on the target
+
+        Bin codes are uint8 (uint16 above 255 bins), missing values are given their own code, `n_bins`.
+        The edges are computed on the training data and stored in `fitted_transformers['bin']`,
+        the testing data and new data is binned with the same edges.
+
+        If no columns are provided, all the numeric columns are binned.
+
+        This function exists in `feature-extraction/binning.py`
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        strategy : str {'quantile', 'uniform', 'tree'}, optional
+            Binning strategy, by default 'quantile'
+
+        n_bins : int, optional
+            Maximum number of bins, skewed columns may have fewer, by default 10
+
+        keep_col : bool, optional
+            True if you want to keep the column(s) or False if you want to drop the column(s), by default True
+
+        n_jobs : int, optional
+            Number of threads processing columns, -1 uses every CPU, by default 1
+
+        chunksize : int, optional
+            Number of rows the quantile and uniform edges are updated with at a time, by default all rows at once
+
+        new_col_name : str, optional
+            New column name suffix, by default `COLUMN_bin`
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.bin('age', 'income')
+        >>> data.bin('income', strategy='tree', n_bins=8, keep_col=False)
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+        list_of_cols = _numeric_input_conditions(list_of_cols, self.train_data)
+
+        binner = Binner(strategy=strategy, n_bins=n_bins, n_jobs=n_jobs)
+        binner.fit(
+            self.x_train[list_of_cols],
+            self.y_train if strategy == "tree" else None,
+            chunksize=chunksize,
+        )
+        bin_columns = [col + new_col_name for col in list_of_cols]
+
+        self.x_train = drop_replace_columns(
+            self.x_train,
+            list_of_cols,
+            pd.DataFrame(
+                binner.transform(self.x_train[list_of_cols]),
+                columns=bin_columns,
+                index=self.x_train.index,
+            ),
+            keep_col,
+        )
+
+        if self.x_test is not None:
+            self.x_test = drop_replace_columns(
+                self.x_test,
+                list_of_cols,
+                pd.DataFrame(
+                    binner.transform(self.x_test[list_of_cols]),
+                    columns=bin_columns,
+                    index=self.x_test.index,
+                ),
+                keep_col,
+            )
+
+        self.fitted_transformers["bin"] = binner
+
+        return self
+
+    def lag_features(
+        self,
+        *list_args,
+        list_of_cols=[],
+        time_col=None,
+        entity_col=None,
+        lags=[1],
+        windows=[],
+        aggs=["mean"],
+    ):
+        """
+        Adds lags and rolling statistics of numeric columns per entity (e.g. per customer), ordered by time.
+
+        Rows are sorted once by entity and time, lags and rolling statistics are computed over the sorted
+        values and cut at the boundaries of the entities.
+
+        Rolling statistics include the current row and skip missing values, like pandas `rolling(window, min_periods=1)`.
+
+        The training and testing data are processed separately.
+
+        This function exists in `feature-extraction/dates.py`
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        time_col : str, optional
+            Column to order the rows of an entity by, by default the order of the rows
+
+        entity_col : str, optional
+            Column identifying the entities, by default all the rows are one entity
+
+        lags : list, optional
+            Lags in number of rows, by default [1]
+
+        windows : list, optional
+            Rolling window lengths in number of rows, by default []
+
+        aggs : list, optional
+            Rolling statistics, any of 'mean', 'sum', 'std', by default ['mean']
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.lag_features('sales', time_col='date', entity_col='store', lags=[1, 7])
+        >>> data.lag_features('sales', time_col='date', entity_col='store', lags=[], windows=[7, 28], aggs=['mean', 'std'])
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+
+        def add_features(df):
+
+            features = lag_rolling_features(
+                df,
+                list_of_cols,
+                time_col=time_col,
+                entity_col=entity_col,
+                lags=lags,
+                windows=windows,
+                aggs=aggs,
+            )
+
+            # Features computed again replace the previous ones
+            return pd.concat(
+                [df.drop(columns=features.columns, errors="ignore"), features], axis=1
+            )
+
+        self.x_train = add_features(self.x_train)
+
+        if self.x_test is not None:
+            self.x_test = add_features(self.x_test)
+
+        return self
+
+    @cache_feature
+    def tfidf(
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        sparse=False,
+        n_jobs=None,
+        shared_vocabulary=False,
+        **tfidf_kwargs,
+    ):
         """
         Creates a matrix of the tf-idf score for every word in the corpus as it pertains to each document.
 
@@ -116,6 +620,8 @@ class Feature(object):
 
         For more information see: https://scikit-learn.org/stable/modules/generated/sklearn.feature_extraction.text.TfidfVectorizer.html
 
+        All the columns are stacked into one block, with more than one column the new columns are prefixed with the column name.
+
         If a list of columns is provided use the list, otherwise use arguments.
         
         Parameters
@@ -129,6 +635,16 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the output as Sparse columns instead of densifying it, by default False
+            Sparse columns are passed to models as a sparse matrix.
+
+        n_jobs : int, optional
+            Number of processes to fit the columns with, -1 uses every CPU, by default the `n_jobs` option
+
+        shared_vocabulary : bool, optional
+            True to fit one vocabulary on the text of all the columns, by default False
+
         encoding: str, default='utf-8'
             If bytes or files are given to analyze, this encoding is used to decode.
 
@@ -231,29 +747,53 @@ class Feature(object):
         --------
         >>> data.tfidf('col1', 'col2', 'col3')
         >>> data.tfidf('col1', 'col2', 'col3', lowercase=False, smoothidf=False)
+        >>> data.tfidf('col1', sparse=True)
+        >>> data.tfidf('title', 'body', n_jobs=2, sparse=True)
+        >>> data.tfidf('question', 'answer', shared_vocabulary=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
         list_of_cols = _input_columns(list_args, list_of_cols)
-
-        enc = TfidfVectorizer(**tfidf_kwargs)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names_out())
-            self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
+        enc_data, enc_test, columns, vectorizers = text.vectorize_text(
+            TfidfVectorizer(**tfidf_kwargs),
+            self.x_train,
+            self.x_test,
+            list_of_cols,
+            n_jobs=n_jobs,
+            shared_vocabulary=shared_vocabulary,
+        )
 
-            if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test, columns=enc.get_feature_names_out())
-                self.x_test = drop_replace_columns(
-                    self.x_test, col, enc_test_df, keep_col
-                )
+        enc_df = _to_frame(
+            enc_data, columns=columns, index=self.x_train.index, sparse=sparse
+        )
+        self.x_train = drop_replace_columns(
+            self.x_train, list_of_cols, enc_df, keep_col
+        )
+
+        if self.x_test is not None:
+            enc_test_df = _to_frame(
+                enc_test, columns=columns, index=self.x_test.index, sparse=sparse
+            )
+            self.x_test = drop_replace_columns(
+                self.x_test, list_of_cols, enc_test_df, keep_col
+            )
+
+        self.fitted_transformers["tfidf"] = vectorizers
 
         return self
 
-    def bag_of_words(self, *list_args, list_of_cols=[], keep_col=True, **bow_kwargs):
+    def bag_of_words(
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        sparse=False,
+        n_jobs=None,
+        shared_vocabulary=False,
+        **bow_kwargs,
+    ):
         """
         Creates a matrix of how many times a word appears in a document.
 
@@ -261,6 +801,8 @@ class Feature(object):
 
         For more information see: https://scikit-learn.org/stable/modules/generated/sklearn.feature_extraction.text.CountVectorizer.html
 
+        All the columns are stacked into one block, with more than one column the new columns are prefixed with the column name.
+
         If a list of columns is provided use the list, otherwise use arguments.
         
         Parameters
@@ -274,6 +816,16 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the output as Sparse columns instead of densifying it, by default False
+            Sparse columns are passed to models as a sparse matrix.
+
+        n_jobs : int, optional
+            Number of processes to fit the columns with, -1 uses every CPU, by default the `n_jobs` option
+
+        shared_vocabulary : bool, optional
+            True to fit one vocabulary on the text of all the columns, by default False
+
         encoding: str, default='utf-8'
             If bytes or files are given to analyze, this encoding is used to decode.
 
@@ -359,29 +911,55 @@ class Feature(object):
         --------
         >>> data.bag_of_words('col1', 'col2', 'col3')
         >>> data.bag_of_words('col1', 'col2', 'col3', binary=True)
+        >>> data.bag_of_words('col1', sparse=True)
+        >>> data.bag_of_words('title', 'body', n_jobs=2, sparse=True)
+        >>> data.bag_of_words('question', 'answer', shared_vocabulary=True)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
         list_of_cols = _input_columns(list_args, list_of_cols)
-
-        enc = CountVectorizer(**bow_kwargs)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data, columns=enc.get_feature_names_out())
-            self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
+        enc_data, enc_test, columns, vectorizers = text.vectorize_text(
+            CountVectorizer(**bow_kwargs),
+            self.x_train,
+            self.x_test,
+            list_of_cols,
+            n_jobs=n_jobs,
+            shared_vocabulary=shared_vocabulary,
+        )
 
-            if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test, columns=enc.get_feature_names_out())
-                self.x_test = drop_replace_columns(
-                    self.x_test, col, enc_test_df, keep_col
-                )
+        enc_df = _to_frame(
+            enc_data, columns=columns, index=self.x_train.index, sparse=sparse
+        )
+        self.x_train = drop_replace_columns(
+            self.x_train, list_of_cols, enc_df, keep_col
+        )
+
+        if self.x_test is not None:
+            enc_test_df = _to_frame(
+                enc_test, columns=columns, index=self.x_test.index, sparse=sparse
+            )
+            self.x_test = drop_replace_columns(
+                self.x_test, list_of_cols, enc_test_df, keep_col
+            )
+
+        self.fitted_transformers["bag_of_words"] = vectorizers
 
         return self
 
-    def text_hash(self, *list_args, list_of_cols=[], keep_col=True, **hash_kwargs):
+    def text_hash(
+        self,
+        *list_args,
+        list_of_cols=[],
+        keep_col=True,
+        sparse=False,
+        n_jobs=None,
+        chunksize=10000,
+        output_dir=None,
+        estimator=None,
+        **hash_kwargs
+    ):
         """
         Creates a matrix of how many times a word appears in a document. It can possibly normalized as token frequencies if norm='l1' or projected on the euclidean unit sphere if norm='l2'.
 
@@ -397,6 +975,12 @@ class Feature(object):
 
         For more info please see: https://scikit-learn.org/stable/modules/generated/sklearn.feature_extraction.text.HashingVectorizer.html
 
+        Streaming: when `output_dir` or `estimator` is provided, the columns are hashed `chunksize` rows at a time
+        and the sparse blocks are written to `output_dir` as .npz files (`train_COLUMN_00000.npz`, `test_COLUMN_00000.npz`, ...)
+        and/or passed to `estimator.partial_fit` with the target, instead of being added to the data.
+        The paths of the blocks and the estimator are stored in `fitted_transformers['text_hash']`.
+        To stream data that does not fit in memory, e.g. a Parquet file, use `text.stream_text_hash` directly.
+
         If a list of columns is provided use the list, otherwise use arguments.
         
         Parameters
@@ -410,6 +994,22 @@ class Feature(object):
         keep_col : bool, optional
             True if you want to keep the column(s) or False if you want to drop the column(s)
 
+        sparse : bool, optional
+            True to store the output as Sparse columns instead of densifying it, by default False
+            Sparse columns are passed to models as a sparse matrix.
+
+        n_jobs : int, optional
+            Number of processes to hash the columns with, -1 uses every CPU, by default the `n_jobs` option
+
+        chunksize : int, optional
+            Number of rows hashed at a time when streaming, by default 10000
+
+        output_dir : str, optional
+            Directory to write the hashed blocks to instead of adding them to the data, by default None
+
+        estimator : estimator with a partial_fit method, optional
+            Model to train on the hashed training blocks instead of adding them to the data, by default None
+
         n_features : integer, default=(2 ** 20)
             The number of features (columns) in the output matrices.
             Small numbers of features are likely to cause hash collisions, but large numbers will cause larger coefficient dimensions in linear learners.
@@ -426,6 +1026,9 @@ class Feature(object):
         --------
         >>> data.text_hash('col1', 'col2', 'col3')
         >>> data.text_hash('col1', 'col2', 'col3', n_features=50)
+        >>> data.text_hash('col1', sparse=True)
+        >>> data.text_hash('col1', output_dir='hashed', chunksize=100000)
+        >>> data.text_hash('col1', estimator=SGDClassifier(), n_features=2 ** 18)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
@@ -434,27 +1037,233 @@ class Feature(object):
         enc = HashingVectorizer(**hash_kwargs)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
+        if output_dir is not None or estimator is not None:
+            return self._stream_text_hash(
+                list_of_cols, chunksize, output_dir, estimator, **hash_kwargs
+            )
+
+        # Hashing is stateless, so every column is hashed independently
+        jobs = [
+            (
+                enc,
+                self.x_train[col],
+                self.x_test[col] if self.x_test is not None else None,
+                True,
+            )
+            for col in list_of_cols
+        ]
+        results = map_columns(
+            text._vectorize_column,
+            jobs,
+            backend="processes",
+            n_jobs=n_jobs,
+            job_bytes=max(
+                (column_bytes(train, test) for _, train, test, _ in jobs), default=0
+            ),
+        )
+
+        self.x_train = concat_columns(
+            self.x_train,
+            list_of_cols,
+            [
+                _to_frame(train, index=self.x_train.index, sparse=sparse)
+                for _, train, _ in results
+            ],
+            keep_col,
+        )
+
+        if self.x_test is not None:
+            self.x_test = concat_columns(
+                self.x_test,
+                list_of_cols,
+                [
+                    _to_frame(test, index=self.x_test.index, sparse=sparse)
+                    for _, _, test in results
+                ],
+                keep_col,
+            )
+
+        return self
+
+    def embed_text(
+        self,
+        *list_args,
+        vectors_path: str,
+        list_of_cols=[],
+        pooling="mean",
+        lowercase=False,
+        chunksize=10000,
+        keep_col=True,
+        new_col_name="_emb",
+    ):
+        """
+        Creates dense document vectors by pooling pre-trained word vectors of the tokens of each document.
+
+        Word vectors are read from a local file, saved gensim KeyedVectors (`KeyedVectors.save`) are memory mapped
+        so only the vectors of the tokens in the data are read from disk. Word2vec format files (.txt, .vec, .bin, .gz) are loaded in memory.
+        Requires gensim, install it with `pip install aethos[embeddings]`.
+
+        Pooling:
+
+        - mean: Average of the vectors of the tokens of a document
+        - tfidf: Average of the vectors of the tokens weighted by their TF-IDF, the IDF is computed on the training data
+
+        Tokens without a vector are ignored. Vectors are pooled with a sparse document-token matrix product in float32 chunks.
+
+        The IDF per column is stored in `fitted_transformers['embed_text']` when pooling by TF-IDF.
+
+        This function exists in `feature-extraction/text.py`
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        vectors_path : str
+            Path of the word vectors
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        pooling : str {'mean', 'tfidf'}, optional
+            Pooling of the word vectors, by default 'mean'
+
+        lowercase : bool, optional
+            True to lowercase the text before looking up the word vectors, e.g. for GloVe vectors, by default False
+
+        chunksize : int, optional
+            Number of documents pooled at a time, by default 10000
+
+        keep_col : bool, optional
+            True if you want to keep the column(s) or False if you want to drop the column(s), by default True
+
+        new_col_name : str, optional
+            New column name suffix, by default `COLUMN_emb_0`, `COLUMN_emb_1`, ...
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.embed_text('review', vectors_path='word2vec.kv')
+        >>> data.embed_text('review', vectors_path='glove.6B.100d.txt', pooling='tfidf', lowercase=True, keep_col=False)
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+        list_of_cols = _get_columns(list_of_cols, self.x_train)
+        idfs = {}
+
         for col in list_of_cols:
-            enc_data = enc.fit_transform(self.x_train[col]).toarray()
-            enc_df = pd.DataFrame(enc_data)
-            self.x_train = drop_replace_columns(self.x_train, col, enc_df, keep_col)
+            train_vectors, idfs[col] = text.embed_documents(
+                self.x_train[col],
+                vectors_path,
+                pooling=pooling,
+                lowercase=lowercase,
+                chunksize=chunksize,
+            )
+            columns = [
+                f"{col}{new_col_name}_{i}" for i in range(train_vectors.shape[1])
+            ]
+
+            self.x_train = drop_replace_columns(
+                self.x_train,
+                col,
+                pd.DataFrame(train_vectors, columns=columns, index=self.x_train.index),
+                keep_col,
+            )
 
             if self.x_test is not None:
-                enc_test = enc.transform(self.x_test[col]).toarray()
-                enc_test_df = pd.DataFrame(enc_test)
+                test_vectors, _ = text.embed_documents(
+                    self.x_test[col],
+                    vectors_path,
+                    pooling=pooling,
+                    idf=idfs[col],
+                    lowercase=lowercase,
+                    chunksize=chunksize,
+                )
+
                 self.x_test = drop_replace_columns(
-                    self.x_test, col, enc_test_df, keep_col
+                    self.x_test,
+                    col,
+                    pd.DataFrame(test_vectors, columns=columns, index=self.x_test.index),
+                    keep_col,
+                )
+
+        if pooling == "tfidf":
+            self.fitted_transformers["embed_text"] = idfs
+
+        return self
+
+    def _stream_text_hash(
+        self, list_of_cols, chunksize, output_dir, estimator, **hash_kwargs
+    ):
+        """Hashes text columns chunk by chunk into files and/or an estimator's partial_fit."""
+
+        from sklearn.base import is_classifier
+
+        classes = (
+            np.unique(self.y_train)
+            if estimator is not None and is_classifier(estimator)
+            else None
+        )
+        paths = {"train": {}, "test": {}}
+
+        target = self.target if estimator is not None else None
+
+        for col in list_of_cols:
+            paths["train"][col], _ = text.stream_text_hash(
+                self.x_train[[col] + ([target] if target else [])],
+                col,
+                chunksize=chunksize,
+                output_dir=output_dir,
+                prefix=f"train_{col}",
+                estimator=estimator,
+                target=target,
+                classes=classes,
+                **hash_kwargs,
+            )
+
+            if self.x_test is not None and output_dir is not None:
+                paths["test"][col], _ = text.stream_text_hash(
+                    self.x_test[col],
+                    col,
+                    chunksize=chunksize,
+                    output_dir=output_dir,
+                    prefix=f"test_{col}",
+                    **hash_kwargs,
                 )
 
+        self.fitted_transformers["text_hash"] = {
+            "paths": paths,
+            "estimator": estimator,
+        }
+
         return self
 
-    def postag_nltk(self, *list_args, list_of_cols=[], new_col_name="_postagged"):
+    def postag_nltk(
+        self,
+        *list_args,
+        list_of_cols=[],
+        new_col_name="_postagged",
+        n_jobs=None,
+        offsets=True,
+    ):
         """
         Tag documents with their respective "Part of Speech" tag with the Textblob package which utilizes the NLTK NLP engine and Penn Treebank tag set.
         These tags classify a word as a noun, verb, adjective, etc. A full list and their meaning can be found here:
         https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
 
         If a list of columns is provided use the list, otherwise use arguments.
+
+        By default no column is created. Instead the tags are stored as token arrays,
+        a Dataframe with one row per token holding the position of its document and the token and its tag as categoricals,
+        in `token_arrays[new_col_name]` for the train and test set.
+        This is far more compact than a column of lists of tuples, the lists can be created when needed with
+        `aethos.feature_engineering.text.token_lists`, or with `offsets=False` to get the column.
         
         Parameters
         ----------
@@ -467,6 +1276,12 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+        n_jobs : int, optional
+            Number of processes to tag the text with, -1 uses every CPU, by default the `n_jobs` option
+
+        offsets : bool, optional
+            True to store token arrays, False to create a column of lists, by default True
+
         Returns
         -------
         Data:
@@ -475,21 +1290,48 @@ class Feature(object):
         Examples
         --------
         >>> data.postag_nltk('col1', 'col2', 'col3')
+        >>> data.postag_nltk('col1', n_jobs=4)
+        >>> data.postag_nltk('col1', offsets=False)
+        >>> text.token_lists(data.token_arrays['col1_postagged']['train'], len(data.x_train))
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
+        if offsets:
+            self._textblob_arrays(list_of_cols, "tags", new_col_name, n_jobs)
+
+            return self
+
         (self.x_train, self.x_test,) = text.textblob_features(
             x_train=self.x_train,
             x_test=self.x_test,
             feature="tags",
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
+            n_jobs=n_jobs,
         )
 
         return self
 
-    def postag_spacy(self, *list_args, list_of_cols=[], new_col_name="_postagged"):
+    def _textblob_arrays(self, list_of_cols, feature, new_col_name, n_jobs):
+        """Stores a TextBlob feature of every column as token arrays in `token_arrays`."""
+
+        for col in _get_columns(list_of_cols, self.x_train):
+            col_name = (
+                col + new_col_name if new_col_name.startswith("_") else new_col_name
+            )
+
+            self.token_arrays[col_name] = {
+                split: text.textblob_arrays(df[col], feature, n_jobs=n_jobs)
+                if df is not None
+                else None
+                for split, df in [("train", self.x_train), ("test", self.x_test)]
+            }
+
+    @cache_feature
+    def postag_spacy(
+        self, *list_args, list_of_cols=[], new_col_name="_postagged", n_jobs=None
+    ):
         """
         Tag documents with their respective "Part of Speech" tag with the Spacy NLP engine and the Universal Dependencies scheme.
         These tags classify a word as a noun, verb, adjective, etc. A full list and their meaning can be found here:
@@ -508,6 +1350,9 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+        n_jobs : int, optional
+            Number of processes the columns are processed in, -1 uses every CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -526,12 +1371,14 @@ class Feature(object):
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
             method="s",
+            n_jobs=n_jobs,
         )
 
         return self
 
+    @cache_feature
     def postag_spacy_detailed(
-        self, *list_args, list_of_cols=[], new_col_name="_postagged"
+        self, *list_args, list_of_cols=[], new_col_name="_postagged", n_jobs=None
     ):
         """
         Tag documents with their respective "Part of Speech" tag with the Spacy NLP engine and the PennState PoS tags.
@@ -551,6 +1398,9 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+        n_jobs : int, optional
+            Number of processes the columns are processed in, -1 uses every CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -569,15 +1419,28 @@ class Feature(object):
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
             method="d",
+            n_jobs=n_jobs,
         )
 
         return self
 
-    def nounphrases_nltk(self, *list_args, list_of_cols=[], new_col_name="_phrases"):
+    def nounphrases_nltk(
+        self,
+        *list_args,
+        list_of_cols=[],
+        new_col_name="_phrases",
+        n_jobs=None,
+        offsets=True,
+    ):
         """
         Extract noun phrases from text using the Textblob packages which uses the NLTK NLP engine.
 
         If a list of columns is provided use the list, otherwise use arguments.
+
+        By default no column is created. Instead the noun phrases are stored as token arrays,
+        a Dataframe with one row per noun phrase holding the position of its document and the phrase as a categorical,
+        in `token_arrays[new_col_name]` for the train and test set.
+        The lists can be created when needed with `aethos.feature_engineering.text.token_lists`, or with `offsets=False` to get the column.
         
         Parameters
         ----------
@@ -590,6 +1453,12 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_phrases`
 
+        n_jobs : int, optional
+            Number of processes to extract the noun phrases with, -1 uses every CPU, by default the `n_jobs` option
+
+        offsets : bool, optional
+            True to store token arrays, False to create a column of lists, by default True
+
         Returns
         -------
         Data:
@@ -598,23 +1467,37 @@ class Feature(object):
         Examples
         --------
         >>> data.nounphrases_nltk('col1', 'col2', 'col3')
+        >>> data.nounphrases_nltk('col1', n_jobs=4)
+        >>> data.nounphrases_nltk('col1', offsets=False)
+        >>> text.token_lists(data.token_arrays['col1_phrases']['train'], len(data.x_train))
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
+        if offsets:
+            self._textblob_arrays(list_of_cols, "noun_phrases", new_col_name, n_jobs)
+
+            return self
+
         (self.x_train, self.x_test,) = text.textblob_features(
             x_train=self.x_train,
             x_test=self.x_test,
             feature="noun_phrases",
             list_of_cols=list_of_cols,
             new_col_name=new_col_name,
+            n_jobs=n_jobs,
         )
 
         return self
 
-    def nounphrases_spacy(self, *list_args, list_of_cols=[], new_col_name="_phrases"):
+    @cache_feature
+    def nounphrases_spacy(
+        self, *list_args, list_of_cols=[], new_col_name="_phrases", n_jobs=None
+    ):
         """
-        Extract noun phrases from text using the Textblob packages which uses the NLTK NLP engine.
+        Extract noun phrases from text using the spaCy NLP engine.
+
+        Only the spaCy components needed for noun chunks run, see the `spacy_model`, `spacy_batch_size` and `spacy_n_process` options.
 
         If a list of columns is provided use the list, otherwise use arguments.
         
@@ -629,6 +1512,9 @@ class Feature(object):
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_phrases`
 
+        n_jobs : int, optional
+            Number of processes the columns are processed in, -1 uses every CPU, by default the `n_jobs` option
+
         Returns
         -------
         Data:
@@ -642,39 +1528,42 @@ class Feature(object):
         list_of_cols = _input_columns(list_args, list_of_cols)
         list_of_cols = _get_columns(list_of_cols, self.x_train)
 
-        nlp = spacy.load("en_core_web_sm")
-
-        for col in list_of_cols:
-
-            if new_col_name.startswith("_"):
-                new_col_name = col + new_col_name
-
-            transformed_text = list(map(nlp, self.x_train[col]))
-            self.x_train[new_col_name] = pd.Series(
-                map(
-                    lambda x: [str(phrase) for phrase in x.noun_chunks],
-                    transformed_text,
-                )
-            )
-
-            if self.x_test is not None:
-                transformed_text = map(nlp, self.x_test[col])
-                self.x_test[new_col_name] = pd.Series(
-                    map(
-                        lambda x: [str(phrase) for phrase in x.noun_chunks],
-                        transformed_text,
-                    )
-                )
+        (self.x_train, self.x_test,) = text.spacy_columns(
+            "noun_phrases",
+            self.x_train,
+            self.x_test,
+            list_of_cols,
+            new_col_name,
+            n_jobs=n_jobs,
+        )
 
         return self
 
-    def polynomial_features(self, *list_args, list_of_cols=[], **poly_kwargs):
+    @cache_feature
+    def polynomial_features(
+        self,
+        *list_args,
+        list_of_cols=[],
+        degree=2,
+        interaction_only=False,
+        include_bias=True,
+        max_features=None,
+        chunksize=256,
+        **poly_kwargs,
+    ):
         """
         Generate polynomial and interaction features.
 
         Generate a new feature matrix consisting of all polynomial combinations of the features with degree less than or equal to the specified degree.
         
         For example, if an input sample is two dimensional and of the form [a, b], the degree-2 polynomial features are [1, a, b, a^2, ab, b^2].
+
+        Terms are computed `chunksize` at a time. With `max_features` only the terms of degree 2 and higher with the highest
+        absolute correlation with the target (variance if there is no target) are kept, the rest are never materialized.
+
+        If the input columns are sparse the output is sparse.
+
+        This function exists in `feature-extraction/util.py`
         
         Parameters
         ----------
@@ -690,6 +1579,19 @@ class Feature(object):
         interaction_only : boolean, 
             If true, only interaction features are produced: features that are products of at most degree distinct input features (so not x[1] ** 2, x[0] * x[2] ** 3, etc.).
             by default = False
+
+        include_bias : bool, optional
+            If True, include a bias column, the feature in which all polynomial powers are zero, by default True
+
+        max_features : int, optional
+            Maximum number of terms of degree 2 and higher to keep, by default None
+
+        chunksize : int, optional
+            Number of terms computed at a time, by default 256
+
+        order : str {'C', 'F'}, optional
+            Order of the output array in the dense case. 'F' order is faster to compute, but may slow down subsequent estimators.
+            by default 'C'
         
         Returns
         -------
@@ -699,31 +1601,230 @@ class Feature(object):
         Examples
         --------
         >>> data.polynomial_features('col1', 'col2', 'col3')
+        >>> data.polynomial_features(degree=3, interaction_only=True, max_features=100)
         """
 
         # If a list of columns is provided use the list, otherwise use arguemnts.
         list_of_cols = _input_columns(list_args, list_of_cols)
+        list_of_cols = _numeric_input_conditions(list_of_cols, self.train_data)
+
+        # Validates the remaining PolynomialFeatures parameters, e.g. order
+        order = PolynomialFeatures(
+            degree=degree,
+            interaction_only=interaction_only,
+            include_bias=include_bias,
+            **poly_kwargs,
+        ).get_params()["order"]
+
+        sparse = any(
+            isinstance(dtype, pd.SparseDtype)
+            for dtype in self.x_train[list_of_cols].dtypes
+        )
+        x_train = util.polynomial_input(self.x_train[list_of_cols])
+
+        terms = util.polynomial_terms(
+            len(list_of_cols),
+            degree=degree,
+            interaction_only=interaction_only,
+            include_bias=include_bias,
+        )
+
+        if max_features is not None:
+            base = [term for term in terms if len(term) < 2]
+            candidates = [term for term in terms if len(term) >= 2]
+
+            y = self.y_train
+            if y is not None and not pd.api.types.is_numeric_dtype(y):
+                y = pd.factorize(y)[0]
+
+            scores = np.concatenate(
+                [
+                    util.screening_scores(block, y)
+                    for block in util.iter_polynomial_chunks(
+                        x_train, candidates, chunksize
+                    )
+                ]
+                or [np.empty(0)]
+            )
+            # Top terms by score, kept in their original order
+            keep = np.sort(np.argsort(-scores, kind="stable")[:max_features])
+            terms = base + [candidates[i] for i in keep]
 
-        poly = PolynomialFeatures(**poly_kwargs)
-        list_of_cols = _numeric_input_conditions(list_of_cols, self.x_train)
+        self.fitted_transformers["polynomial_features"] = {
+            "columns": list_of_cols,
+            "terms": terms,
+        }
+        columns = util.polynomial_names(list_of_cols, terms)
 
-        scaled_data = poly.fit_transform(self.x_train[list_of_cols])
-        scaled_df = pd.DataFrame(scaled_data, columns=poly.get_feature_names_out())
-        self.x_train = drop_replace_columns(self.x_train, list_of_cols, scaled_df)
+        self.x_train = drop_replace_columns(
+            self.x_train,
+            list_of_cols,
+            _to_frame(
+                util.polynomial_block(x_train, terms, chunksize, order=order),
+                columns=columns,
+                index=self.x_train.index,
+                sparse=sparse,
+            ),
+        )
 
         if self.x_test is not None:
-            scaled_test = poly.transform(self.x_test)
-            scaled_test_df = pd.DataFrame(scaled_test, columns=poly.get_feature_names_out())
+            x_test = util.polynomial_input(self.x_test[list_of_cols])
+
             self.x_test = drop_replace_columns(
-                self.x_test, list_of_cols, scaled_test_df
+                self.x_test,
+                list_of_cols,
+                _to_frame(
+                    util.polynomial_block(x_test, terms, chunksize, order=order),
+                    columns=columns,
+                    index=self.x_test.index,
+                    sparse=sparse,
+                ),
+            )
+
+        return self
+
+    def auto_interactions(
+        self,
+        *list_args,
+        list_of_cols=[],
+        max_features=10,
+        operations=["+", "-", "*", "/"],
+        score="corr",
+        sample_size=10000,
+        budget_seconds=None,
+        batch_size=256,
+        random_state=42,
+    ):
+        """
+        Searches sums, differences, products and quotients of pairs of numeric columns that are related to the target
+        and adds the best ones to the data.
+
+        Candidates are scored on a sample of rows by their absolute correlation or mutual information with the target,
+        in batches of vectorized column operations. Pairs of the columns most related to the target are evaluated first.
+        Candidates that score poorly on a small part of the sample are pruned before being scored on the whole sample,
+        and interactions are only kept if they score better than both of their columns.
+
+        Only the best interactions are computed on the full training and testing data.
+        The interactions found are stored in `fitted_transformers['auto_interactions']`.
+
+        A target is required. If no columns are provided, all the numeric columns are used.
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        max_features : int, optional
+            Maximum number of interactions to add, by default 10
+
+        operations : list, optional
+            Interactions to search, any of '+', '-', '*', '/', by default all of them
+
+        score : str {'corr', 'mutual_info'}, optional
+            Absolute correlation or mutual information with the target, by default 'corr'
+
+        sample_size : int, optional
+            Number of rows the candidates are scored on, by default 10000
+
+        budget_seconds : int or float, optional
+            Time after which no more candidates are evaluated, by default no limit
+
+        batch_size : int, optional
+            Number of candidates computed at a time, by default 256
+
+        random_state : int, optional
+            Seed of the row sample, by default 42
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.auto_interactions(max_features=20)
+        >>> data.auto_interactions('price', 'area', 'rooms', operations=['/', '*'], budget_seconds=60)
+        """
+
+        if not self.target:
+            raise ValueError(
+                "Please set the `target` field variable before searching interactions."
+            )
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+        list_of_cols = _numeric_input_conditions(list_of_cols, self.train_data)
+
+        interactions, scores = util.search_interactions(
+            self.x_train[list_of_cols].to_numpy(dtype=np.float64),
+            self.y_train,
+            max_features=max_features,
+            operations=operations,
+            score=score,
+            sample_size=sample_size,
+            budget_seconds=budget_seconds,
+            batch_size=batch_size,
+            random_state=random_state,
+        )
+        columns = util.interaction_names(list_of_cols, interactions)
+
+        self.fitted_transformers["auto_interactions"] = {
+            "columns": list_of_cols,
+            "interactions": interactions,
+            "scores": dict(zip(columns, scores)),
+        }
+
+        self.x_train = pd.concat(
+            [
+                self.x_train,
+                pd.DataFrame(
+                    util.interaction_block(
+                        self.x_train[list_of_cols].to_numpy(dtype=np.float64),
+                        interactions,
+                    ),
+                    columns=columns,
+                    index=self.x_train.index,
+                ),
+            ],
+            axis=1,
+        )
+
+        if self.x_test is not None:
+            self.x_test = pd.concat(
+                [
+                    self.x_test,
+                    pd.DataFrame(
+                        util.interaction_block(
+                            self.x_test[list_of_cols].to_numpy(dtype=np.float64),
+                            interactions,
+                        ),
+                        columns=columns,
+                        index=self.x_test.index,
+                    ),
+                ],
+                axis=1,
             )
 
         return self
 
-    def apply(self, func, output_col: str):
+    def apply(
+        self, func, output_col: str, strategies=STRATEGIES, n_jobs=-1, chunksize=10000
+    ):
         """
         Calls pandas apply function. Will apply the function to your dataset, or
         both your training and testing dataset.
+
+        The function is run with the fastest strategy that gives the same results as a row by row apply:
+
+            vectorized : the function is called once with the whole dataset, e.g. `lambda x: x['col1'] > 0` becomes a column comparison.
+            numba : the function is compiled with numba and run over only the numeric columns it reads, requires numba (`pip install aethos[numba]`).
+            rows : row by row apply in chunks over a pool of processes.
+
+        The strategy used and the rows per second are printed.
+
+        This function exists in `feature-extraction/apply.py`
         
         Parameters
         ----------
@@ -732,6 +1833,15 @@ class Feature(object):
 
         output_col : str
             New column name
+
+        strategies : list, optional
+            Strategies to try, in order, by default ['vectorized', 'numba', 'rows']
+
+        n_jobs : int, optional
+            Number of processes of the rows strategy, -1 uses every CPU, by default -1
+
+        chunksize : int, optional
+            Number of rows sent to a process at a time by the rows strategy, by default 10000
         
         Returns
         -------
@@ -749,37 +1859,52 @@ class Feature(object):
             0     1     0     1     1       
             1     0     2     0     0  
             2     1     0     1     1
+        >>> data.apply(lambda x: x['col1'] * 2 if x['col2'] > 0 else 0, 'col5', strategies=['numba', 'rows'])
         """
 
-        import swifter
-
-        self.x_train.loc[:, output_col] = self.x_train.swifter.progress_bar().apply(
-            func, axis=1
+        result, strategy, rows_per_sec = apply_rows(
+            func, self.x_train, strategies, n_jobs=n_jobs, chunksize=chunksize
         )
+        self.x_train.loc[:, output_col] = result
+        print(f"{output_col}: {strategy} apply, {rows_per_sec:,.0f} rows/s.")
 
         if self.x_test is not None:
-            self.x_test.loc[:, output_col] = self.x_test.swifter.progress_bar().apply(
-                func, axis=1
+            # The strategy that worked on the training data is tried first
+            test_strategies = [strategy] + [s for s in strategies if s != strategy]
+            result, _, _ = apply_rows(
+                func, self.x_test, test_strategies, n_jobs=n_jobs, chunksize=chunksize
             )
+            self.x_test.loc[:, output_col] = result
 
         return self
 
-    def ordinal_encode_labels(self, col: str, ordered_cat=[]):
+    def ordinal_encode_labels(
+        self, *list_args, list_of_cols=[], ordered_cat=[], sort=True
+    ):
         """
         Encode categorical values with value between 0 and n_classes-1.
 
-        Running this function will automatically set the corresponding mapping for the target variable mapping number to the original value.
+        Columns are encoded with `pd.factorize` into the smallest integer dtype that holds their codes.
+        The categories of every column are kept as a dictionary, stored in `fitted_transformers['ordinal_encode_labels']`.
+
+        Missing values and test values not seen in the training data (or not in `ordered_cat`) are encoded with a reserved code, n_classes.
 
-        Note: that this will not work if your test data will have labels that your train data does not.
-        Note: 
+        If a list of columns is provided use the list, otherwise use arguments.
 
         Parameters
         ----------
-        col : str, optional
-            Columnm in the data to ordinally encode.
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
 
-        ordered_cat : list, optional
-            A list of ordered categories for the Ordinal encoder. Should be sorted.
+        ordered_cat : list or dict, optional
+            A list of ordered categories for the Ordinal encoder, or a dictionary of the ordered categories per column.
+
+        sort : bool, optional
+            True to number the categories that are not ordered in sorted order,
+            False in order of appearance which is faster, by default True
         
         Returns
         -------
@@ -788,22 +1913,39 @@ class Feature(object):
 
         Examples
         --------
-        >>> data.encode_labels('col1')
-        >>> data.encode_labels('col1', ordered_cat=["Low", "Medium", "High"])
+        >>> data.ordinal_encode_labels('col1')
+        >>> data.ordinal_encode_labels('col1', ordered_cat=["Low", "Medium", "High"])
+        >>> data.ordinal_encode_labels('col1', 'col2', sort=False)
         """
 
-        categories = ordered_cat if ordered_cat else "auto"
+        list_of_cols = _input_columns(list_args, list_of_cols)
+
+        if isinstance(ordered_cat, dict):
+            categories = ordered_cat
+        else:
+            categories = {col: ordered_cat for col in list_of_cols if ordered_cat}
 
-        enc = OrdinalEncoder(categories=categories)
+        enc = CategoryEncoder(categories=categories, sort=sort)
 
-        self.x_train[col] = enc.fit_transform(self.x_train[col].values.reshape(-1, 1))
+        self.x_train[list_of_cols] = enc.fit_transform(self.x_train[list_of_cols])
 
         if self.x_test is not None:
-            self.x_test[col] = enc.transform(self.x_test[col].values.reshape(-1, 1))
+            self.x_test[list_of_cols] = enc.transform(self.x_test[list_of_cols])
+
+        self.fitted_transformers["ordinal_encode_labels"] = enc
 
         return self
 
-    def pca(self, n_components=10, **pca_kwargs):
+    @cache_feature
+    def pca(
+        self,
+        n_components=10,
+        mode="full",
+        sample_size=None,
+        batch_size=None,
+        dtype=np.float32,
+        **pca_kwargs,
+    ):
         """
         Reduces the dimensionality of the data using Principal Component Analysis. 
         
@@ -811,6 +1953,9 @@ class Feature(object):
 
         This can be used to reduce complexity as well as speed up computation.
 
+        For large datasets fit on a sample of rows with `sample_size` and transform `batch_size` rows at a time,
+        or stream the rows through IncrementalPCA with `mode='incremental'`.
+
         For more info please see: https://scikit-learn.org/stable/modules/generated/sklearn.decomposition.PCA.html 
 
         This function exists in `feature-extraction/util.py`
@@ -826,6 +1971,21 @@ class Feature(object):
             If 0 < n_components < 1 and svd_solver == 'full', select the number of components such that the amount of variance that needs to be explained is greater than the percentage specified by n_components
             If svd_solver == 'arpack', the number of components must be strictly less than the minimum of n_features and n_samples
 
+        mode : str {'full', 'randomized', 'incremental'}, optional
+            full : PCA with the configured svd_solver.
+            randomized : PCA with the randomized solver, `iterated_power` sets the power iteration budget.
+            incremental : IncrementalPCA fit `batch_size` rows at a time.
+            By default 'full'
+
+        sample_size : int or float, optional
+            Number (int) or fraction (float) of the training rows to fit on, by default all of them
+
+        batch_size : int, optional
+            Number of rows fit (incremental) and transformed at a time, by default all of them
+
+        dtype : numpy dtype, optional
+            Output dtype, by default np.float32
+
         whiten : bool, optional (default False)
             When True (False by default) the components_ vectors are multiplied by the square root of n_samples and then divided by the singular values to ensure uncorrelated outputs with unit component-wise variances.
             Whitening will remove some information from the transformed signal (the relative variance scales of the components) but can sometime improve the predictive accuracy of the downstream estimators by making their data respect some hard-wired assumptions.
@@ -860,13 +2020,34 @@ class Feature(object):
         Examples
         --------
         >>> data.pca(n_components=2)
+        >>> data.pca(n_components=20, mode='randomized', iterated_power=3, sample_size=0.1, batch_size=100000)
+        >>> data.pca(n_components=20, mode='incremental', batch_size=50000)
         """
 
-        self._run_sklearn_dim_reduction("pca", n_components=n_components, **pca_kwargs)
+        self._run_sklearn_dim_reduction(
+            "pca",
+            n_components=n_components,
+            mode=mode,
+            sample_size=sample_size,
+            batch_size=batch_size,
+            dtype=dtype,
+            **pca_kwargs,
+        )
 
         return self
 
-    def truncated_svd(self, n_components=50, **svd_kwargs):
+    @cache_feature
+    def truncated_svd(
+        self,
+        n_components=50,
+        mode="randomized",
+        n_oversamples=10,
+        n_iter=5,
+        sample_size=None,
+        batch_size=None,
+        dtype=np.float32,
+        **svd_kwargs,
+    ):
         """
         Reduces the dimensionality of the data using Truncated SVD.
 
@@ -875,6 +2056,10 @@ class Feature(object):
         
         Use Truncated SVD when the data is sparse.
 
+        Sparse columns, e.g. from `tfidf(sparse=True)` or `bag_of_words(sparse=True)`, are passed to the
+        randomized SVD as a CSR matrix in `dtype` and are never densified. The accuracy of the randomized SVD
+        is tuned with `n_oversamples` and `n_iter`, and the test data is transformed `batch_size` rows at a time.
+
         This can be used to reduce complexity as well as speed up computation.
 
         For more info please see: https://scikit-learn.org/stable/modules/generated/sklearn.decomposition.TruncatedSVD.html
@@ -883,19 +2068,43 @@ class Feature(object):
         
         Parameters
         ---------- 
-        n_components: int, default = 2
+        n_components: int, default = 50
             Desired dimensionality of output data. Must be strictly less than the number of features.
-            The default value is useful for visualisation. For LSA, a value of 100 is recommended.
+            For LSA, a value of 100 is recommended.
+
+        mode : str {'randomized', 'full'}, optional
+            randomized : randomized SVD due to Halko (2009).
+            full : Truncated SVD with the configured `algorithm`.
+            By default 'randomized'
+
+        n_oversamples : int, optional
+            Number of extra random vectors sampled to capture the range of the data, by default 10
+            More improves the accuracy of the components of data with a slowly decaying spectrum.
+
+        n_iter: int, optional
+            Number of power iterations of the randomized SVD, by default 5
+            More improves the accuracy at the cost of one pass over the data per iteration.
+
+        sample_size : int or float, optional
+            Number (int) or fraction (float) of the training rows to fit on, by default all of them
+
+        batch_size : int, optional
+            Number of rows transformed at a time, by default all of them
+
+        dtype : numpy dtype, optional
+            Dtype of the sparse input and of the output, by default np.float32
 
         algorithm: string, default = “randomized”
-            SVD solver to use. Either “arpack” for the ARPACK wrapper in SciPy (scipy.sparse.linalg.svds), or “randomized” for the randomized algorithm due to Halko (2009).
+            SVD solver to use, overrides the randomized mode. Either “arpack” for the ARPACK wrapper in SciPy (scipy.sparse.linalg.svds), or “randomized” for the randomized algorithm due to Halko (2009).
 
-        n_iter: int, optional (default 5)
-            Number of iterations for randomized SVD solver. Not used by ARPACK.
-            The default is larger than the default in ~sklearn.utils.extmath.randomized_svd to handle sparse matrices that may have large slowly decaying spectrum.
+        power_iteration_normalizer : {'auto', 'QR', 'LU', 'none'}, optional
+            Normalizer of the power iterations of the randomized SVD, by default 'auto'
 
         tol: float, optional
             Tolerance for ARPACK. 0 means machine precision. Ignored by randomized SVD solver.
+
+        random_state : int, optional
+            Seed of the randomized SVD and of the row sample
         
         Returns
         -------
@@ -905,21 +2114,42 @@ class Feature(object):
         Examples
         --------
         >>> data.truncated_svd(n_components=2)
+        >>> data.tfidf('text', sparse=True, keep_col=False)
+        >>> data.truncated_svd(n_components=100, n_oversamples=20, n_iter=3, batch_size=100000)
         """
 
-        self._run_sklearn_dim_reduction("tsvd", n_components=n_components, **svd_kwargs)
+        self._run_sklearn_dim_reduction(
+            "tsvd",
+            n_components=n_components,
+            mode=mode,
+            sample_size=sample_size,
+            batch_size=batch_size,
+            dtype=dtype,
+            n_oversamples=n_oversamples,
+            n_iter=n_iter,
+            **svd_kwargs,
+        )
 
         return self
 
-    def drop_correlated_features(self, threshold=0.95):
+    def drop_correlated_features(self, threshold=0.95, block_size=1024):
         """
         Drop features that have a correlation coefficient greater than the specified threshold with other features.
+
+        Features are scanned in order and a feature is dropped if it is correlated with a feature kept before it.
+        Correlations are computed in float32 blocks of `block_size` features, so the full correlation matrix is never held in memory.
+        The correlations are cached and reused by `correlation_matrix`.
+
+        This function exists in `stats/correlation.py`
         
         Parameters
         ----------
         threshold : float, optional
             Correlation coefficient threshold, by default 0.95
 
+        block_size : int, optional
+            Number of features correlated at a time, by default 1024
+
         Returns
         -------
         Data:
@@ -930,9 +2160,16 @@ class Feature(object):
         >>> data.drop_correlated_features(threshold=0.9)
         """
 
-        corr = self.x_train.corr().abs()
-        upper = corr.where(np.triu(np.ones(corr.shape), k=1).astype(np.bool))
-        drop_cols = [col for col in upper.columns if any(upper[col] > threshold)]
+        columns = self.train_data.select_dtypes([np.number, "bool"]).columns.tolist()
+
+        # Built on every column, with the target, so that correlation_matrix reuses it
+        engine = correlation_engine(
+            self.x_train,
+            block_size=block_size,
+            engine=self.fitted_transformers.get("correlation"),
+        )
+        self.fitted_transformers["correlation"] = engine
+        drop_cols = engine.correlated_features(threshold, columns=columns)
 
         self.x_train.drop(drop_cols, axis=1, inplace=True)
 
@@ -941,7 +2178,7 @@ class Feature(object):
 
         return self
 
-    def chi2_feature_selection(self, k: int, verbose=False):
+    def chi2_feature_selection(self, k: int, verbose=False, n_jobs=1):
         """
         Uses Chi2 to choose the best K features.
 
@@ -956,6 +2193,9 @@ class Feature(object):
 
         verbose : bool
             True to print p-values for each feature, by default False
+
+        n_jobs : int, optional
+            Number of threads scoring column blocks, -1 uses every CPU, by default 1
         
         Returns
         -------
@@ -967,32 +2207,97 @@ class Feature(object):
         >>> data.chi2_feature_selection(k=10)
         """
 
-        y_train = self.y_train
-        y_test = self.y_test
-        self.x_train = self.x_train.drop(self.target, axis=1)
-        self.x_test = (
-            None if self.x_test is None else self.x_test.drop(self.target, axis=1)
+        return self.select_features(k, method="chi2", verbose=verbose, n_jobs=n_jobs)
+
+    def select_features(
+        self,
+        k: int,
+        method="chi2",
+        verbose=False,
+        n_jobs=1,
+        block_size=4096,
+        n_bins=10,
+    ):
+        """
+        Chooses the best K features by a univariate score of each feature with the target.
+
+        Every feature is scored in one vectorized pass over dense or sparse columns (e.g. TF-IDF or Bag of Words columns),
+        blocks of columns are scored in parallel.
+
+        Scores:
+
+        - chi2: Chi2 statistic, for non-negative features and a categorical target
+        - f_classif: ANOVA F statistic, for a categorical target
+        - f_regression: F statistic of the correlation of the feature with a numeric target
+        - mutual_info_classif: Mutual information of the binned feature with a categorical target
+        - mutual_info_regression: Mutual information of the binned feature with a binned numeric target
+
+        Mutual information is estimated from equal frequency bins of dense features, sparse features are binned into zero and non zero.
+
+        The fitted selector is stored in `fitted_transformers['select_features']`.
+        
+        Parameters
+        ----------
+        k : int or "all"
+            Number of features to keep.
+
+        method : str, optional
+            Score, one of 'chi2', 'f_classif', 'f_regression', 'mutual_info_classif', 'mutual_info_regression',
+            by default 'chi2'
+
+        verbose : bool, optional
+            True to print the p-value (or mutual information) of each selected feature, by default False
+
+        n_jobs : int, optional
+            Number of threads scoring column blocks, -1 uses every CPU, by default 1
+
+        block_size : int, optional
+            Number of columns scored at a time, by default 4096
+
+        n_bins : int, optional
+            Number of bins of dense features and numeric targets for mutual information, by default 10
+        
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.select_features(k=10, method='f_classif')
+        >>> data.tfidf('text', sparse=True).select_features(k=1000, method='chi2', n_jobs=-1)
+        """
+
+        selector = FeatureSelector(
+            method=method, k=k, n_jobs=n_jobs, block_size=block_size, n_bins=n_bins
         )
 
-        chi2_best = SelectKBest(chi2, k=k).fit(self.x_train, y_train)
+        train_data = self.train_data
+        X = _model_input(train_data)
+        X = X if sp.issparse(X) else X.to_numpy(dtype=np.float64)
 
-        column_indices = chi2_best.get_support()
+        selector.fit(X, self.y_train)
+
+        selected = train_data.columns[selector.support_]
+        self.fitted_transformers["select_features"] = selector
 
         if verbose:
-            for col, p in zip(
-                self.x_train.columns[column_indices], chi2_best.pvalues_[column_indices]
-            ):
-                print(f"{col} p-value: {p}")
+            values = (
+                selector.scores_ if selector.pvalues_ is None else selector.pvalues_
+            )
+            name = "mutual information" if selector.pvalues_ is None else "p-value"
 
-        self.x_train = self.x_train[self.x_train.columns[column_indices]]
+            for col, value in zip(selected, values[selector.support_]):
+                print(f"{col} {name}: {value}")
 
-        if self.x_test is not None:
-            self.x_test = self.x_test[self.x_test.columns[column_indices]]
+        keep_cols = selected.tolist() + ([self.target] if self.target else [])
+
+        self.x_train = self.x_train[keep_cols]
 
-        # Re add the target field back to the dataset.
-        self.x_train[self.target] = y_train
         if self.x_test is not None:
-            self.x_test[self.target] = y_test
+            self.x_test = self.x_test[
+                [col for col in keep_cols if col in self.x_test.columns]
+            ]
 
         return self
 
@@ -1021,7 +2326,7 @@ class Feature(object):
             self.x_train = self.x_train
             self.x_test = self.x_test
 
-        self.x_train, self.x_test = util.sklearn_dim_reduction(
+        self.x_train, self.x_test, reducer = util.sklearn_dim_reduction(
             x_train=self.x_train,
             x_test=self.x_test,
             algo=algo,
@@ -1029,8 +2334,10 @@ class Feature(object):
             **kwargs,
         )
 
+        self.fitted_transformers[algo] = reducer
+
         if self.target:
             self.x_train[self.target] = train_target_data
-            self.x_test[self.target] = (
-                test_target_data if test_target_data is not None else None
-            )
+
+            if self.x_test is not None:
+                self.x_test[self.target] = test_target_data
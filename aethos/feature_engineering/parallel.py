@@ -0,0 +1,139 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+BACKENDS = {"threads": ThreadPoolExecutor, "processes": ProcessPoolExecutor}
+
+
+def map_columns(func, jobs, backend="threads", n_jobs=None, job_bytes=0):
+    """
+    Runs independent per column jobs in parallel and returns their results in order.
+
+    Threads suit jobs whose work releases the GIL (numpy, scipy, sklearn kernels), processes suit
+    Python heavy jobs like tokenizing and tagging text. With processes `func` and the jobs must be picklable.
+
+    The number of workers is capped by the `memory_budget` option, so that the estimated memory of
+    the jobs running at once fits in it.
+
+    Parameters
+    ----------
+    func : Function
+        Function called with the arguments of a job
+
+    jobs : list
+        Tuple of arguments of every job, e.g. the train and test column
+
+    backend : str {'threads', 'processes'}, optional
+        Pool to run the jobs in, by default 'threads'
+
+    n_jobs : int, optional
+        Number of workers, -1 uses every CPU, by default the `n_jobs` option
+
+    job_bytes : int, optional
+        Estimated memory of a job, see `column_bytes`, by default 0
+
+    Returns
+    -------
+    list
+        Result of every job
+    """
+
+    from aethos.config.config import _global_config
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid backend, choose from {list(BACKENDS)}.")
+
+    n_workers = resolve_n_jobs(n_jobs)
+    budget = _global_config["memory_budget"]
+
+    if budget and job_bytes:
+        n_workers = min(n_workers, max(1, budget // job_bytes))
+
+    n_workers = min(n_workers, len(jobs))
+
+    if n_workers <= 1:
+        return [func(*job) for job in jobs]
+
+    with BACKENDS[backend](max_workers=n_workers) as pool:
+        return list(pool.map(func, *zip(*jobs)))
+
+
+def resolve_n_jobs(n_jobs=None):
+    """
+    Number of workers to use, `n_jobs` or the `n_jobs` option if it is None, -1 uses every CPU.
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        Number of workers, by default the `n_jobs` option
+
+    Returns
+    -------
+    int
+        Number of workers
+    """
+
+    from aethos.config.config import _global_config
+
+    if n_jobs is None:
+        n_jobs = _global_config["n_jobs"]
+
+    return os.cpu_count() if n_jobs == -1 else max(n_jobs, 1)
+
+
+def column_bytes(*columns):
+    """
+    Estimated memory of a job from the memory of its input columns, only computed with a `memory_budget`.
+
+    Parameters
+    ----------
+    columns : Series
+        Input columns, None is ignored
+
+    Returns
+    -------
+    int
+        Memory of the columns in bytes, 0 without a memory budget
+    """
+
+    from aethos.config.config import _global_config
+
+    if not _global_config["memory_budget"]:
+        return 0
+
+    return sum(
+        int(column.memory_usage(deep=True, index=False))
+        for column in columns
+        if column is not None
+    )
+
+
+def concat_columns(df, drop_cols, new_data, keep_col=False):
+    """
+    Adds the columns of every job to a Dataframe with a single concat, dropping the input columns.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Dataframe of the data
+
+    drop_cols : list
+        Input columns to drop if `keep_col` is False
+
+    new_data : list
+        Dataframes of the new columns
+
+    keep_col : bool, optional
+        True to keep the input columns, by default False
+
+    Returns
+    -------
+    Dataframe
+        Dataframe with the new columns
+    """
+
+    if not keep_col:
+        df = df.drop(drop_cols, axis=1)
+
+    return pd.concat([df] + list(new_data), axis=1)
@@ -0,0 +1,290 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy import stats
+
+METHODS = [
+    "chi2",
+    "f_classif",
+    "f_regression",
+    "mutual_info_classif",
+    "mutual_info_regression",
+]
+
+# Number of values of a dense block binned at a time by the mutual information scores
+MI_BLOCK_VALUES = 2 ** 24
+
+
+class FeatureSelector(object):
+    """
+    Selects the K best features by a univariate score, computed for every feature at once.
+
+    The scores are computed with matrix products of a class indicator matrix with column blocks
+    of the data, so sparse data stays sparse and blocks are scored in parallel threads.
+
+    - chi2: chi2 statistic of non-negative features, e.g. counts or TF-IDF, with the class
+    - f_classif: ANOVA F statistic of the feature between the classes
+    - f_regression: F statistic of the correlation of the feature with a numeric target
+    - mutual_info_classif: mutual information of the binned feature with the class
+    - mutual_info_regression: mutual information of the binned feature with the binned target
+
+    Mutual information is estimated from the counts of `n_bins` equal frequency bins of dense features,
+    sparse features are binned into zero and non zero. It is a fast approximation of sklearn's
+    nearest neighbour estimate.
+
+    Parameters
+    ----------
+    method : str, optional
+        Score, one of 'chi2', 'f_classif', 'f_regression', 'mutual_info_classif', 'mutual_info_regression',
+        by default 'chi2'
+
+    k : int or 'all', optional
+        Number of features to keep, by default 10
+
+    n_jobs : int, optional
+        Number of threads scoring column blocks, -1 uses every CPU, by default 1
+
+    block_size : int, optional
+        Number of columns scored at a time, by default 4096
+
+    n_bins : int, optional
+        Number of bins of dense features and numeric targets for mutual information, by default 10
+    """
+
+    def __init__(self, method="chi2", k=10, n_jobs=1, block_size=4096, n_bins=10):
+
+        if method not in METHODS:
+            raise ValueError(f"Invalid method, choose from {METHODS}.")
+
+        self.method = method
+        self.k = k
+        self.n_jobs = n_jobs
+        self.block_size = block_size
+        self.n_bins = n_bins
+
+    def fit(self, X, y):
+        """
+        Scores every feature and selects the K best.
+
+        Parameters
+        ----------
+        X : ndarray or sparse matrix
+            Features
+
+        y : Series or array like
+            Target
+
+        Returns
+        -------
+        FeatureSelector
+        """
+
+        X = sp.csc_matrix(X) if sp.issparse(X) else np.asarray(X, dtype=np.float64)
+
+        values = X.data if sp.issparse(X) else X
+
+        if self.method == "chi2" and values.min(initial=0) < 0:
+            raise ValueError("Chi2 requires non-negative features.")
+
+        target = self._target(y)
+        n_features = X.shape[1]
+        block_size = self.block_size
+
+        if self.method.startswith("mutual_info") and not sp.issparse(X):
+            block_size = max(1, min(block_size, MI_BLOCK_VALUES // max(len(X), 1)))
+
+        blocks = [
+            slice(start, min(start + block_size, n_features))
+            for start in range(0, n_features, block_size)
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        ) as pool:
+            results = list(
+                pool.map(lambda cols: self._score(X[:, cols], target), blocks)
+            )
+
+        self.scores_ = np.concatenate([scores for scores, _ in results] or [[]])
+        self.pvalues_ = (
+            None
+            if self.method.startswith("mutual_info")
+            else np.concatenate([pvalues for _, pvalues in results] or [[]])
+        )
+
+        if self.k == "all" or self.k >= n_features:
+            self.support_ = np.arange(n_features)
+        else:
+            # Same ranking as sklearn's SelectKBest, missing scores rank last
+            scores = np.where(np.isnan(self.scores_), -np.inf, self.scores_)
+            self.support_ = np.sort(np.argsort(scores, kind="mergesort")[-self.k :])
+
+        return self
+
+    def transform(self, X):
+        """
+        Selects the features.
+
+        Parameters
+        ----------
+        X : Dataframe, ndarray or sparse matrix
+            Features
+
+        Returns
+        -------
+        Dataframe, ndarray or sparse matrix
+            Selected features
+        """
+
+        if isinstance(X, pd.DataFrame):
+            return X.iloc[:, self.support_]
+
+        return X[:, self.support_]
+
+    def fit_transform(self, X, y):
+
+        return self.fit(X, y).transform(X)
+
+    def _target(self, y):
+        """Class indicator matrix of shape (n_classes, n_samples) and class codes, or the numeric target."""
+
+        y = pd.Series(y).reset_index(drop=True)
+
+        if self.method == "f_regression":
+            return y.to_numpy(dtype=np.float64)
+
+        if self.method == "mutual_info_regression":
+            codes = _bin_codes(y.to_numpy(dtype=np.float64)[:, None], self.n_bins)[:, 0]
+        else:
+            codes, _ = pd.factorize(y, sort=True)
+
+        n_classes = codes.max() + 1 if len(codes) else 0
+        indicator = sp.csr_matrix(
+            (np.ones(len(codes)), (codes, np.arange(len(codes)))),
+            shape=(n_classes, len(codes)),
+        )
+
+        return indicator, codes
+
+    def _score(self, X, target):
+        """Scores and p-values of a block of columns."""
+
+        if self.method == "f_regression":
+            return _f_regression(X, target)
+
+        indicator, codes = target
+
+        if self.method == "chi2":
+            return _chi2(X, indicator)
+        elif self.method == "f_classif":
+            return _f_classif(X, indicator)
+
+        return _mutual_info(X, indicator, codes, self.n_bins), None
+
+
+def _dense(matrix):
+
+    return matrix.toarray() if sp.issparse(matrix) else np.asarray(matrix)
+
+
+def _column_sums(X):
+
+    return np.asarray(X.sum(axis=0)).ravel()
+
+
+def _chi2(X, indicator):
+
+    observed = _dense(indicator @ X)
+    class_prob = np.asarray(indicator.sum(axis=1)).ravel() / X.shape[0]
+    expected = np.outer(class_prob, _column_sums(X))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = ((observed - expected) ** 2 / expected).sum(axis=0)
+
+    return scores, stats.chi2.sf(scores, len(class_prob) - 1)
+
+
+def _f_classif(X, indicator):
+
+    n_samples = X.shape[0]
+    n_classes = indicator.shape[0]
+    class_counts = np.asarray(indicator.sum(axis=1)).ravel()
+
+    sums = _dense(indicator @ X)
+    squares = X.multiply(X) if sp.issparse(X) else X ** 2
+    total = sums.sum(axis=0)
+
+    ss_total = _column_sums(squares) - total ** 2 / n_samples
+    ss_between = (sums ** 2 / class_counts[:, None]).sum(
+        axis=0
+    ) - total ** 2 / n_samples
+    ss_within = ss_total - ss_between
+
+    df_between = n_classes - 1
+    df_within = n_samples - n_classes
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (ss_between / df_between) / (ss_within / df_within)
+
+    return scores, stats.f.sf(scores, df_between, df_within)
+
+
+def _f_regression(X, y):
+
+    n_samples = X.shape[0]
+    y = y - y.mean()
+    means = _column_sums(X) / n_samples
+    squares = X.multiply(X) if sp.issparse(X) else X ** 2
+
+    # X^T y of the centered columns, the column means drop out since y is centered
+    covariance = np.asarray(X.T @ y).ravel()
+    norms = np.sqrt(np.maximum(_column_sums(squares) - n_samples * means ** 2, 0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = covariance / (norms * np.linalg.norm(y))
+        scores = corr ** 2 / (1 - corr ** 2) * (n_samples - 2)
+
+    return scores, stats.f.sf(scores, 1, n_samples - 2)
+
+
+def _mutual_info(X, indicator, codes, n_bins):
+
+    n_samples, n_features = X.shape
+    n_classes = indicator.shape[0]
+    class_counts = np.asarray(indicator.sum(axis=1)).ravel()
+
+    if sp.issparse(X):
+        # Non zero counts per class, zero counts are the rest of the class
+        nonzero = _dense(indicator @ (X != 0).astype(np.float64))
+        joint = np.stack([class_counts[:, None] - nonzero, nonzero], axis=1)
+        joint = joint.transpose(2, 1, 0)
+    else:
+        bins = _bin_codes(X, n_bins)
+        cells = (
+            bins * n_classes
+            + codes[:, None]
+            + np.arange(n_features) * n_bins * n_classes
+        )
+        joint = np.bincount(
+            cells.ravel(), minlength=n_features * n_bins * n_classes
+        ).reshape(n_features, n_bins, n_classes)
+
+    p_joint = joint / n_samples
+    p_feature = p_joint.sum(axis=2, keepdims=True)
+    p_class = (class_counts / n_samples)[None, None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = p_joint * np.log(p_joint / (p_feature * p_class))
+
+    return np.nansum(terms, axis=(1, 2))
+
+
+def _bin_codes(X, n_bins):
+    """Equal frequency bin of every value, tied values share a bin."""
+
+    ranks = stats.rankdata(X, method="min", axis=0) - 1
+
+    return (ranks * n_bins // max(len(X), 1)).astype(np.int64)
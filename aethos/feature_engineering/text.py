@@ -1,19 +1,70 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 import spacy
 
-from textblob import TextBlob
-
-from aethos.util import _get_columns
+from sklearn.base import clone
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from textblob import Blobber
+from textblob.base import BaseTagger
+
+from aethos.feature_engineering.parallel import (
+    column_bytes,
+    concat_columns,
+    map_columns,
+    resolve_n_jobs,
+)
+from aethos.util import _get_columns, _map_unique
+
+# Word vector files in the word2vec format, every other file is loaded as saved gensim KeyedVectors
+WORD2VEC_EXTENSIONS = (".txt", ".vec", ".bin", ".gz")
+
+# Columns of the token arrays of the TextBlob features returning lists
+TEXTBLOB_ARRAYS = {
+    "tags": ["token", "tag"],
+    "noun_phrases": ["phrase"],
+    "words": ["token"],
+}
+
+# Pipeline components each spaCy feature needs, every other component is disabled.
+# Tokens and spans are converted to strings so no Doc outlives its batch.
+SPACY_FEATURES = {
+    "s": (
+        ("tok2vec", "tagger", "attribute_ruler"),
+        lambda doc: [(token.text, token.pos_) for token in doc],
+    ),
+    "d": (("tok2vec", "tagger"), lambda doc: [(token.text, token.tag_) for token in doc]),
+    "noun_phrases": (
+        ("tok2vec", "tagger", "attribute_ruler", "parser"),
+        lambda doc: [chunk.text for chunk in doc.noun_chunks],
+    ),
+}
 
 
 def textblob_features(
-    x_train, x_test, feature, list_of_cols=[], new_col_name="_postagged",
+    x_train,
+    x_test,
+    feature,
+    list_of_cols=[],
+    new_col_name="_postagged",
+    n_jobs=None,
+    chunksize=1000,
 ):
     """
     Part of Speech tag the text data provided. Used to tag each word as a Noun, Adjective,
     Verbs, etc.
 
     This utilizes TextBlob which utlizes the NLTK tagger and is a wrapper for the tagging process.
+
+    The distinct values are processed in chunks over a pool of `n_jobs` processes, the tagger and
+    noun phrase extractor are loaded once per process.
+    Tags are returned as (token, tag) string tuples and noun phrases as lists of strings.
     
     Parameters
     ----------
@@ -32,6 +83,12 @@ def textblob_features(
     new_col_name : str, optional
         New column name to be created when applying this technique, by default `COLUMN_postagged`
 
+    n_jobs : int, optional
+        Number of processes, 1 runs in the current process, by default the `n_jobs` option
+
+    chunksize : int, optional
+        Number of values sent to a process at a time, by default 1000
+
     Returns
     -------
     Dataframe, *Dataframe
@@ -41,26 +98,299 @@ def textblob_features(
     """
 
     list_of_cols = _get_columns(list_of_cols, x_train)
+    textblob_map = _textblob_map(feature, n_jobs, chunksize)
 
+    # Values are spread over the processes rather than columns, which balances columns of different lengths
     for col in list_of_cols:
+        col_name = col + new_col_name if new_col_name.startswith("_") else new_col_name
 
-        if new_col_name.startswith("_"):
-            new_col_name = col + new_col_name
-
-        x_train[new_col_name] = pd.Series(
-            [getattr(TextBlob(x), feature) for x in x_train[col]]
-        )
+        x_train[col_name] = _map_unique(textblob_map, x_train[col], batch=True)
 
         if x_test is not None:
-            x_test[new_col_name] = pd.Series(
-                [getattr(TextBlob(x), feature) for x in x_test[col]]
-            )
+            x_test[col_name] = _map_unique(textblob_map, x_test[col], batch=True)
 
     return x_train, x_test
 
 
+def textblob_arrays(corpus, feature, n_jobs=None, chunksize=1000):
+    """
+    Extracts a TextBlob feature returning lists, e.g. tags or noun phrases, as flat token arrays.
+
+    Instead of a list of tuples per document, the result has one row per token with the position of its
+    document (`doc`) and the token and its tag as categoricals, i.e. integer codes into one array of the
+    distinct strings. The rows of a document are contiguous and in order.
+
+    Parameters
+    ----------
+    corpus : Series or iterable of str
+        Documents
+
+    feature : str {'tags', 'noun_phrases', 'words'}
+        TextBlob feature
+
+    n_jobs : int, optional
+        Number of processes, 1 runs in the current process, by default the `n_jobs` option
+
+    chunksize : int, optional
+        Number of values sent to a process at a time, by default 1000
+
+    Returns
+    -------
+    Dataframe
+        One row per token, `doc` and the columns of the feature, e.g. `token` and `tag`
+    """
+
+    if feature not in TEXTBLOB_ARRAYS:
+        raise ValueError(f"Invalid feature, choose from {list(TEXTBLOB_ARRAYS)}.")
+
+    codes, uniques = pd.factorize(pd.Series(list(corpus)), use_na_sentinel=False)
+    results = list(_textblob_map(feature, n_jobs, chunksize)(list(uniques)))
+
+    return flatten_tokens(results, codes, TEXTBLOB_ARRAYS[feature])
+
+
+def flatten_tokens(results, codes, columns):
+    """
+    Flattens the token lists of distinct documents into one row per token of every document.
+
+    Parameters
+    ----------
+    results : list
+        List of tokens, or of tuples with one item per column, of every distinct document
+
+    codes : array like
+        Position in `results` of every document
+
+    columns : list
+        Column names of the items of the tokens
+
+    Returns
+    -------
+    Dataframe
+        `doc` and one categorical column per item of the tokens
+    """
+
+    codes = np.asarray(codes, dtype=np.int64)
+    lengths = np.array([len(result) for result in results], dtype=np.int64)
+    flat = [token for result in results for token in result]
+
+    # Position of every token of every document in the flat tokens of the distinct documents
+    unique_starts = np.r_[0, np.cumsum(lengths)][:-1]
+    row_lengths = lengths[codes]
+    row_starts = np.r_[0, np.cumsum(row_lengths)][:-1]
+    take = np.repeat(unique_starts[codes] - row_starts, row_lengths) + np.arange(
+        row_lengths.sum()
+    )
+
+    if len(columns) == 1:
+        items = {columns[0]: flat}
+    else:
+        items = {col: [token[i] for token in flat] for i, col in enumerate(columns)}
+
+    return pd.DataFrame(
+        {
+            "doc": np.repeat(np.arange(len(codes)), row_lengths),
+            **{
+                col: pd.Categorical(values).take(take) for col, values in items.items()
+            },
+        }
+    )
+
+
+def token_lists(arrays, n_docs):
+    """
+    Materializes token arrays back into a list of tokens per document.
+
+    Parameters
+    ----------
+    arrays : Dataframe
+        Output of `textblob_arrays`
+
+    n_docs : int
+        Number of documents
+
+    Returns
+    -------
+    ndarray
+        List of tokens, or of tuples, of every document
+    """
+
+    offsets = np.searchsorted(arrays["doc"].to_numpy(), np.arange(n_docs + 1))
+    columns = [col for col in arrays.columns if col != "doc"]
+    tokens = (
+        arrays[columns[0]].tolist()
+        if len(columns) == 1
+        else list(zip(*(arrays[col].tolist() for col in columns)))
+    )
+
+    lists = np.empty(n_docs, dtype=object)
+    for i in range(n_docs):
+        lists[i] = tokens[offsets[i] : offsets[i + 1]]
+
+    return lists
+
+
+def _textblob_map(feature, n_jobs=None, chunksize=1000):
+    """Function extracting a TextBlob feature from a list of values, over a process pool if `n_jobs` > 1."""
+
+    func = partial(_textblob_feature, feature)
+    n_jobs = resolve_n_jobs(n_jobs)
+
+    def textblob_map(texts):
+
+        if n_jobs == 1:
+            return map(func, texts)
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            return list(pool.map(func, texts, chunksize=chunksize))
+
+    return textblob_map
+
+
+class _PerceptronTagger(BaseTagger):
+    """NLTK's perceptron tagger, loaded on first use instead of on every `pos_tag` call."""
+
+    def __init__(self):
+
+        self._tagger = None
+
+    def tag(self, text):
+
+        if self._tagger is None:
+            from nltk.tag.perceptron import PerceptronTagger
+
+            self._tagger = PerceptronTagger()
+
+        return self._tagger.tag(list(text.tokens))
+
+
+@lru_cache(maxsize=None)
+def _textblob():
+    """Builds the TextBlob factory once per process so its models are shared by every value."""
+
+    return Blobber(pos_tagger=_PerceptronTagger())
+
+
+def _textblob_feature(feature, value):
+    """Extracts a TextBlob feature from a value, as plain Python objects."""
+
+    result = getattr(_textblob()(value), feature)
+
+    if isinstance(result, list):
+        return [
+            tuple(str(item) for item in x) if isinstance(x, tuple) else str(x)
+            for x in result
+        ]
+
+    return result
+
+
+def vectorize_text(
+    vectorizer,
+    x_train,
+    x_test=None,
+    list_of_cols=[],
+    n_jobs=None,
+    shared_vocabulary=False,
+):
+    """
+    Vectorizes text columns into a single sparse block.
+
+    A copy of the vectorizer is fit on every column, in parallel over `n_jobs` processes,
+    or one vectorizer is fit on all the columns when the vocabulary is shared.
+    With more than one column the feature names are prefixed with the column name.
+
+    Parameters
+    ----------
+    vectorizer : sklearn text vectorizer
+        Unfitted vectorizer, e.g. TfidfVectorizer
+
+    x_train : DataFrame
+        Dataset
+
+    x_test : DataFrame
+        Testing dataset, by default None
+
+    list_of_cols : list, optional
+        A list of specific columns to apply this technique to, by default []
+
+    n_jobs : int, optional
+        Number of processes to fit the columns with, -1 uses every CPU, by default the `n_jobs` option
+
+    shared_vocabulary : bool, optional
+        True to fit one vocabulary on the text of all the columns, by default False
+
+    Returns
+    -------
+    csr_matrix, csr_matrix, list, dict
+        Train and test blocks, feature names and the fitted vectorizer per column.
+
+    The test block is None if x_test is not provided.
+    """
+
+    list_of_cols = _get_columns(list_of_cols, x_train)
+
+    if shared_vocabulary:
+        vectorizer = clone(vectorizer).fit(
+            pd.concat([x_train[col] for col in list_of_cols], ignore_index=True)
+        )
+        vectorizers = [vectorizer] * len(list_of_cols)
+    else:
+        vectorizers = [clone(vectorizer) for _ in list_of_cols]
+
+    tasks = [
+        (
+            vec,
+            x_train[col],
+            x_test[col] if x_test is not None else None,
+            not shared_vocabulary,
+        )
+        for vec, col in zip(vectorizers, list_of_cols)
+    ]
+
+    results = map_columns(
+        _vectorize_column,
+        tasks,
+        backend="processes",
+        n_jobs=n_jobs,
+        job_bytes=max(
+            (column_bytes(train, test) for _, train, test, _ in tasks), default=0
+        ),
+    )
+
+    vectorizers = dict(zip(list_of_cols, (vec for vec, _, _ in results)))
+    feature_names = []
+
+    for col, vec in vectorizers.items():
+        names = vec.get_feature_names_out()
+        feature_names.extend(names if len(list_of_cols) == 1 else col + "_" + names)
+
+    train_matrix = sp.hstack([train for _, train, _ in results], format="csr")
+    test_matrix = (
+        sp.hstack([test for _, _, test in results], format="csr")
+        if x_test is not None
+        else None
+    )
+
+    return train_matrix, test_matrix, feature_names, vectorizers
+
+
+def _vectorize_column(vectorizer, train, test, fit):
+    """Fits (optionally) and applies a vectorizer to a train and test column."""
+
+    train_matrix = vectorizer.fit_transform(train) if fit else vectorizer.transform(train)
+    test_matrix = vectorizer.transform(test) if test is not None else None
+
+    return vectorizer, train_matrix, test_matrix
+
+
 def spacy_feature_postag(
-    x_train, x_test=None, list_of_cols=[], new_col_name="_postagged", method="s"
+    x_train,
+    x_test=None,
+    list_of_cols=[],
+    new_col_name="_postagged",
+    method="s",
+    n_jobs=None,
 ):
     """
     Part of Speech tag the text data provided. Used to tag each word as a Noun, Adjective,
@@ -84,6 +414,9 @@ def spacy_feature_postag(
 
     method : str {'s', 'd'}, optional
         Spacey PoS tagging method either simple or detailed
+
+    n_jobs : int, optional
+        Number of processes the columns are tagged in, -1 uses every CPU, by default the `n_jobs` option
     
     Returns
     -------
@@ -95,23 +428,427 @@ def spacy_feature_postag(
 
     list_of_cols = _get_columns(list_of_cols, x_train)
 
-    nlp = spacy.load("en_core_web_sm")
+    return spacy_columns(
+        method, x_train, x_test, list_of_cols, new_col_name, n_jobs=n_jobs
+    )
 
-    if method == "s":
-        func = lambda x: [(token, token.pos_) for token in x]
-    else:
-        func = lambda x: [(token, token.tag_) for token in x]
 
-    for col in list_of_cols:
+def spacy_columns(feature, x_train, x_test, list_of_cols, new_col_name, n_jobs=None):
+    """
+    Extracts a spaCy feature from text columns, the columns are processed in parallel processes.
 
-        if new_col_name.startswith("_"):
-            new_col_name = col + new_col_name
+    Parameters
+    ----------
+    feature : str {'s', 'd', 'noun_phrases'}
+        Simple PoS tags, detailed PoS tags or noun phrases
 
-        transformed_text = map(nlp, x_train[col])
-        x_train[new_col_name] = pd.Series(map(func, transformed_text,))
+    x_train : DataFrame
+        Dataset
 
-        if x_test is not None:
-            transformed_text = map(nlp, x_test[col])
-            x_test[new_col_name] = pd.Series(map(func, transformed_text,))
+    x_test : DataFrame
+        Testing dataset, by default None
+
+    list_of_cols : list
+        Text columns
+
+    new_col_name : str
+        New column name, or suffix of the column name if it starts with `_`
+
+    n_jobs : int, optional
+        Number of processes, -1 uses every CPU, by default the `n_jobs` option
+
+    Returns
+    -------
+    Dataframe, *Dataframe
+        Transformed dataframe with the new columns.
+
+    Returns 2 Dataframes if x_test is provided.
+    """
+
+    jobs = [
+        (feature, x_train[col], x_test[col] if x_test is not None else None)
+        for col in list_of_cols
+    ]
+    results = map_columns(
+        _spacy_column,
+        jobs,
+        backend="processes",
+        n_jobs=n_jobs,
+        job_bytes=max(
+            (column_bytes(train, test) for _, train, test in jobs), default=0
+        ),
+    )
+    names = [
+        col + new_col_name if new_col_name.startswith("_") else new_col_name
+        for col in list_of_cols
+    ]
+
+    # Existing columns with the new names are replaced
+    x_train = concat_columns(
+        x_train,
+        [name for name in names if name in x_train.columns],
+        [
+            pd.Series(train, index=x_train.index, name=name)
+            for name, (train, _) in zip(names, results)
+        ],
+    )
+
+    if x_test is not None:
+        x_test = concat_columns(
+            x_test,
+            [name for name in names if name in x_test.columns],
+            [
+                pd.Series(test, index=x_test.index, name=name)
+                for name, (_, test) in zip(names, results)
+            ],
+        )
 
     return x_train, x_test
+
+
+def _spacy_column(feature, train, test):
+    """Extracts a spaCy feature from a train and test column."""
+
+    return (
+        spacy_feature(feature, train),
+        spacy_feature(feature, test) if test is not None else None,
+    )
+
+
+def spacy_feature(feature, column):
+    """
+    Extracts a spaCy feature from every value of a text column.
+
+    Values are streamed through `nlp.pipe` with only the pipeline components the feature needs enabled.
+    The model, batch size and number of processes are set by the `spacy_model`,
+    `spacy_batch_size` and `spacy_n_process` options.
+
+    Parameters
+    ----------
+    feature : str {'s', 'd', 'noun_phrases'}
+        Simple PoS tags, detailed PoS tags or noun phrases
+
+    column : Series
+        Text column
+
+    Returns
+    -------
+    ndarray
+        Object array of the feature per value
+    """
+
+    from aethos.config.config import _global_config
+
+    components, extract = SPACY_FEATURES[feature]
+    nlp = spacy_model(_global_config["spacy_model"], components)
+
+    def pipe(texts):
+
+        docs = nlp.pipe(
+            texts,
+            batch_size=_global_config["spacy_batch_size"],
+            n_process=_global_config["spacy_n_process"],
+        )
+
+        return [extract(doc) for doc in docs]
+
+    return _map_unique(pipe, column, batch=True)
+
+
+@lru_cache(maxsize=None)
+def spacy_model(name, components):
+    """
+    Loads a spaCy model once per process for a set of enabled components.
+
+    Parameters
+    ----------
+    name : str
+        spaCy model name
+
+    components : tuple
+        Pipeline components to keep enabled, the components the model does not have are ignored
+
+    Returns
+    -------
+    Language
+        spaCy pipeline
+    """
+
+    nlp = spacy.load(name)
+    nlp.select_pipes(enable=[pipe for pipe in components if pipe in nlp.pipe_names])
+
+    return nlp
+
+
+def embed_documents(
+    column, vectors_path, pooling="mean", idf=None, lowercase=False, chunksize=10000
+):
+    """
+    Pools the word vectors of the tokens of every document into a document vector.
+
+    Documents are tokenized into a sparse document-token count matrix and the tokens of the corpus are
+    looked up in the vocabulary of the word vectors at once. Only the vectors of those tokens are read
+    from the memory mapped vectors, the document vectors are then the product of the row normalized
+    (optionally TF-IDF weighted) count matrix with them, computed in float32 chunks of rows.
+
+    Tokens without a vector are ignored, documents without any token with a vector are all zeros.
+
+    Parameters
+    ----------
+    column : Series
+        Text column
+
+    vectors_path : str
+        Path of the word vectors, saved gensim KeyedVectors or a word2vec format file (.txt, .vec, .bin, .gz)
+
+    pooling : str {'mean', 'tfidf'}, optional
+        Average of the token vectors or average weighted by TF-IDF, by default 'mean'
+
+    idf : Series, optional
+        IDF per word vector id computed on the training data, by default computed on this column
+
+    lowercase : bool, optional
+        True to lowercase the text before looking up the tokens, by default False
+
+    chunksize : int, optional
+        Number of documents pooled at a time, by default 10000
+
+    Returns
+    -------
+    ndarray, Series
+        float32 document vectors and the IDF per word vector id, None for mean pooling
+    """
+
+    if pooling not in ["mean", "tfidf"]:
+        raise ValueError("Invalid pooling, choose from ['mean', 'tfidf'].")
+
+    vectors, keys = word_vectors(vectors_path)
+
+    vectorizer = CountVectorizer(
+        lowercase=lowercase, token_pattern=r"(?u)\b\w+\b", dtype=np.float32
+    )
+    counts = vectorizer.fit_transform(column.fillna("").astype(str))
+
+    # Id of every token of the corpus in the word vectors, -1 if it has none
+    ids = keys.get_indexer(vectorizer.get_feature_names_out())
+    found = ids >= 0
+    counts = counts[:, found].tocsr()
+    ids = ids[found]
+
+    if pooling == "tfidf":
+        if idf is None:
+            doc_freq = np.bincount(counts.indices, minlength=len(ids))
+            idf = pd.Series(
+                np.log((1 + counts.shape[0]) / (1 + doc_freq)) + 1, index=ids
+            )
+
+        # Tokens not seen in the training data are weighted as the rarest tokens
+        weights = idf.reindex(ids).fillna(idf.max() if len(idf) else 1).to_numpy()
+        counts = counts @ sp.diags(weights.astype(np.float32))
+
+    counts = normalize(counts, norm="l1")
+    token_vectors = np.asarray(vectors.vectors[ids], dtype=np.float32)
+    pooled = np.zeros((counts.shape[0], vectors.vector_size), dtype=np.float32)
+
+    for start in range(0, counts.shape[0], chunksize):
+        stop = start + chunksize
+        pooled[start:stop] = counts[start:stop] @ token_vectors
+
+    return pooled, idf
+
+
+def word_vectors(path):
+    """
+    Loads word vectors, requires gensim (`pip install aethos[embeddings]`).
+
+    Saved gensim KeyedVectors are memory mapped read only, so the vectors are only read from disk
+    when they are used and are shared between processes, they are cached per process.
+    Word2vec format files are loaded in memory and only the last one loaded is kept, as they are often several GB.
+
+    Parameters
+    ----------
+    path : str
+        Path of the word vectors
+
+    Returns
+    -------
+    KeyedVectors, Index
+        Word vectors and their vocabulary, in the order of the vectors
+    """
+
+    if path.endswith(WORD2VEC_EXTENSIONS):
+        return _word2vec_vectors(path)
+
+    return _mapped_vectors(path)
+
+
+@lru_cache(maxsize=1)
+def _word2vec_vectors(path):
+    """Loads a word2vec format file in memory."""
+
+    vectors = _keyed_vectors().load_word2vec_format(
+        path, binary=path.endswith((".bin", ".bin.gz"))
+    )
+
+    return vectors, pd.Index(vectors.index_to_key)
+
+
+@lru_cache(maxsize=8)
+def _mapped_vectors(path):
+    """Memory maps saved KeyedVectors."""
+
+    vectors = _keyed_vectors().load(path, mmap="r")
+
+    return vectors, pd.Index(vectors.index_to_key)
+
+
+def _keyed_vectors():
+
+    try:
+        from gensim.models import KeyedVectors
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "Word vectors require gensim, install it with `pip install aethos[embeddings]`."
+        )
+
+    return KeyedVectors
+
+
+def iter_text_chunks(source, column, chunksize=10000, target=None):
+    """
+    Reads a text column, and optionally a target column, chunk by chunk.
+
+    Parameters
+    ----------
+    source : Series, DataFrame, str or iterable
+        Column or data in memory, path of a Parquet (.parquet) or csv file,
+        or an iterable of DataFrame chunks
+
+    column : str
+        Text column
+
+    chunksize : int, optional
+        Number of rows per chunk, by default 10000
+
+    target : str, optional
+        Target column, by default None
+
+    Yields
+    ------
+    Series, Series
+        Text and target of a chunk, the target is None without a target column
+    """
+
+    columns = [column] + ([target] if target else [])
+
+    if isinstance(source, pd.Series):
+        source = source.to_frame(column)
+
+    if isinstance(source, pd.DataFrame):
+        chunks = (
+            source.iloc[start : start + chunksize]
+            for start in range(0, len(source), chunksize)
+        )
+    elif isinstance(source, str) and source.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "Reading Parquet files requires pyarrow, install it with `pip install aethos[arrow]`."
+            )
+
+        chunks = (
+            batch.to_pandas()
+            for batch in pq.ParquetFile(source).iter_batches(
+                batch_size=chunksize, columns=columns
+            )
+        )
+    elif isinstance(source, str):
+        chunks = pd.read_csv(source, usecols=columns, chunksize=chunksize)
+    else:
+        chunks = source
+
+    for chunk in chunks:
+        yield chunk[column], chunk[target] if target else None
+
+
+def stream_text_hash(
+    source,
+    column,
+    chunksize=10000,
+    output_dir=None,
+    prefix=None,
+    estimator=None,
+    target=None,
+    classes=None,
+    **hash_kwargs
+):
+    """
+    Hashes a text column chunk by chunk, without holding the whole column or its features in memory.
+
+    Hashing needs no vocabulary, so every chunk is hashed independently into a sparse block.
+    Blocks are written to `output_dir` as .npz files (`scipy.sparse.load_npz`) and/or passed to
+    the `partial_fit` method of an estimator with the target of the chunk.
+
+    Parameters
+    ----------
+    source : Series, DataFrame, str or iterable
+        Column or data in memory, path of a Parquet (.parquet) or csv file,
+        or an iterable of DataFrame chunks
+
+    column : str
+        Text column
+
+    chunksize : int, optional
+        Number of rows per chunk, by default 10000
+
+    output_dir : str, optional
+        Directory the sparse blocks are written to, by default None
+
+    prefix : str, optional
+        Prefix of the block file names, by default the column name
+
+    estimator : estimator with a partial_fit method, optional
+        Model trained on the blocks, by default None
+
+    target : str, optional
+        Target column passed to `partial_fit`, by default None
+
+    classes : array like, optional
+        All the classes of the target, passed on the first `partial_fit` call of classifiers, by default None
+
+    hash_kwargs : dict, optional
+        Parameters of the HashingVectorizer
+
+    Returns
+    -------
+    list, int
+        Paths of the blocks written and number of rows hashed
+    """
+
+    vectorizer = HashingVectorizer(**hash_kwargs)
+    prefix = column if prefix is None else prefix
+    paths = []
+    n_rows = 0
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    chunks = iter_text_chunks(source, column, chunksize=chunksize, target=target)
+
+    for i, (texts, y) in enumerate(chunks):
+        block = vectorizer.transform(texts.fillna(""))
+        n_rows += block.shape[0]
+
+        if output_dir is not None:
+            path = os.path.join(output_dir, f"{prefix}_{i:05d}.npz")
+            sp.save_npz(path, block)
+            paths.append(path)
+
+        if estimator is not None:
+            if i == 0 and classes is not None:
+                estimator.partial_fit(block, y, classes=classes)
+            else:
+                estimator.partial_fit(block, y)
+
+    return paths, n_rows
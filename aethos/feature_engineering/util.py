@@ -1,12 +1,36 @@
+import time
+from numbers import Integral, Real
+from itertools import chain, combinations, combinations_with_replacement
+
+import numpy as np
 import pandas as pd
-from sklearn.decomposition import PCA, TruncatedSVD
+import scipy.sparse as sp
+from sklearn.decomposition import PCA, IncrementalPCA, TruncatedSVD
+
+from sklearn.utils import gen_batches
+
+from aethos.util import _model_input
 
 
 def sklearn_dim_reduction(
-    x_train, x_test=None, algo=None, n_components=50, **dim_reduce_kwargs
+    x_train,
+    x_test=None,
+    algo=None,
+    n_components=50,
+    mode="full",
+    sample_size=None,
+    batch_size=None,
+    dtype=np.float32,
+    **dim_reduce_kwargs
 ):
     """
     Performs Principal Component Analysis on a dataset.
+
+    The reducer is fit on all the rows, or a random sample of `sample_size` rows, and the data is then
+    transformed `batch_size` rows at a time into a preallocated output block.
+
+    Sparse columns, e.g. from `tfidf(sparse=True)`, are passed to the reducer as a CSR matrix in `dtype`
+    so they are never densified. Only Truncated SVD supports sparse data.
     
     Parameters
     ----------
@@ -18,27 +42,586 @@ def sklearn_dim_reduction(
 
     x_test : DataFrame
         Testing dataset, by default None
+
+    mode : str {'full', 'randomized', 'incremental'}, optional
+        'full' runs the algorithm as configured, 'randomized' uses a randomized SVD solver
+        and 'incremental' fits IncrementalPCA `batch_size` rows at a time (PCA only), by default 'full'
+
+    sample_size : int or float, optional
+        Number (int) or fraction (float) of the training rows to fit on, by default all of them
+
+    batch_size : int, optional
+        Number of rows fit (incremental) and transformed at a time, by default all of them
+
+    dtype : numpy dtype, optional
+        Output dtype, by default np.float32
     
     Returns
     -------
-    Dataframe, *Dataframe
-        Transformed dataframe with the new column
+    Dataframe, *Dataframe, reducer
+        Transformed dataframe with the new column and the fitted reducer
 
     Returns 2 Dataframes if x_test is provided. 
     """
 
-    algorithms = {
-        "pca": PCA(n_components=n_components, **dim_reduce_kwargs),
-        "tsvd": TruncatedSVD(n_components=n_components, **dim_reduce_kwargs),
-    }
+    reducer = _dim_reducer(algo, mode, n_components, batch_size, **dim_reduce_kwargs)
+
+    train_input = _reducer_input(x_train, dtype)
+
+    fit_data = train_input
+    if sample_size is not None:
+        if isinstance(sample_size, Integral):
+            n, frac = int(sample_size), None
+        elif isinstance(sample_size, Real):
+            n, frac = None, float(sample_size)
+        else:
+            raise ValueError("sample_size must be a number of rows or a fraction.")
 
-    reducer = algorithms[algo]
+        rows = pd.Series(np.arange(len(x_train)), index=x_train.index).sample(
+            n=n, frac=frac, random_state=dim_reduce_kwargs.get("random_state", 42)
+        )
+        fit_data = _take_rows(train_input, rows.to_numpy())
 
-    x_train = pd.DataFrame(reducer.fit_transform(x_train))
-    x_train.columns = map(str, x_train.columns)
+    if mode == "incremental":
+        # Batches can not have fewer rows than components, a short last batch is merged into the one before
+        for batch in _iter_rows(fit_data, batch_size, min_batch_size=n_components):
+            reducer.partial_fit(batch)
+    else:
+        reducer.fit(fit_data)
+
+    x_train = _transform_rows(reducer, x_train, batch_size, dtype, data=train_input)
 
     if x_test is not None:
-        x_test = pd.DataFrame(reducer.transform(x_test))
-        x_test.columns = map(str, x_test.columns)
+        x_test = _transform_rows(reducer, x_test, batch_size, dtype)
+
+    return x_train, x_test, reducer
+
+
+def _dim_reducer(algo, mode, n_components, batch_size, **dim_reduce_kwargs):
+    """Unfitted sklearn reducer for an algorithm and mode."""
+
+    if mode == "full":
+        algorithms = {
+            "pca": lambda: PCA(n_components=n_components, **dim_reduce_kwargs),
+            "tsvd": lambda: TruncatedSVD(n_components=n_components, **dim_reduce_kwargs),
+        }
+    elif mode == "randomized":
+        # A solver passed by the caller overrides the randomized one
+        algorithms = {
+            "pca": lambda: PCA(
+                n_components=n_components,
+                **{"svd_solver": "randomized", **dim_reduce_kwargs},
+            ),
+            "tsvd": lambda: TruncatedSVD(
+                n_components=n_components,
+                **{"algorithm": "randomized", **dim_reduce_kwargs},
+            ),
+        }
+    elif mode == "incremental":
+        # random_state only seeds the row sample, IncrementalPCA is deterministic
+        dim_reduce_kwargs.pop("random_state", None)
+        algorithms = {
+            "pca": lambda: IncrementalPCA(
+                n_components=n_components, batch_size=batch_size, **dim_reduce_kwargs
+            )
+        }
+    else:
+        raise ValueError(
+            "Invalid mode, choose from 'full', 'randomized' or 'incremental'."
+        )
+
+    if algo not in algorithms:
+        raise ValueError(f"{algo} does not support the {mode} mode.")
+
+    return algorithms[algo]()
+
+
+def _reducer_input(df, dtype):
+    """Dataframe, or CSR matrix in `dtype` if it has sparse columns, to fit or transform with."""
+
+    data = _model_input(df)
+
+    return data.astype(dtype, copy=False) if sp.issparse(data) else data
+
+
+def _take_rows(data, rows):
+    """Rows of a Dataframe or a sparse matrix."""
+
+    return data[rows] if sp.issparse(data) else data.iloc[rows]
+
+
+def _iter_rows(df, batch_size, min_batch_size=0):
+    """Yields the rows of df, a Dataframe or a sparse matrix, `batch_size` at a time."""
+
+    n_rows = df.shape[0]
+
+    for batch in gen_batches(
+        n_rows, batch_size or max(n_rows, 1), min_batch_size=min_batch_size
+    ):
+        yield _take_rows(df, batch)
+
+
+def _transform_rows(reducer, df, batch_size, dtype, data=None):
+    """Transforms df `batch_size` rows at a time into a preallocated block."""
+
+    data = _reducer_input(df, dtype) if data is None else data
+    n_components = reducer.components_.shape[0]
+    output = np.empty((len(df), n_components), dtype=dtype)
+
+    start = 0
+    for batch in _iter_rows(data, batch_size):
+        output[start : start + batch.shape[0]] = reducer.transform(batch)
+        start += batch.shape[0]
+
+    return pd.DataFrame(output, columns=map(str, range(n_components)), index=df.index)
+
+
+def polynomial_terms(n_features, degree=2, interaction_only=False, include_bias=True):
+    """
+    Lists the polynomial terms of a set of features, in the order of sklearn's PolynomialFeatures.
+
+    Parameters
+    ----------
+    n_features : int
+        Number of input features
+
+    degree : int, optional
+        Maximum degree of the terms, by default 2
+
+    interaction_only : bool, optional
+        True to only produce products of distinct features, by default False
+
+    include_bias : bool, optional
+        True to include the bias (degree 0) term, by default True
+
+    Returns
+    -------
+    list
+        Tuples of the feature indices multiplied in every term
+    """
+
+    combine = combinations if interaction_only else combinations_with_replacement
+    start = 0 if include_bias else 1
+
+    return list(
+        chain.from_iterable(
+            combine(range(n_features), d) for d in range(start, degree + 1)
+        )
+    )
+
+
+def polynomial_names(columns, terms):
+    """
+    Names polynomial terms the way sklearn's PolynomialFeatures does, e.g. '1', 'a^2', 'a b'.
+
+    Parameters
+    ----------
+    columns : list
+        Input feature names
+
+    terms : list
+        Tuples of the feature indices multiplied in every term
+
+    Returns
+    -------
+    list
+        Term names
+    """
+
+    names = []
+
+    for term in terms:
+        if not term:
+            names.append("1")
+            continue
+
+        powers = pd.Series(term).value_counts(sort=False)
+        names.append(
+            " ".join(
+                columns[i] if power == 1 else f"{columns[i]}^{power}"
+                for i, power in powers.items()
+            )
+        )
+
+    return names
+
+
+def iter_polynomial_chunks(X, terms, chunksize=256):
+    """
+    Computes polynomial terms a chunk of terms at a time.
+
+    Terms of the same degree in a chunk are computed together with one gather and product.
+
+    Parameters
+    ----------
+    X : ndarray or sparse matrix
+        Input features, a CSC matrix is kept sparse
+
+    terms : list
+        Tuples of the feature indices multiplied in every term
+
+    chunksize : int, optional
+        Number of terms computed at a time, by default 256
+
+    Yields
+    ------
+    ndarray or csc_matrix
+        Values of the chunk of terms, in the order of `terms`
+    """
+
+    for start in range(0, len(terms), chunksize):
+        chunk = terms[start : start + chunksize]
+        degrees = np.array([len(term) for term in chunk])
+        blocks, order = [], []
+
+        for degree in np.unique(degrees):
+            positions = np.flatnonzero(degrees == degree)
+            index = np.array([chunk[i] for i in positions], dtype=np.intp).reshape(
+                len(positions), degree
+            )
+
+            blocks.append(_multiply_columns(X, index))
+            order.append(positions)
+
+        order = np.argsort(np.concatenate(order))
+
+        if sp.issparse(X):
+            yield sp.hstack(blocks, format="csc")[:, order]
+        else:
+            yield np.hstack(blocks)[:, order]
+
+
+def polynomial_input(df):
+    """
+    Converts columns to the input block of `iter_polynomial_chunks`.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Numeric columns
+
+    Returns
+    -------
+    ndarray or csc_matrix
+        Float block, CSC if any column is sparse so the products stay sparse
+    """
+
+    x = _model_input(df)
+
+    return x.tocsc() if sp.issparse(x) else x.to_numpy(dtype=np.float64)
+
+
+def polynomial_block(X, terms, chunksize=256, order="C"):
+    """
+    Materializes polynomial terms chunk by chunk into one block.
+
+    Parameters
+    ----------
+    X : ndarray or csc_matrix
+        Input block
+
+    terms : list
+        Tuples of the feature indices multiplied in every term
+
+    chunksize : int, optional
+        Number of terms computed at a time, by default 256
+
+    order : str {'C', 'F'}, optional
+        Memory layout of a dense block, by default 'C'
+
+    Returns
+    -------
+    ndarray or csr_matrix
+        Values of all the terms
+    """
+
+    chunks = iter_polynomial_chunks(X, terms, chunksize)
+
+    if sp.issparse(X):
+        return sp.hstack(list(chunks), format="csr")
+
+    block = np.empty((X.shape[0], len(terms)), order=order)
+
+    for start, chunk in zip(range(0, len(terms), chunksize), chunks):
+        block[:, start : start + chunk.shape[1]] = chunk
+
+    return block
+
+
+def screening_scores(X, y=None):
+    """
+    Cheap relevance score of every column, the absolute Pearson correlation with the target,
+    or the variance if there is no target.
+
+    Parameters
+    ----------
+    X : ndarray or sparse matrix
+        Features
+
+    y : array like, optional
+        Target, by default None
+
+    Returns
+    -------
+    ndarray
+        Score per column, constant columns score 0
+    """
+
+    mean = np.asarray(X.mean(axis=0)).ravel()
+    sq_mean = np.asarray(
+        (X.multiply(X) if sp.issparse(X) else X * X).mean(axis=0)
+    ).ravel()
+    var = np.maximum(sq_mean - mean ** 2, 0)
+
+    if y is None:
+        return var
+
+    y = np.asarray(y, dtype=np.float64)
+    y_centered = y - y.mean()
+    cov = np.asarray(X.T @ y_centered).ravel() / len(y)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.abs(cov / np.sqrt(var * y_centered.var()))
+
+    return np.nan_to_num(corr)
+
+
+def _multiply_columns(X, index):
+    """Products of the columns of X selected by every row of a (n_terms, degree) index."""
+
+    if index.shape[1] == 0:
+        ones = np.ones((X.shape[0], index.shape[0]))
+        return sp.csc_matrix(ones) if sp.issparse(X) else ones
+
+    if sp.issparse(X):
+        block = X[:, index[:, 0]]
+
+        for j in range(1, index.shape[1]):
+            block = block.multiply(X[:, index[:, j]])
+
+        return sp.csc_matrix(block)
+
+    return X[:, index].prod(axis=2)
+
+
+def _divide(a, b):
+    """Quotient that is 0 where the denominator is 0."""
+
+    return np.divide(a, b, out=np.zeros(np.broadcast(a, b).shape), where=b != 0)
+
+
+# Arithmetic interactions, by symbol
+INTERACTIONS = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": _divide}
+
+
+def interaction_candidates(n_features, operations=list(INTERACTIONS)):
+    """
+    Lists the arithmetic interactions of every pair of features.
+
+    Sums, differences and products are listed once per pair, quotients in both directions.
+    The difference of a pair is only listed one way since both ways have the same score.
+
+    Parameters
+    ----------
+    n_features : int
+        Number of input features
+
+    operations : list, optional
+        Symbols of the interactions, any of '+', '-', '*', '/', by default all of them
+
+    Returns
+    -------
+    list
+        (left feature index, symbol, right feature index) of every candidate
+    """
+
+    if any(op not in INTERACTIONS for op in operations):
+        raise ValueError(f"Invalid interaction, choose from {list(INTERACTIONS)}.")
+
+    candidates = []
+
+    for i, j in combinations(range(n_features), 2):
+        for op in operations:
+            candidates.append((i, op, j))
+
+            if op == "/":
+                candidates.append((j, op, i))
+
+    return candidates
+
+
+def interaction_block(X, candidates):
+    """
+    Computes interactions, one vectorized operation per symbol.
+
+    Parameters
+    ----------
+    X : ndarray
+        Dense features
+
+    candidates : list
+        (left feature index, symbol, right feature index) of every interaction
+
+    Returns
+    -------
+    ndarray
+        Column of every interaction
+    """
+
+    block = np.empty((X.shape[0], len(candidates)))
+
+    for op, func in INTERACTIONS.items():
+        index = [k for k, (_, symbol, _) in enumerate(candidates) if symbol == op]
+
+        if index:
+            left = [candidates[k][0] for k in index]
+            right = [candidates[k][2] for k in index]
+            block[:, index] = func(X[:, left], X[:, right])
+
+    return block
+
+
+def interaction_names(columns, candidates):
+    """Names of interactions, e.g. 'a*b'."""
+
+    return [f"{columns[i]}{op}{columns[j]}" for i, op, j in candidates]
+
+
+def search_interactions(
+    X,
+    y,
+    max_features=10,
+    operations=list(INTERACTIONS),
+    score="corr",
+    sample_size=10000,
+    budget_seconds=None,
+    batch_size=256,
+    random_state=42,
+):
+    """
+    Searches the arithmetic interactions of pairs of features that score the best with the target.
+
+    Candidates are scored on a sample of rows, in batches computed in one vectorized operation per symbol.
+    Pairs of the best scoring features are evaluated first.
+
+    Every batch is first scored on an eighth of the sample. Candidates are pruned if they score more than 10%
+    below the better of their two features, or below the worst of the current best `max_features`.
+    Only the remaining candidates are scored on the whole sample and kept if they score better than
+    both of their features. The search stops after `budget_seconds`.
+
+    Parameters
+    ----------
+    X : ndarray
+        Dense features
+
+    y : array like
+        Target
+
+    max_features : int, optional
+        Number of interactions to return, by default 10
+
+    operations : list, optional
+        Symbols of the interactions, any of '+', '-', '*', '/', by default all of them
+
+    score : str {'corr', 'mutual_info'}, optional
+        Absolute correlation or mutual information with the target, by default 'corr'
+
+    sample_size : int, optional
+        Number of rows the candidates are scored on, by default 10000
+
+    budget_seconds : int or float, optional
+        Time after which no more candidates are evaluated, by default no limit
+
+    batch_size : int, optional
+        Number of candidates computed at a time, by default 256
+
+    random_state : int, optional
+        Seed of the row sample, by default 42
+
+    Returns
+    -------
+    list, ndarray
+        Best interactions, (left feature index, symbol, right feature index), and their scores on the sample
+    """
+
+    start = time.perf_counter()
+    rng = np.random.RandomState(random_state)
+    rows = (
+        np.sort(rng.choice(len(X), sample_size, replace=False))
+        if len(X) > sample_size
+        else np.arange(len(X))
+    )
+    # Screening rows are the first eighth of a shuffled sample
+    screen = rng.permutation(len(rows))[: max(len(rows) // 8, min(len(rows), 256))]
+
+    X = np.asarray(X, dtype=np.float64)[rows]
+    y = pd.Series(y).iloc[rows]
+    scorer = _interaction_scorer(score, y)
+    feature_scores = scorer(X, None)
+
+    # Pairs of the best features first, so the most promising candidates fit in the budget
+    candidates = interaction_candidates(X.shape[1], operations)
+    candidates.sort(key=lambda c: -(feature_scores[c[0]] + feature_scores[c[2]]))
+
+    best, best_scores = [], np.empty(0)
+
+    for batch in gen_batches(len(candidates), batch_size):
+        if budget_seconds is not None and time.perf_counter() - start > budget_seconds:
+            break
+
+        batch = candidates[batch]
+        block = interaction_block(X, batch)
+
+        # Cheap scores on the screening rows
+        parents = np.array(
+            [max(feature_scores[i], feature_scores[j]) for i, _, j in batch]
+        )
+        threshold = best_scores.min() if len(best) >= max_features else -np.inf
+        keep = scorer(block[screen], screen) > np.maximum(parents, threshold) * 0.9
+
+        if not keep.any():
+            continue
+
+        scores = scorer(block[:, keep], None)
+        survivors = [c for c, k in zip(batch, keep) if k]
+        gain = scores > parents[keep]
+
+        best = best + [c for c, g in zip(survivors, gain) if g]
+        best_scores = np.concatenate([best_scores, scores[gain]])
+
+        top = np.argsort(-best_scores, kind="stable")[:max_features]
+        best, best_scores = [best[i] for i in top], best_scores[top]
+
+    return best, best_scores
+
+
+def _interaction_scorer(score, y):
+    """Function scoring the columns of a block against the target, on all or some of the sample rows."""
+
+    if score not in ["corr", "mutual_info"]:
+        raise ValueError("Invalid score, choose from ['corr', 'mutual_info'].")
+
+    if score == "corr":
+        target = (
+            y.to_numpy(dtype=np.float64)
+            if pd.api.types.is_numeric_dtype(y)
+            else pd.factorize(y)[0].astype(np.float64)
+        )
+
+        def scorer(block, rows):
+            return screening_scores(block, target if rows is None else target[rows])
+
+    else:
+        from aethos.feature_engineering.selection import FeatureSelector
+
+        method = (
+            "mutual_info_regression"
+            if pd.api.types.is_float_dtype(y)
+            else "mutual_info_classif"
+        )
+
+        def scorer(block, rows):
+            target = y if rows is None else y.iloc[rows]
+            return FeatureSelector(method=method, k="all").fit(block, target).scores_
 
-    return x_train, x_test
+    return scorer
@@ -20,6 +20,7 @@ from aethos.modelling.util import (
     _get_cv_type,
     run_crossvalidation,
 )
+from aethos.util import _model_input
 from aethos.visualizations.visualizations import Visualizations
 from aethos.stats.stats import Stats
 from aethos.model_analysis.constants import (
@@ -45,7 +46,7 @@ class ModelAnalysisBase(Visualizations, Stats):
     def train_results(self):
 
         data = self.x_train.copy()
-        data["predicted"] = self.model.predict(data)
+        data["predicted"] = self.model.predict(_model_input(data))
         data["actual"] = self.y_train
 
         return data
@@ -84,12 +85,14 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
         self.y_test = y_test
         self.features = x_test.columns
         self.y_pred = self.model.predict(
-            self.x_test[self.features]
+            _model_input(self.x_test[self.features])
         )  # Specifying columns for XGBoost
         self.run_id = None
 
         if hasattr(model, "predict_proba"):
-            self.probabilities = self.model.predict_proba(self.x_test[self.features])
+            self.probabilities = self.model.predict_proba(
+                _model_input(self.x_test[self.features])
+            )
 
         self.shap = Shap(
             self.model,
@@ -781,7 +784,7 @@ class SupervisedModelAnalysis(ModelAnalysisBase):
 
         cv_scores = run_crossvalidation(
             self.model,
-            self.x_train,
+            _model_input(self.x_train[self.features]),
             self.y_train,
             cv=cv,
             scoring=score,
@@ -2,6 +2,7 @@ import os
 
 from aethos.config.config import _global_config
 from aethos.modelling.util import track_artifacts
+from aethos.util import _model_input
 from .model_analysis import ModelAnalysisBase
 
 
@@ -28,9 +29,9 @@ class UnsupervisedModelAnalysis(ModelAnalysisBase):
         self.cluster_col = "predicted"
 
         if hasattr(self.model, "predict"):
-            self.y_pred = self.model.predict(self.x_train)
+            self.y_pred = self.model.predict(_model_input(self.x_train))
         else:
-            self.y_pred = self.model.fit_predict(self.x_train)
+            self.y_pred = self.model.fit_predict(_model_input(self.x_train))
 
         self.x_train[self.cluster_col] = self.y_pred
 
@@ -19,7 +19,7 @@ from aethos.modelling.util import (
     to_pickle,
     track_model,
 )
-from aethos.util import split_data, _get_attr_, _get_item_
+from aethos.util import split_data, _get_attr_, _get_item_, _model_input
 
 warnings.simplefilter("ignore", FutureWarning)
 
@@ -45,6 +45,9 @@ class ModelBase(object):
         self.target = target
         self.test_split_percentage = test_split_percentage
         self.target_mapping = None
+        self.fitted_transformers = {}
+        self.sentence_offsets = {}
+        self.token_arrays = {}
 
         if self.x_test is None and type(self).__name__ != "Unsupervised":
             # Generate train set and test set.
@@ -101,6 +104,9 @@ class ModelBase(object):
         )
 
         new_inst.target_mapping = self.target_mapping
+        new_inst.fitted_transformers = self.fitted_transformers
+        new_inst.sentence_offsets = self.sentence_offsets
+        new_inst.token_arrays = self.token_arrays
         new_inst._models = self._models
         new_inst._queued_models = self._queued_models
 
@@ -403,7 +409,7 @@ class ModelBase(object):
         #############################################################
 
         # Train a model and predict on the test test.
-        model.fit(self.train_data, self.y_train)
+        model.fit(_model_input(self.train_data), self.y_train)
 
         #############################################################
         ############### Initialize Model Analysis ###################
@@ -472,7 +478,7 @@ class ModelBase(object):
         ###################### Train Model ##########################
         #############################################################
 
-        model.fit(self.train_data)
+        model.fit(_model_input(self.train_data))
 
         #############################################################
         ############### Initialize Model Analysis ###################
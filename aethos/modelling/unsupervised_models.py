@@ -1,4 +1,5 @@
 import pandas as pd
+import scipy.sparse as sp
 
 from aethos.modelling.model import ModelBase
 from aethos.config import shell
@@ -10,6 +11,7 @@ from aethos.feature_engineering.feature import Feature
 from aethos.visualizations.visualizations import Visualizations
 from aethos.stats.stats import Stats
 from aethos.modelling.util import add_to_queue
+from aethos.util import _model_input
 
 
 class Unsupervised(
@@ -108,9 +110,15 @@ class Unsupervised(
             from yellowbrick.cluster import KElbowVisualizer
 
             model = KMeans(**kwargs)
-
-            visualizer = KElbowVisualizer(model, k=(4, 12))
-            visualizer.fit(self.train_data)
+            data = _model_input(self.train_data)
+
+            # The distortion score densifies the clusters of sparse data, silhouette supports it
+            visualizer = KElbowVisualizer(
+                model,
+                k=(4, 12),
+                metric="silhouette" if sp.issparse(data) else "distortion",
+            )
+            visualizer.fit(data)
             visualizer.show()
 
             print(f"Optimal number of clusters is {visualizer.elbow_value_}.")
@@ -1,8 +1,311 @@
+import numpy as np
 import pandas as pd
-from aethos.util import _numeric_input_conditions, drop_replace_columns
-from sklearn.preprocessing import MinMaxScaler, RobustScaler
+from aethos.util import (
+    QuantileSketch,
+    _numeric_input_conditions,
+    drop_replace_columns,
+)
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
 
-SCALER = {"minmax": MinMaxScaler, "robust": RobustScaler}
+SCALER = {"minmax": MinMaxScaler, "robust": RobustScaler, "standard": StandardScaler}
+
+LOG = {2: np.log2, 10: np.log10}
+
+
+class StreamingScaler(object):
+    """
+    Scaler that is fit incrementally over chunks of data.
+
+    - minmax: running minimum and maximum
+    - standard: running mean and variance (Welford/Chan)
+    - robust: median and quantile range from mergeable quantile sketches
+
+    Scalers fit on separate chunks or workers can be combined with `merge`.
+
+    Parameters
+    ----------
+    method : str {'minmax', 'standard', 'robust'}, optional
+        Scaling method, by default 'minmax'
+
+    feature_range : tuple(int or float, int or float), optional
+        Min and max range to normalize values to when using 'minmax', by default (0, 1)
+
+    with_mean : bool, optional
+        Center the data when using 'standard', by default True
+
+    with_std : bool, optional
+        Scale the data to unit variance when using 'standard', by default True
+
+    with_centering : bool, optional
+        Center the data on the median when using 'robust', by default True
+
+    with_scaling : bool, optional
+        Scale the data to the quantile range when using 'robust', by default True
+
+    quantile_range : tuple(float, float), optional
+        Quantile range used when using 'robust', by default (25.0, 75.0)
+
+    sketch_size : int, optional
+        Compactor capacity of the quantile sketches, by default 2048
+    """
+
+    def __init__(
+        self,
+        method="minmax",
+        feature_range=(0, 1),
+        with_mean=True,
+        with_std=True,
+        with_centering=True,
+        with_scaling=True,
+        quantile_range=(25.0, 75.0),
+        sketch_size=2048,
+    ):
+
+        if method not in SCALER:
+            raise ValueError(f"Invalid scaling method, choose from {list(SCALER)}.")
+
+        self.method = method
+        self.feature_range = feature_range
+        self.with_mean = with_mean
+        self.with_std = with_std
+        self.with_centering = with_centering
+        self.with_scaling = with_scaling
+        self.quantile_range = quantile_range
+        self.sketch_size = sketch_size
+
+        self.n_samples_seen_ = None
+        self.data_min_ = None
+        self.data_max_ = None
+        self.mean_ = None
+        self.m2_ = None
+        self.sketches_ = None
+
+    def partial_fit(self, X):
+        """
+        Updates the running statistics with a chunk of data.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Chunk of data
+
+        Returns
+        -------
+        StreamingScaler
+            The fitted scaler
+        """
+
+        X = np.asarray(X, dtype=np.float64)
+        n_features = X.shape[1]
+
+        if self.n_samples_seen_ is None:
+            self.n_samples_seen_ = np.zeros(n_features)
+            self.data_min_ = np.full(n_features, np.inf)
+            self.data_max_ = np.full(n_features, -np.inf)
+            self.mean_ = np.zeros(n_features)
+            self.m2_ = np.zeros(n_features)
+            self.sketches_ = (
+                [QuantileSketch(self.sketch_size) for _ in range(n_features)]
+                if self.method == "robust"
+                else []
+            )
+
+        counts = (~np.isnan(X)).sum(axis=0)
+        seen = counts > 0
+
+        if self.method == "minmax":
+            self.data_min_[seen] = np.fmin(
+                self.data_min_[seen], np.nanmin(X[:, seen], axis=0)
+            )
+            self.data_max_[seen] = np.fmax(
+                self.data_max_[seen], np.nanmax(X[:, seen], axis=0)
+            )
+        elif self.method == "standard":
+            means = np.zeros(n_features)
+            m2 = np.zeros(n_features)
+            means[seen] = np.nanmean(X[:, seen], axis=0)
+            m2[seen] = np.nansum((X[:, seen] - means[seen]) ** 2, axis=0)
+
+            self._combine_moments(counts, means, m2)
+        else:
+            for sketch, column in zip(self.sketches_, X.T):
+                sketch.update(column)
+
+        if self.method != "standard":
+            self.n_samples_seen_ += counts
+
+        return self
+
+    def fit(self, X, chunksize=None):
+        """
+        Fits the scaler over a dataset, chunk by chunk.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Dataset
+
+        chunksize : int, optional
+            Number of rows per chunk, by default all rows at once
+
+        Returns
+        -------
+        StreamingScaler
+            The fitted scaler
+        """
+
+        for chunk in _iter_chunks(np.asarray(X), chunksize):
+            self.partial_fit(chunk)
+
+        return self
+
+    def merge(self, other):
+        """
+        Merges the state of a scaler fit on another chunk or worker into this one.
+
+        Parameters
+        ----------
+        other : StreamingScaler
+            Scaler using the same method, fit on other data
+
+        Returns
+        -------
+        StreamingScaler
+            The merged scaler
+        """
+
+        if other.method != self.method:
+            raise ValueError("Can only merge scalers that use the same method.")
+
+        if other.n_samples_seen_ is None:
+            return self
+
+        if self.n_samples_seen_ is None:
+            self.__dict__.update(
+                {
+                    key: (val.copy() if isinstance(val, np.ndarray) else val)
+                    for key, val in other.__dict__.items()
+                }
+            )
+            self.sketches_ = [
+                QuantileSketch(self.sketch_size).merge(sketch)
+                for sketch in other.sketches_
+            ]
+
+            return self
+
+        if self.method == "minmax":
+            self.data_min_ = np.fmin(self.data_min_, other.data_min_)
+            self.data_max_ = np.fmax(self.data_max_, other.data_max_)
+        elif self.method == "standard":
+            self._combine_moments(other.n_samples_seen_, other.mean_, other.m2_)
+        else:
+            for sketch, other_sketch in zip(self.sketches_, other.sketches_):
+                sketch.merge(other_sketch)
+
+        if self.method != "standard":
+            self.n_samples_seen_ = self.n_samples_seen_ + other.n_samples_seen_
+
+        return self
+
+    def transform(self, X, dtype=None, chunksize=None):
+        """
+        Scales data with the fitted statistics.
+
+        Parameters
+        ----------
+        X : Dataframe or array like - 2d
+            Data to scale
+
+        dtype : numpy dtype, optional
+            Output dtype (i.e. np.float32), by default float64
+
+        chunksize : int, optional
+            Number of rows to scale at a time, by default all rows at once
+
+        Returns
+        -------
+        ndarray
+            Scaled data
+        """
+
+        if self.n_samples_seen_ is None:
+            raise ValueError("Scaler has not been fit yet.")
+
+        X = np.asarray(X)
+        dtype = np.dtype(dtype or np.float64)
+        scale, offset = self._scale_offset()
+        scale = scale.astype(dtype)
+        offset = offset.astype(dtype)
+
+        out = np.empty(X.shape, dtype=dtype)
+        start = 0
+
+        for chunk in _iter_chunks(X, chunksize):
+            stop = start + chunk.shape[0]
+            block = out[start:stop]
+            block[...] = chunk
+            np.multiply(block, scale, out=block)
+            np.add(block, offset, out=block)
+            start = stop
+
+        return out
+
+    def fit_transform(self, X, dtype=None, chunksize=None):
+        """Fits the scaler over `X` and returns the scaled data."""
+
+        return self.fit(X, chunksize=chunksize).transform(
+            X, dtype=dtype, chunksize=chunksize
+        )
+
+    def _combine_moments(self, counts, means, m2):
+        """Combines running moments with the moments of another chunk (Chan et al.)."""
+
+        total = self.n_samples_seen_ + counts
+        delta = means - self.mean_
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(total > 0, counts / total, 0)
+
+        self.mean_ = self.mean_ + delta * ratio
+        self.m2_ = self.m2_ + m2 + delta ** 2 * self.n_samples_seen_ * ratio
+        self.n_samples_seen_ = total
+
+    def _scale_offset(self):
+        """Returns `scale` and `offset` such that `X * scale + offset` is the scaled data."""
+
+        if self.method == "minmax":
+            data_range = _handle_zeros(self.data_max_ - self.data_min_)
+            low, high = self.feature_range
+            scale = (high - low) / data_range
+            offset = low - self.data_min_ * scale
+        elif self.method == "standard":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                var = np.where(
+                    self.n_samples_seen_ > 0, self.m2_ / self.n_samples_seen_, 0
+                )
+
+            center = self.mean_ if self.with_mean else np.zeros_like(self.mean_)
+            scale = 1 / _handle_zeros(np.sqrt(var)) if self.with_std else np.ones_like(var)
+            offset = -center * scale
+        else:
+            low, high = self.quantile_range
+            quantiles = np.array(
+                [
+                    sketch.quantile([low / 100, 0.5, high / 100])
+                    for sketch in self.sketches_
+                ]
+            ).reshape(-1, 3)
+
+            center = quantiles[:, 1] if self.with_centering else np.zeros(len(quantiles))
+            scale = (
+                1 / _handle_zeros(quantiles[:, 2] - quantiles[:, 0])
+                if self.with_scaling
+                else np.ones(len(quantiles))
+            )
+            offset = -center * scale
+
+        return scale, offset
 
 
 def scale(
@@ -11,6 +314,8 @@ def scale(
     list_of_cols=[],
     method="minmax",
     keep_col=False,
+    chunksize=None,
+    dtype=None,
     **algo_kwargs
 ):
     """
@@ -20,7 +325,7 @@ def scale(
     ----------
     x_train : DataFrame
         Dataset
-        
+
     x_test : DataFrame
         Testing dataset, by default None
 
@@ -35,30 +340,185 @@ def scale(
     keep_col : bool, optional
         True to not remove the columns, by default False
 
+    chunksize : int, optional
+        If provided, fit a `StreamingScaler` over chunks of this many rows
+        instead of the Scikit-Learn scaler, by default None
+
+    dtype : numpy dtype, optional
+        Output dtype of the scaled columns (i.e. np.float32), by default float64
+
     algo_kwargs : optional
         Parmaters to pass into the scaler constructor
         from Scikit-Learn, by default {}
-    
+
     Returns
     -------
-    Dataframe, *Dataframe
-        Transformed dataframe with rows normalized.
+    Dataframe, *Dataframe, Scaler
+        Transformed dataframe with rows normalized and the fitted scaler.
 
-    Returns 2 Dataframes if x_test is provided. 
+    Returns 2 Dataframes if x_test is provided.
     """
 
     list_of_cols = _numeric_input_conditions(list_of_cols, x_train)
-    scaler = SCALER[method](**algo_kwargs)
 
-    scaled_data = scaler.fit_transform(x_train[list_of_cols])
-    scaled_df = pd.DataFrame(scaled_data, columns=list_of_cols)
+    if chunksize:
+        scaler = StreamingScaler(method=method, **algo_kwargs)
+        scaler.fit(x_train[list_of_cols], chunksize=chunksize)
+        transform = lambda df: scaler.transform(df, dtype=dtype, chunksize=chunksize)
+
+        scaled_data = transform(x_train[list_of_cols])
+    else:
+        scaler = SCALER[method](**algo_kwargs)
+        transform = lambda df: scaler.transform(df).astype(dtype or np.float64, copy=False)
+
+        scaled_data = scaler.fit_transform(x_train[list_of_cols]).astype(
+            dtype or np.float64, copy=False
+        )
+
+    scaled_df = pd.DataFrame(scaled_data, columns=list_of_cols, index=x_train.index)
     x_train = drop_replace_columns(x_train, list_of_cols, scaled_df, keep_col=keep_col)
 
     if x_test is not None:
-        scaled_x_test = scaler.transform(x_test[list_of_cols])
-        scaled_test_df = pd.DataFrame(scaled_x_test, columns=list_of_cols)
+        scaled_x_test = transform(x_test[list_of_cols])
+        scaled_test_df = pd.DataFrame(
+            scaled_x_test, columns=list_of_cols, index=x_test.index
+        )
         x_test = drop_replace_columns(
             x_test, list_of_cols, scaled_test_df, keep_col=keep_col
         )
 
-    return x_train, x_test
+    return x_train, x_test, scaler
+
+
+def log_scale(
+    x_train, x_test=None, list_of_cols=[], base=None, method="log", dtype=None
+):
+    """
+    Scales data logarithmically.
+
+    All columns are transformed together as a single 2d block, in place, with one ufunc call.
+
+    Parameters
+    ----------
+    x_train : DataFrame
+        Dataset
+
+    x_test : DataFrame
+        Testing dataset, by default None
+
+    list_of_cols : list, optional
+        A list of specific columns to apply this technique to
+        If `list_of_cols` is not provided, the strategy will be
+        applied to all numeric columns, by default []
+
+    base : int, optional
+        Base of the logarithm, 2, 10 or natural log otherwise, by default None
+
+    method : str {'log', 'log1p', 'shift'}, optional
+        'log' : log(x), values <= 0 become -inf or NaN.
+        'log1p' : log(1 + x), columns with values <= -1 are shifted so their minimum is 0.
+        'shift' : log(x), columns with values <= 0 are shifted so their minimum is 1.
+        by default 'log'
+
+    dtype : numpy dtype, optional
+        Output dtype (i.e. np.float32), by default float64
+
+    Returns
+    -------
+    Dataframe, *Dataframe, dict
+        Transformed dataframe, and a dict of the columns whose values were out of the
+        log domain in the training set mapped to the shift applied to them.
+
+    Returns 2 Dataframes if x_test is provided.
+    """
+
+    if method not in {"log", "log1p", "shift"}:
+        raise ValueError("Invalid method, choose from 'log', 'log1p' or 'shift'.")
+
+    list_of_cols = _numeric_input_conditions(list_of_cols, x_train)
+    dtype = np.dtype(dtype or np.float64)
+
+    block = _to_block(x_train[list_of_cols], dtype)
+
+    lower = -1 if method == "log1p" else 0
+    with np.errstate(invalid="ignore"):
+        col_min = np.nanmin(block, axis=0) if block.size else np.empty(0)
+    out_of_domain = col_min <= lower
+
+    shift = np.zeros(len(list_of_cols), dtype=dtype)
+    if method != "log":
+        shift[out_of_domain] = (1 if method == "shift" else 0) - col_min[out_of_domain]
+
+    adjusted = {
+        col: float(col_shift)
+        for col, col_shift, adjust in zip(list_of_cols, shift, out_of_domain)
+        if adjust
+    }
+
+    x_train = _replace_block(x_train, list_of_cols, _log_inplace(block, shift, base, method))
+
+    if x_test is not None:
+        block = _to_block(x_test[list_of_cols], dtype)
+        x_test = _replace_block(
+            x_test, list_of_cols, _log_inplace(block, shift, base, method)
+        )
+
+    return x_train, x_test, adjusted
+
+
+def _log_inplace(block, shift, base, method):
+    """Shifts and takes the log of a 2d block, writing into the block itself."""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if shift.any():
+            np.add(block, shift, out=block)
+
+        if method == "log1p":
+            np.log1p(block, out=block)
+
+            if base in (2, 10):
+                np.divide(block, np.log(base), out=block)
+        else:
+            LOG.get(base, np.log)(block, out=block)
+
+    return block
+
+
+def _to_block(df, dtype):
+    """Copies dataframe columns into a single column-major 2d block."""
+
+    block = np.empty(df.shape, dtype=dtype, order="F")
+    block[...] = df.to_numpy()
+
+    return block
+
+
+def _replace_block(df, list_of_cols, block):
+    """Returns a copy of `df` where `list_of_cols` hold the columns of `block`, positions are kept."""
+
+    df = df.copy(deep=False)
+
+    for i, col in enumerate(list_of_cols):
+        df[col] = block[:, i]
+
+    return df
+
+
+def _iter_chunks(X, chunksize=None):
+    """Yields row chunks of `X`, all of `X` at once if no chunksize is provided."""
+
+    if not chunksize:
+        yield X
+        return
+
+    for start in range(0, X.shape[0], chunksize):
+        yield X[start : start + chunksize]
+
+
+def _handle_zeros(scale):
+    """Sets zero (constant feature) or undefined scales to 1 to avoid dividing by 0."""
+
+    scale = np.array(scale, dtype=np.float64)
+    scale[(scale == 0) | ~np.isfinite(scale)] = 1.0
+
+    return scale
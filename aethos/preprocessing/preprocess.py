@@ -1,9 +1,9 @@
+import re
 import string
 import pandas as pd
 import numpy as np
 
 from functools import partial
-from nltk import sent_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 from nltk.stem.snowball import PorterStemmer, SnowballStemmer
@@ -13,6 +13,7 @@ from aethos.preprocessing import numeric, text
 
 from aethos.util import (
     _input_columns,
+    _map_unique,
     _numeric_input_conditions,
 )
 
@@ -22,7 +23,9 @@ NLTK_LEMMATIZERS = {"wordnet": WordNetLemmatizer()}
 
 
 class Preprocess(object):
-    def normalize_numeric(self, *list_args, list_of_cols=[], **normalize_params):
+    def normalize_numeric(
+        self, *list_args, list_of_cols=[], chunksize=None, dtype=None, **normalize_params
+    ):
         """
         Function that normalizes all numeric values between 2 values to bring features into same domain.
         
@@ -43,6 +46,13 @@ class Preprocess(object):
         feature_range : tuple(int or float, int or float), optional
             Min and max range to normalize values to, by default (0, 1)
 
+        chunksize : int, optional
+            If provided, the min and max are computed incrementally over chunks of this many rows
+            so the data is never scaled all at once, by default None
+
+        dtype : numpy dtype, optional
+            Output dtype of the normalized columns (i.e. np.float32), by default float64
+
         normalize_params : dict, optional
             Parmaters to pass into MinMaxScaler() constructor from Scikit-Learn
         
@@ -55,21 +65,96 @@ class Preprocess(object):
         --------
         >>> data.normalize_numeric('col1')
         >>> data.normalize_numeric(['col1', 'col2'])
+        >>> data.normalize_numeric(chunksize=100000, dtype=np.float32)
+        >>> data.fitted_transformers['normalize_numeric'].transform(new_data)
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        self.train_data, self.test_data = numeric.scale(
+        (
+            self.train_data,
+            self.test_data,
+            self.fitted_transformers["normalize_numeric"],
+        ) = numeric.scale(
             x_train=self.train_data,
             x_test=self.test_data,
             list_of_cols=list_of_cols,
             method="minmax",
+            chunksize=chunksize,
+            dtype=dtype,
             **normalize_params,
         )
 
         return self
 
-    def normalize_quantile_range(self, *list_args, list_of_cols=[], **robust_params):
+    def normalize_standard(
+        self, *list_args, list_of_cols=[], chunksize=None, dtype=None, **standard_params
+    ):
+        """
+        Standardize features by removing the mean and scaling to unit variance.
+
+        If `list_of_cols` is not provided, the strategy will be applied to all numeric columns.
+
+        If a list of columns is provided use the list, otherwise use arguments.
+
+        For more info please see: https://scikit-learn.org/stable/modules/generated/sklearn.preprocessing.StandardScaler.html
+
+        Parameters
+        ----------
+        list_args : str(s), optional
+            Specific columns to apply this technique to.
+
+        list_of_cols : list, optional
+            A list of specific columns to apply this technique to., by default []
+
+        with_mean : boolean, True by default
+            If True, center the data before scaling.
+
+        with_std : boolean, True by default
+            If True, scale the data to unit variance.
+
+        chunksize : int, optional
+            If provided, the mean and variance are computed incrementally (Welford) over chunks
+            of this many rows, by default None
+
+        dtype : numpy dtype, optional
+            Output dtype of the standardized columns (i.e. np.float32), by default float64
+
+        standard_params : dict, optional
+            Parmaters to pass into StandardScaler() constructor from Scikit-Learn
+
+        Returns
+        -------
+        Data:
+            Returns a deep copy of the Data object.
+
+        Examples
+        --------
+        >>> data.normalize_standard('col1')
+        >>> data.normalize_standard(['col1', 'col2'], chunksize=100000)
+        """
+
+        list_of_cols = _input_columns(list_args, list_of_cols)
+
+        (
+            self.train_data,
+            self.test_data,
+            self.fitted_transformers["normalize_standard"],
+        ) = numeric.scale(
+            x_train=self.train_data,
+            x_test=self.test_data,
+            list_of_cols=list_of_cols,
+            method="standard",
+            chunksize=chunksize,
+            dtype=dtype,
+            **standard_params,
+        )
+
+        return self
+
+    def normalize_quantile_range(
+        self, *list_args, list_of_cols=[], chunksize=None, dtype=None, **robust_params
+    ):
         """
         Scale features using statistics that are robust to outliers.
 
@@ -106,6 +191,13 @@ class Preprocess(object):
         quantile_range : tuple (q_min, q_max), 0.0 < q_min < q_max < 100.0
             Default: (25.0, 75.0) = (1st quantile, 3rd quantile) = IQR Quantile range used to calculate scale_.
 
+        chunksize : int, optional
+            If provided, the median and quantile range are estimated with mergeable quantile sketches
+            built over chunks of this many rows, by default None
+
+        dtype : numpy dtype, optional
+            Output dtype of the scaled columns (i.e. np.float32), by default float64
+
         robust_params : dict, optional
             Parmaters to pass into MinMaxScaler() constructor from Scikit-Learn
         
@@ -122,21 +214,35 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        self.train_data, self.test_data = numeric.scale(
+        (
+            self.train_data,
+            self.test_data,
+            self.fitted_transformers["normalize_quantile_range"],
+        ) = numeric.scale(
             x_train=self.train_data,
             x_test=self.test_data,
             list_of_cols=list_of_cols,
             method="robust",
+            chunksize=chunksize,
+            dtype=dtype,
             **robust_params,
         )
 
         return self
 
-    def normalize_log(self, *list_args, list_of_cols=[], base=1):
+    def normalize_log(
+        self, *list_args, list_of_cols=[], base=1, method="log", dtype=None
+    ):
         """
         Scales data logarithmically.
 
         Options are 1 for natural log, 2 for base2, 10 for base10.
+
+        Values outside of the log domain become -inf or NaN unless `method` is 'log1p' or 'shift',
+        in which case the offending columns are shifted (using the training data) before the log is taken.
+        Columns that had values outside of the log domain are reported.
+
+        If `list_of_cols` is not provided, the strategy will be applied to all numeric columns.
         
         Parameters
         ----------
@@ -148,6 +254,15 @@ class Preprocess(object):
 
         base : str, optional
             Base to logarithmically scale by, by default ''
+
+        method : str {'log', 'log1p', 'shift'}, optional
+            'log' : log(x)
+            'log1p' : log(1 + x), columns with values <= -1 are shifted so their minimum is 0
+            'shift' : log(x), columns with values <= 0 are shifted so their minimum is 1
+            by default 'log'
+
+        dtype : numpy dtype, optional
+            Output dtype of the scaled columns (i.e. np.float32), by default float64
         
         Returns
         -------
@@ -158,34 +273,54 @@ class Preprocess(object):
         --------
         >>> data.normalize_log('col1')
         >>> data.normalize_log(['col1', 'col2'], base=10)
+        >>> data.normalize_log(method='log1p', dtype=np.float32)
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        list_of_cols = _numeric_input_conditions(list_of_cols, self.x_train)
+        list_of_cols = _numeric_input_conditions(list_of_cols, self.train_data)
 
-        if not base:
-            log = np.log
-        elif base == 2:
-            log = np.log2
-        elif base == 10:
-            log = np.log10
-        else:
-            log = np.log
+        self.x_train, self.x_test, adjusted = numeric.log_scale(
+            x_train=self.x_train,
+            x_test=self.x_test,
+            list_of_cols=list_of_cols,
+            base=base,
+            method=method,
+            dtype=dtype,
+        )
 
-        for col in list_of_cols:
-            self.x_train[col] = log(self.x_train[col])
+        for col, shift in adjusted.items():
+            if method == "log":
+                print(f"{col} has values <= 0, the log of these values is -inf or NaN.")
+            else:
+                print(f"{col} was shifted by {shift:g} to fit the log domain.")
 
-            if self.x_test is not None:
-                self.x_test[col] = log(self.x_test[col])
+        self.fitted_transformers["normalize_log"] = {
+            "base": base,
+            "method": method,
+            "shift": adjusted,
+        }
 
         return self
 
-    def split_sentences(self, *list_args, list_of_cols=[], new_col_name="_sentences"):
+    def split_sentences(
+        self,
+        *list_args,
+        list_of_cols=[],
+        method="punkt",
+        offsets=False,
+        new_col_name="_sentences",
+    ):
         """
         Splits text data into sentences and saves it into another column for analysis.
 
         If a list of columns is provided use the list, otherwise use arguments.
+
+        If `offsets` is True, no column is created. Instead the sentences are stored as
+        offsets, a Dataframe with one row per sentence holding the position of its document and its start and end character,
+        in `sentence_offsets[new_col_name]` for the train and test set.
+        This is far more compact than a column of lists of strings, the sentences can be created when needed with
+        `aethos.preprocessing.text.explode_sentences`.
         
         Parameters
         ----------
@@ -195,6 +330,14 @@ class Preprocess(object):
         list_of_cols : list, optional
             A list of specific columns to apply this technique to., by default []
 
+        method : str {'punkt', 'rule'}, optional
+            'punkt' uses the NLTK Punkt sentence tokenizer.
+            'rule' splits on terminal punctuation followed by whitespace, faster but less accurate.
+            by default 'punkt'
+
+        offsets : bool, optional
+            True to store sentence offsets instead of a column of sentences, by default False
+
         new_col_name : str, optional
             New column name to be created when applying this technique, by default `COLUMN_sentences`
 
@@ -207,6 +350,8 @@ class Preprocess(object):
         --------
         >>> data.split_sentences('col1')
         >>> data.split_sentences(['col1', 'col2'])
+        >>> data.split_sentences('col1', method='rule', offsets=True)
+        >>> text.explode_sentences(data.x_train['col1'], data.sentence_offsets['col1_sentences']['train'])
         """
 
         list_of_cols = _input_columns(list_args, list_of_cols)
@@ -215,14 +360,23 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(
-                map(sent_tokenize, self.x_train[col])
-            )
-            if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(
-                    map(sent_tokenize, self.x_test[col])
+            if offsets:
+                self.sentence_offsets[new_col_name] = {
+                    "train": text.sentence_offsets(self.x_train[col], method=method),
+                    "test": text.sentence_offsets(self.x_test[col], method=method)
+                    if self.x_test is not None
+                    else None,
+                }
+            else:
+                self.x_train[new_col_name] = text.split_sentences(
+                    self.x_train[col], method=method
                 )
 
+                if self.x_test is not None:
+                    self.x_test[new_col_name] = text.split_sentences(
+                        self.x_test[col], method=method
+                    )
+
         return self
 
     def stem_nltk(
@@ -276,10 +430,14 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(map(func, self.x_train[col]))
+            self.x_train[new_col_name] = text.text_column(
+                _map_unique(func, self.x_train[col]), index=self.x_train.index
+            )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(map(func, self.x_test[col]))
+                self.x_test[new_col_name] = text.text_column(
+                    _map_unique(func, self.x_test[col]), index=self.x_test.index
+                )
 
         return self
 
@@ -324,24 +482,12 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            if not regexp:
-                self.x_train[new_col_name] = pd.Series(
-                    map(word_tokenize, self.x_train[col])
-                )
+            tokenize = tokenizer.tokenize if regexp else word_tokenize
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = pd.Series(
-                        map(word_tokenize, self.x_test[col])
-                    )
-            else:
-                self.x_train[new_col_name] = pd.Series(
-                    map(tokenizer.tokenize, self.x_train[col])
-                )
+            self.x_train[new_col_name] = _map_unique(tokenize, self.x_train[col])
 
-                if self.x_test is not None:
-                    self.x_test[new_col_name] = pd.Series(
-                        map(tokenizer.tokenize, self.x_test[col])
-                    )
+            if self.x_test is not None:
+                self.x_test[new_col_name] = _map_unique(tokenize, self.x_test[col])
 
         return self
 
@@ -385,36 +531,27 @@ class Preprocess(object):
         stop_words = stopwords.words("english")
         stop_words.extend(custom_stopwords)
         stop_list = set(stop_words)
+        remove_stopwords = lambda x: " ".join(
+            [word for word in word_tokenize(x) if word not in stop_list]
+        )
 
         for col in list_of_cols:
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = list(
-                map(
-                    lambda x: " ".join(
-                        [
-                            word
-                            for word in word_tokenize(x.lower())
-                            if word not in stop_list
-                        ]
-                    ),
-                    self.x_train[col],
-                )
+            self.x_train[new_col_name] = text.text_column(
+                _map_unique(
+                    remove_stopwords, text.as_text(self.x_train[col]).str.lower()
+                ),
+                index=self.x_train.index,
             )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = list(
-                    map(
-                        lambda x: " ".join(
-                            [
-                                word
-                                for word in word_tokenize(x.lower())
-                                if word not in stop_list
-                            ]
-                        ),
-                        self.x_test[col],
-                    )
+                self.x_test[new_col_name] = text.text_column(
+                    _map_unique(
+                        remove_stopwords, text.as_text(self.x_test[col]).str.lower()
+                    ),
+                    index=self.x_test.index,
                 )
 
         return self
@@ -468,7 +605,8 @@ class Preprocess(object):
 
         list_of_cols = _input_columns(list_args, list_of_cols)
 
-        delete_punct = set(string.punctuation) - set(exceptions)
+        delete_punct = "".join(sorted(set(string.punctuation) - set(exceptions)))
+        punct_regexp = f"[{re.escape(delete_punct)}]" if delete_punct else "(?!)"
         tokenizer = RegexpTokenizer(regexp)
 
         for col in list_of_cols:
@@ -476,32 +614,26 @@ class Preprocess(object):
                 new_col_name = col + new_col_name
 
             if not regexp:
-                self.x_train[new_col_name] = list(
-                    map(
-                        lambda x: "".join(
-                            [letter for letter in x if letter not in delete_punct]
-                        ),
-                        self.x_train[col],
-                    )
-                )
+                self.x_train[new_col_name] = text.as_text(
+                    self.x_train[col]
+                ).str.replace(punct_regexp, "", regex=True)
 
                 if self.x_test is not None:
-                    self.x_test[new_col_name] = list(
-                        map(
-                            lambda x: "".join(
-                                [letter for letter in x if letter not in delete_punct]
-                            ),
-                            self.x_test[col],
-                        )
-                    )
+                    self.x_test[new_col_name] = text.as_text(
+                        self.x_test[col]
+                    ).str.replace(punct_regexp, "", regex=True)
             else:
-                self.x_train[new_col_name] = list(
-                    map(lambda x: " ".join(tokenizer.tokenize(x)), self.x_train[col])
+                keep_tokens = lambda x: " ".join(tokenizer.tokenize(x))
+
+                self.x_train[new_col_name] = text.text_column(
+                    _map_unique(keep_tokens, self.x_train[col]),
+                    index=self.x_train.index,
                 )
 
                 if self.x_test is not None:
-                    self.x_test[new_col_name] = list(
-                        map(lambda x: " ".join(tokenizer.tokenize(x)), self.x_test[col])
+                    self.x_test[new_col_name] = text.text_column(
+                        _map_unique(keep_tokens, self.x_test[col]),
+                        index=self.x_test.index,
                     )
 
         return self
@@ -537,20 +669,14 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = pd.Series(
-                map(
-                    lambda x: str.translate(x, str.maketrans("", "", "0123456789")),
-                    self.x_train[col],
-                )
+            self.x_train[new_col_name] = text.as_text(self.x_train[col]).str.replace(
+                "[0-9]", "", regex=True
             )
 
             if self.x_test is not None:
-                self.x_test[new_col_name] = pd.Series(
-                    map(
-                        lambda x: str.translate(x, str.maketrans("", "", "0123456789")),
-                        self.x_test[col],
-                    )
-                )
+                self.x_test[new_col_name] = text.as_text(
+                    self.x_test[col]
+                ).str.replace("[0-9]", "", regex=True)
 
         return self
 
@@ -618,33 +744,57 @@ class Preprocess(object):
             if new_col_name.startswith("_"):
                 new_col_name = col + new_col_name
 
-            self.x_train[new_col_name] = [
-                text.process_text(
-                    txt,
+            self.x_train[new_col_name] = self._clean_text_column(
+                self.x_train[col],
+                lower=lower,
+                punctuation=punctuation,
+                stopwords=stopwords,
+                stemmer=stemmer,
+                numbers=numbers,
+            )
+
+            if self.x_test is not None:
+                self.x_test[new_col_name] = self._clean_text_column(
+                    self.x_test[col],
                     lower=lower,
                     punctuation=punctuation,
                     stopwords=stopwords,
                     stemmer=stemmer,
                     numbers=numbers,
                 )
-                for txt in self.x_train[col]
-            ]
-
-            if self.x_test is not None:
-                self.x_test[new_col_name] = [
-                    text.process_text(
-                        txt,
-                        lower=lower,
-                        punctuation=punctuation,
-                        stopwords=stopwords,
-                        stemmer=stemmer,
-                        numbers=numbers,
-                    )
-                    for txt in self.x_test[col]
-                ]
 
         return self
 
+    def _clean_text_column(self, column, lower=True, **process_kwargs):
+        """
+        Runs `text.process_text` over a text column.
+
+        Lowercasing is done once for the whole column with the (Arrow backed if enabled) `.str` accessor.
+
+        Parameters
+        ----------
+        column : Series
+            Text column
+
+        lower : bool, optional
+            True to cast all text to lowercase, by default True
+
+        Returns
+        -------
+        Series
+            Cleaned text column
+        """
+
+        if lower:
+            column = text.as_text(column).str.lower()
+
+        return text.text_column(
+            _map_unique(
+                partial(text.process_text, lower=False, **process_kwargs), column
+            ),
+            index=column.index,
+        )
+
     def _apply_text_method(self, text_data, transformer=None):
         """
         Applies a text based method to the given data, for example
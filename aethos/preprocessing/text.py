@@ -1,3 +1,63 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from aethos.config.config import _global_config
+from aethos.util import _map_unique
+
+# A sentence runs up to terminal punctuation (and any closing quotes/brackets) followed by whitespace
+SENTENCE_PATTERN = re.compile(r"\S.*?(?:[.!?]+[\"')\]]*(?=\s|$)|$)", re.DOTALL)
+
+
+def text_column(values, index=None):
+    """
+    Creates a text column stored with the dtype set by the `text_dtype` option.
+
+    Parameters
+    ----------
+    values : iterable of str
+        Text values
+
+    index : Index, optional
+        Index of the column, by default None
+
+    Returns
+    -------
+    Series
+        Text column
+    """
+
+    dtype = _global_config["text_dtype"]
+
+    return pd.Series(values, index=index, dtype=None if dtype == "object" else dtype)
+
+
+def as_text(column):
+    """
+    Casts a text column to the dtype set by the `text_dtype` option, so `.str` methods
+    run on Arrow buffers instead of Python objects when 'string[pyarrow]' is used.
+
+    Parameters
+    ----------
+    column : Series
+        Text column
+
+    Returns
+    -------
+    Series
+        Text column
+    """
+
+    dtype = _global_config["text_dtype"]
+
+    if dtype == "object" or column.dtype == dtype:
+        return column
+
+    return column.astype(dtype)
+
+
 def process_text(
     corpus, lower=True, punctuation=True, stopwords=True, stemmer=True, numbers=True,
 ):
@@ -69,3 +129,121 @@ def process_text(
         transformed_corpus += token + " "
 
     return transformed_corpus.strip()
+
+
+def sentence_offsets(corpus, method="punkt"):
+    """
+    Splits every document of a corpus into sentences and returns the sentence boundaries.
+
+    Parameters
+    ----------
+    corpus : Series or iterable of str
+        Documents to split
+
+    method : str {'punkt', 'rule'}, optional
+        'punkt' uses the NLTK Punkt model, loaded once and reused for every document.
+        'rule' uses a regex that splits on terminal punctuation followed by whitespace, much faster than Punkt.
+        by default 'punkt'
+
+    Returns
+    -------
+    Dataframe
+        One row per sentence with the position of its document (`doc`)
+        and the `start` and `end` character offsets of the sentence in that document.
+    """
+
+    if method == "punkt":
+        span_tokenize = _punkt_tokenizer().span_tokenize
+    elif method == "rule":
+        span_tokenize = lambda doc: (m.span() for m in SENTENCE_PATTERN.finditer(doc))
+    else:
+        raise ValueError("Invalid method, choose from 'punkt' or 'rule'.")
+
+    docs, starts, ends = [], [], []
+
+    for doc_id, doc in enumerate(corpus):
+        spans = list(span_tokenize(doc))
+
+        docs.extend([doc_id] * len(spans))
+        starts.extend(start for start, _ in spans)
+        ends.extend(end for _, end in spans)
+
+    return pd.DataFrame(
+        {
+            "doc": np.array(docs, dtype=np.int64),
+            "start": np.array(starts, dtype=np.int32),
+            "end": np.array(ends, dtype=np.int32),
+        }
+    )
+
+
+def explode_sentences(corpus, offsets):
+    """
+    Materializes the sentences described by `sentence_offsets`, one row per sentence.
+
+    Parameters
+    ----------
+    corpus : Series
+        Documents the offsets were computed on
+
+    offsets : Dataframe
+        Output of `sentence_offsets`, or a slice of it
+
+    Returns
+    -------
+    Series
+        Sentences indexed by the index label of their document
+    """
+
+    texts = corpus.to_numpy()
+
+    return pd.Series(
+        [
+            texts[doc][start:end]
+            for doc, start, end in zip(offsets["doc"], offsets["start"], offsets["end"])
+        ],
+        index=corpus.index[offsets["doc"].to_numpy()],
+        dtype=object,
+    )
+
+
+def split_sentences(corpus, method="punkt"):
+    """
+    Splits every document of a corpus into a list of sentences.
+
+    Parameters
+    ----------
+    corpus : Series or iterable of str
+        Documents to split
+
+    method : str {'punkt', 'rule'}, optional
+        Sentence splitter to use, see `sentence_offsets`, by default 'punkt'
+
+    Returns
+    -------
+    ndarray
+        List of sentences for every document
+    """
+
+    if method == "punkt":
+        tokenize = _punkt_tokenizer().tokenize
+    elif method == "rule":
+        tokenize = lambda doc: [m.group() for m in SENTENCE_PATTERN.finditer(doc)]
+    else:
+        raise ValueError("Invalid method, choose from 'punkt' or 'rule'.")
+
+    return _map_unique(tokenize, corpus)
+
+
+@lru_cache(maxsize=None)
+def _punkt_tokenizer(language="english"):
+    """Loads the Punkt sentence tokenizer once per process."""
+
+    try:
+        from nltk.tokenize import PunktTokenizer
+
+        return PunktTokenizer(language)
+    except ImportError:  # pragma: no cover
+        import nltk
+
+        return nltk.data.load(f"tokenizers/punkt/{language}.pickle")
@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+
+
+class CorrelationEngine(object):
+    """
+    Pearson correlations of the numeric columns of a dataset, computed in column blocks.
+
+    The data is standardized once into a float32 block Z scaled so that Z^T Z is the correlation
+    matrix, correlations are then blocks of Z^T Z computed with BLAS matrix multiplications.
+
+    Missing values are filled with the column mean after standardizing and constant columns have a
+    correlation of 0 with every other column.
+
+    Z takes 4 bytes per value of the numeric columns, dropped columns included, and is kept to prune
+    columns at other thresholds. Once the full correlation matrix is computed, Z is released and the
+    correlations are read from the cached matrix.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Dataset, only the numeric and boolean columns are used
+
+    block_size : int, optional
+        Number of columns correlated at a time, by default 1024
+    """
+
+    def __init__(self, df, block_size=1024):
+
+        numeric = df.select_dtypes([np.number, "bool"])
+
+        self.block_size = block_size
+        self.columns = numeric.columns.tolist()
+        self.positions = {col: i for i, col in enumerate(self.columns)}
+        self.fingerprints = _fingerprints(numeric)
+        self._matrix = None
+
+        X = numeric.to_numpy(dtype=np.float64)
+        mean = np.nanmean(X, axis=0) if X.size else np.zeros(X.shape[1])
+        std = np.nanstd(X, axis=0) if X.size else np.zeros(X.shape[1])
+        scale = np.where(std > 0, std * np.sqrt(len(X)), np.inf)
+
+        Z = (X - mean) / scale
+        Z[np.isnan(Z)] = 0
+
+        self.Z = np.asfortranarray(Z, dtype=np.float32)
+
+    def matrix(self, columns=None):
+        """
+        Correlation matrix, computed block by block and cached.
+
+        Parameters
+        ----------
+        columns : list, optional
+            Columns to return, by default all the numeric columns
+
+        Returns
+        -------
+        Dataframe
+            Correlation matrix
+        """
+
+        if self._matrix is None:
+            p = len(self.columns)
+            matrix = np.empty((p, p), dtype=np.float32)
+
+            for start in range(0, p, self.block_size):
+                stop = min(start + self.block_size, p)
+                matrix[:, start:stop] = self.Z.T @ self.Z[:, start:stop]
+
+            np.fill_diagonal(matrix, 1)
+            self._matrix = pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+            # Every correlation is in the matrix now
+            self.Z = None
+
+        if columns is None:
+            return self._matrix
+
+        return self._matrix.loc[columns, columns]
+
+    def correlated_features(self, threshold=0.95, columns=None):
+        """
+        Greedily selects columns to drop so that no two kept columns have an absolute correlation above the threshold.
+
+        Columns are scanned in order, a column is dropped if it is correlated with a column kept before it.
+        Only the correlations of a block of columns with a block of the kept columns before it are held at a time.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Absolute correlation threshold, by default 0.95
+
+        columns : list, optional
+            Columns to consider, by default all the numeric columns
+
+        Returns
+        -------
+        list
+            Columns to drop
+        """
+
+        index = (
+            np.arange(len(self.columns))
+            if columns is None
+            else np.array([self.positions[col] for col in columns], dtype=np.intp)
+        )
+        p = len(index)
+        keep = np.zeros(p, dtype=bool)
+
+        for start in range(0, p, self.block_size):
+            stop = min(start + self.block_size, p)
+            block = index[start:stop]
+
+            # Correlation of the block with the kept columns before it, then within the block
+            prev = index[np.flatnonzero(keep[:start])]
+            correlated = np.zeros(stop - start, dtype=bool)
+            for prev_start in range(0, len(prev), self.block_size):
+                prev_block = prev[prev_start : prev_start + self.block_size]
+                correlated |= (
+                    np.abs(self._correlations(prev_block, block)) > threshold
+                ).any(axis=0)
+
+            within = np.abs(self._correlations(block, block)) > threshold
+
+            for j in range(stop - start):
+                kept_before = np.flatnonzero(keep[start : start + j])
+
+                if not correlated[j] and not within[kept_before, j].any():
+                    keep[start + j] = True
+
+        return [self.columns[i] for i in index[~keep]]
+
+    def _correlations(self, rows, cols):
+        """Correlations between the columns at positions `rows` and `cols`."""
+
+        if self.Z is None:
+            return self._matrix.to_numpy()[np.ix_(rows, cols)]
+
+        return _take_columns(self.Z, rows).T @ _take_columns(self.Z, cols)
+
+
+def _take_columns(Z, positions):
+    """Columns of Z at `positions`, a view if they are contiguous."""
+
+    if len(positions) and np.all(np.diff(positions) == 1):
+        return Z[:, positions[0] : positions[-1] + 1]
+
+    return Z[:, positions]
+
+
+def correlation_engine(df, block_size=1024, engine=None):
+    """
+    Returns `engine` if it was built from the numeric columns of df, otherwise builds a new engine.
+
+    Columns are compared by name and a hash of their values, so an engine is also reused for any subset of its columns.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Dataset
+
+    block_size : int, optional
+        Number of columns correlated at a time, by default 1024
+
+    engine : CorrelationEngine, optional
+        Previously built engine, e.g. `fitted_transformers['correlation']`, by default None
+
+    Returns
+    -------
+    CorrelationEngine
+        Engine covering every numeric column of df
+    """
+
+    fingerprints = _fingerprints(df.select_dtypes([np.number, "bool"]))
+
+    if engine is None or any(
+        engine.fingerprints.get(col) != value for col, value in fingerprints.items()
+    ):
+        engine = CorrelationEngine(df, block_size=block_size)
+
+    return engine
+
+
+def _fingerprints(df):
+    """Hash of the values of every column."""
+
+    return {
+        col: (len(df), pd.util.hash_pandas_object(df[col], index=False).sum())
+        for col in df.columns
+    }
@@ -1,11 +1,14 @@
 import collections
+import logging
 import os
 from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+
+logger = logging.getLogger(__name__)
 
 DATA_CHECKLIST = {
     "Convert files to .csv",
@@ -57,6 +60,9 @@ PREPARATION_CHECKLIST = {
 def label_encoder(x_train, x_test=None, list_of_cols=[], target=False):
     """
     Label encodes the columns provided.
+
+    Values are encoded in sorted order, values of the test data not seen in the training data
+    are encoded with a reserved code, the number of categories.
     
     Either the full data or training data plus testing data MUST be provided, not both.
     
@@ -84,23 +90,355 @@ def label_encoder(x_train, x_test=None, list_of_cols=[], target=False):
     Returns 2 Dataframes x_test is provided.  
     """
 
-    label_encode = LabelEncoder()
+    label_encode = CategoryEncoder().fit(x_train[list_of_cols])
     target_mapping = None
 
-    for col in list_of_cols:
-        x_train[col] = label_encode.fit_transform(x_train[col])
+    x_train[list_of_cols] = label_encode.transform(x_train[list_of_cols])
 
-        if x_test is not None:
-            x_test[col] = label_encode.transform(x_test[col])
+    if x_test is not None:
+        x_test[list_of_cols] = label_encode.transform(x_test[list_of_cols])
 
     if target:
-        target_mapping = dict(
-            zip(range(len(label_encode.classes_)), label_encode.classes_)
-        )
+        target_mapping = label_encode.mapping(list_of_cols[-1])
 
     return x_train, x_test, target_mapping
 
 
+class CategoryEncoder(object):
+    """
+    Encodes categorical columns into integer codes.
+
+    The categories of every column are found with `pd.factorize` and kept as a dictionary
+    (an Index) per column. Values are encoded with a vectorized hash lookup into the dictionary,
+    missing values and values not in the dictionary are encoded with a reserved code,
+    the number of categories.
+
+    Codes are stored in the smallest signed integer dtype that holds the reserved code.
+
+    Parameters
+    ----------
+    categories : dict, optional
+        Ordered categories per column, columns not in it are fit on the data, by default {}
+
+    sort : bool, optional
+        True to number the categories in sorted order, False in order of appearance which is faster, by default True
+    """
+
+    def __init__(self, categories={}, sort=True):
+
+        self.categories = categories
+        self.sort = sort
+
+    def fit(self, X):
+        """
+        Builds the dictionary of every column.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        Returns
+        -------
+        CategoryEncoder
+        """
+
+        self.dictionaries_ = {}
+
+        for col in X.columns:
+            if col in self.categories:
+                dictionary = pd.Index(self.categories[col])
+            else:
+                dictionary = pd.Index(pd.factorize(X[col], sort=self.sort)[1])
+
+            self.dictionaries_[col] = dictionary
+
+        return self
+
+    def transform(self, X):
+        """
+        Encodes the categorical columns.
+
+        Parameters
+        ----------
+        X : Dataframe
+            Categorical columns
+
+        Returns
+        -------
+        Dataframe
+            Integer codes
+        """
+
+        encoded = {}
+
+        for col in X.columns:
+            dictionary = self.dictionaries_[col]
+            codes = dictionary.get_indexer(X[col])
+            codes[codes == -1] = len(dictionary)
+
+            encoded[col] = codes.astype(_code_dtype(len(dictionary)))
+
+        return pd.DataFrame(encoded, index=X.index)
+
+    def fit_transform(self, X):
+
+        return self.fit(X).transform(X)
+
+    def inverse_transform(self, codes, col):
+        """
+        Decodes the codes of a column, the reserved code is decoded as NaN.
+
+        Parameters
+        ----------
+        codes : array like
+            Codes of the column
+
+        col : str
+            Column name
+
+        Returns
+        -------
+        ndarray
+            Original values
+        """
+
+        dictionary = self.dictionaries_[col]
+
+        return dictionary.append(pd.Index([np.nan])).take(np.asarray(codes)).to_numpy()
+
+    def mapping(self, col):
+        """
+        Code to category dictionary of a column.
+
+        Parameters
+        ----------
+        col : str
+            Column name
+
+        Returns
+        -------
+        dict
+            Code to category
+        """
+
+        return dict(enumerate(self.dictionaries_[col]))
+
+
+def _code_dtype(max_code):
+    """Smallest signed integer dtype holding codes up to max_code."""
+
+    for dtype in [np.int8, np.int16, np.int32]:
+        if max_code <= np.iinfo(dtype).max:
+            return dtype
+
+    return np.int64
+
+
+class QuantileSketch(object):
+    """
+    Mergeable quantile sketch for a single stream of numeric values.
+
+    Values are kept in a hierarchy of compactors where an item at level `h` represents
+    `2 ** h` original values. When a level grows past `k` items it is sorted and every other
+    item is promoted to the next level, so memory stays at roughly `k * log2(n / k)` values.
+
+    The sketch is exact until more than `k` values have been seen and two sketches built on
+    separate chunks or workers can be combined with `merge`.
+
+    Parameters
+    ----------
+    k : int, optional
+        Capacity of each compactor, by default 2048
+    """
+
+    def __init__(self, k=2048):
+
+        self.k = k
+        self.n = 0
+        self.compactors = [np.empty(0)]
+        self._offsets = [0]
+
+    def update(self, values):
+        """
+        Adds values to the sketch, missing values are ignored.
+
+        Parameters
+        ----------
+        values : array like - 1d
+            Values to add
+
+        Returns
+        -------
+        QuantileSketch
+            The updated sketch
+        """
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+
+        self.n += values.size
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+
+        return self
+
+    def merge(self, other):
+        """
+        Merges another sketch into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch built on another chunk of the data
+
+        Returns
+        -------
+        QuantileSketch
+            The merged sketch
+        """
+
+        for level, items in enumerate(other.compactors):
+            if level >= len(self.compactors):
+                self.compactors.append(np.empty(0))
+                self._offsets.append(0)
+
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+
+        self.n += other.n
+        self._compress()
+
+        return self
+
+    def quantile(self, q):
+        """
+        Estimates quantiles of the values seen so far.
+
+        Parameters
+        ----------
+        q : float or array like
+            Quantile(s) to compute, between 0 and 1
+
+        Returns
+        -------
+        float or ndarray
+            Estimated quantile(s), NaN if the sketch is empty
+        """
+
+        if not self.n:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        values = np.concatenate(self.compactors)
+        weights = np.concatenate(
+            [
+                np.full(items.size, 2.0 ** level)
+                for level, items in enumerate(self.compactors)
+            ]
+        )
+
+        order = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cum_weights = np.cumsum(weights[order])
+        # Centre each item on the span of ranks it represents
+        positions = cum_weights - (weights[order] + 1) / 2
+
+        return np.interp(np.asarray(q) * (cum_weights[-1] - 1), positions, values)
+
+    def _compress(self):
+        """Promotes half of every over capacity compactor to the next level."""
+
+        level = 0
+
+        while level < len(self.compactors):
+            items = self.compactors[level]
+
+            if items.size > self.k:
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                    self._offsets.append(0)
+
+                items = np.sort(items)
+                # Keep the odd item at this level so no weight is lost
+                if items.size % 2:
+                    items, leftover = items[:-1], items[-1:]
+                else:
+                    leftover = np.empty(0)
+
+                # Alternate which half is kept to avoid a systematic bias
+                promoted = items[self._offsets[level] :: 2]
+                self._offsets[level] ^= 1
+
+                self.compactors[level] = leftover
+                self.compactors[level + 1] = np.concatenate(
+                    [self.compactors[level + 1], promoted]
+                )
+
+            level += 1
+
+
+def _map_unique(func, column, batch=False):
+    """
+    Applies a function to every value of a column.
+
+    If the share of duplicated values in the column is at least the `text_dedup_ratio` option,
+    the column is factorized, the function is applied once per distinct value and the results are
+    broadcast back to every row by their codes. List results are copied per row so rows never share a list.
+    The rows, distinct values and share of duplicates of a deduplicated column are logged at the INFO level.
+
+    Parameters
+    ----------
+    func : Function
+        Function applied to each value, or to a list of values if `batch` is True
+
+    column : Series or iterable
+        Values to transform
+
+    batch : bool, optional
+        True if `func` takes a list of values and returns a list of results, by default False
+
+    Returns
+    -------
+    ndarray
+        Object array of results, in the order of `column`
+    """
+
+    from aethos.config.config import _global_config
+
+    values = column if isinstance(column, pd.Series) else pd.Series(list(column))
+    n_rows = len(values)
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    dup_ratio = 1 - len(uniques) / n_rows if n_rows else 0
+
+    if dup_ratio >= _global_config["text_dedup_ratio"] and n_rows:
+        logger.info(
+            "%s: %d distinct values of %d rows, %.0f%% duplicated.",
+            values.name if values.name is not None else "Column",
+            len(uniques),
+            n_rows,
+            dup_ratio * 100,
+        )
+        inputs, take = uniques, codes
+    else:
+        inputs, take = values, None
+
+    results = np.empty(len(inputs), dtype=object)
+    # Filled item by item so list results are not broadcast into a 2d array
+    for i, result in enumerate(func(list(inputs)) if batch else map(func, inputs)):
+        results[i] = result
+
+    if take is None:
+        return results
+
+    broadcast = results[take]
+    if any(isinstance(result, list) for result in results):
+        for i, result in enumerate(broadcast):
+            if isinstance(result, list):
+                broadcast[i] = list(result)
+
+    return broadcast
+
+
 def check_missing_data(df) -> bool:
     """
     Utility function that checks if the data has any missing values.
@@ -171,6 +509,79 @@ def drop_replace_columns(df, drop_cols, new_data, keep_col=False):
     return df
 
 
+def _to_frame(matrix, columns=None, index=None, sparse=False):
+    """
+    Wraps the (sparse) matrix output of a transformer into a Dataframe.
+
+    Parameters
+    ----------
+    matrix : ndarray or scipy sparse matrix
+        Transformer output
+
+    columns : list, optional
+        Column names, by default None
+
+    index : Index, optional
+        Index of the Dataframe, by default None
+
+    sparse : bool, optional
+        True to keep a sparse matrix sparse by storing it as Sparse columns,
+        False to densify it, by default False
+
+    Returns
+    -------
+    Dataframe
+        Transformer output as a Dataframe
+    """
+
+    if sp.issparse(matrix):
+        if sparse:
+            return pd.DataFrame.sparse.from_spmatrix(matrix, index=index, columns=columns)
+
+        matrix = matrix.toarray()
+
+    return pd.DataFrame(matrix, columns=columns, index=index)
+
+
+def _model_input(df):
+    """
+    Returns the data to pass into an estimator.
+
+    If the data has Sparse columns, they are passed as a CSR matrix (stacked with any dense columns)
+    so they never get densified, otherwise the Dataframe is returned as is.
+
+    Parameters
+    ----------
+    df : Dataframe
+        Features
+
+    Returns
+    -------
+    Dataframe or csr_matrix
+        Data for the estimator
+    """
+
+    is_sparse = np.array([isinstance(dtype, pd.SparseDtype) for dtype in df.dtypes])
+
+    if not is_sparse.any():
+        return df
+
+    if is_sparse.all():
+        return df.sparse.to_coo().tocsr()
+
+    blocks = sp.hstack(
+        [
+            sp.csr_matrix(df.loc[:, ~is_sparse].to_numpy(dtype=np.float64)),
+            df.loc[:, is_sparse].sparse.to_coo(),
+        ],
+        format="csr",
+    )
+    # Restore the original column order
+    order = np.argsort(np.concatenate([np.flatnonzero(~is_sparse), np.flatnonzero(is_sparse)]))
+
+    return blocks[:, order]
+
+
 def split_data(df, split_percentage: float, target: str, problem: str):
     """
     Function that splits the data into a training and testing set. Split percentage is passed in through
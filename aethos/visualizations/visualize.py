@@ -258,7 +258,7 @@ class VizCreator(object):
         fig, ax = plt.subplots(figsize=(11, 9))
 
         if hide_mirror:
-            mask = np.zeros_like(df, dtype=np.bool)
+            mask = np.zeros_like(df, dtype=bool)
             mask[np.triu_indices_from(mask)] = True
         else:
             mask = None
@@ -0,0 +1,74 @@
+"""
+Memory and throughput benchmark of text column storage, Python objects vs. Arrow.
+
+Usage: PYTHONPATH=. python benchmarks/text_storage.py [n_rows]
+"""
+
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import aethos as at
+from aethos import Classification
+
+WORDS = np.array(
+    "the quick brown fox jumps over lazy dog order 1234 shipped late refund "
+    "please help, account locked! password reset? item missing. 42 thanks".split()
+)
+
+
+def make_corpus(n_rows, seed=42):
+
+    rng = np.random.RandomState(seed)
+    lengths = rng.randint(5, 30, size=n_rows)
+
+    return pd.Series([" ".join(rng.choice(WORDS, size=length)) for length in lengths])
+
+
+def timed(func):
+
+    start = time.perf_counter()
+    result = func()
+
+    return result, time.perf_counter() - start
+
+
+def run(n_rows, text_dtype):
+
+    at.options.text_dtype = text_dtype
+
+    data = pd.DataFrame({"text": make_corpus(n_rows), "label": 0})
+    data["text"] = data["text"].astype(text_dtype)
+    model = Classification(x_train=data, target="label", x_test=data.copy())
+
+    _, num_secs = timed(lambda: model.remove_numbers("text"))
+    _, punct_secs = timed(lambda: model.remove_punctuation("text_rem_num"))
+
+    memory = model.x_train.memory_usage(deep=True, index=False).sum()
+    pickled, pickle_secs = timed(lambda: pickle.dumps(model.x_train, protocol=5))
+
+    at.reset_option("text_dtype")
+
+    return {
+        "text_dtype": text_dtype,
+        "memory (MB)": memory / 1e6,
+        "pickle (MB)": len(pickled) / 1e6,
+        "pickle (s)": pickle_secs,
+        "remove_numbers (rows/s)": n_rows / num_secs,
+        "remove_punctuation (rows/s)": n_rows / punct_secs,
+    }
+
+
+if __name__ == "__main__":
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    results = pd.DataFrame(
+        [run(n_rows, dtype) for dtype in ["object", "string[pyarrow]"]]
+    )
+
+    print(f"{n_rows} rows")
+    print(results.set_index("text_dtype").T.to_string(float_format="{:,.2f}".format))
@@ -1,10 +1,15 @@
+import importlib.util
 import unittest
 
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 import shutil
 from pathlib import Path
+from sklearn.model_selection import KFold
 from aethos import Classification
+from aethos.feature_engineering.selection import FeatureSelector
+from aethos.util import _model_input
 
 
 class TestFeatureExtraction(unittest.TestCase):
@@ -61,6 +66,26 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertEqual(validate, 2)
 
+    def test_featureextractiontext_tfidf_sparse(self):
+
+        list_of_sentences = ["Hi my name is pyml", "Hi name pyml", "pyml is my name"] * 4
+        columns = ["text"]
+        data = pd.DataFrame(list_of_sentences, columns=columns)
+        data["num"] = range(len(data))
+        data["label"] = [0, 1] * 6
+
+        feature = Classification(x_train=data, target="label", x_test=data)
+        feature.tfidf("text", keep_col=False, sparse=True)
+
+        self.assertTrue(isinstance(feature.x_train["pyml"].dtype, pd.SparseDtype))
+        self.assertEqual(feature.x_train.shape[1], 7)
+
+        x = _model_input(feature.train_data)
+
+        self.assertTrue(sp.isspmatrix_csr(x))
+        self.assertEqual(x.shape, (12, 6))
+        self.assertEqual(x[:, 0].toarray().ravel().tolist(), list(range(12)))
+
     def test_featureextractiontext_tfidf_keepcol(self):
 
         list_of_sentences = ["Hi my name is pyml", "Hi name pyml"]
@@ -73,6 +98,334 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertEqual(validate, 3)
 
+    def test_featureextractiontext_tfidf_multicol(self):
+
+        data = pd.DataFrame(
+            {
+                "title": ["red car", "blue car", "red bike"] * 2,
+                "body": ["fast car", "slow bike", "fast bike"] * 2,
+            }
+        )
+
+        serial = Classification(x_train=data, target="", x_test=data)
+        serial.bag_of_words("title", "body", keep_col=False)
+
+        parallel = Classification(x_train=data, target="", x_test=data)
+        parallel.bag_of_words("title", "body", keep_col=False, n_jobs=2, sparse=True)
+
+        shared = Classification(x_train=data, target="", x_test=data)
+        shared.tfidf("title", "body", keep_col=False, shared_vocabulary=True)
+
+        self.assertListEqual(
+            serial.x_train.columns.tolist(),
+            ["title_bike", "title_blue", "title_car", "title_red"]
+            + ["body_bike", "body_car", "body_fast", "body_slow"],
+        )
+        self.assertListEqual(
+            serial.x_test.values.tolist(),
+            parallel.x_test.sparse.to_dense().values.tolist(),
+        )
+        self.assertEqual(shared.x_train.shape[1], 12)
+        self.assertIs(
+            shared.fitted_transformers["tfidf"]["title"],
+            shared.fitted_transformers["tfidf"]["body"],
+        )
+
+    def test_featureextractiontext_tfidf_cache(self):
+
+        import os
+        import tempfile
+        from unittest import mock
+
+        import aethos as at
+
+        data = pd.DataFrame({"text": ["red car", "blue car", "red bike"] * 2})
+        cache_dir = tempfile.mkdtemp()
+
+        at.options.feature_cache = True
+        try:
+            with mock.patch(
+                "aethos.feature_engineering.cache._make_cache_dir",
+                return_value=cache_dir,
+            ):
+                computed = Classification(
+                    x_train=data.copy(), target="", x_test=data.copy()
+                )
+                computed.tfidf(keep_col=False)
+
+                cached = Classification(
+                    x_train=data.copy(), target="", x_test=data.copy()
+                )
+                cached.tfidf(keep_col=False)
+
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                pd.testing.assert_frame_equal(computed.x_train, cached.x_train)
+                pd.testing.assert_frame_equal(computed.x_test, cached.x_test)
+                self.assertIn("tfidf", cached.fitted_transformers)
+
+                # Every entry is evicted above the size limit
+                at.options.feature_cache_size = 0
+                cached.pca(n_components=2)
+
+                self.assertEqual(os.listdir(cache_dir), [])
+        finally:
+            at.reset_option("feature_cache")
+            at.reset_option("feature_cache_size")
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def test_feature_cache_overwritten_columns(self):
+
+        import tempfile
+        from unittest import mock
+
+        import aethos as at
+        from aethos.feature_engineering.cache import _cache_key
+
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(rng.normal(size=(20, 3)), columns=["a", "b", "c"])
+        data["label"] = [0, 1] * 10
+        cache_dir = tempfile.mkdtemp()
+
+        def run(method, **kwargs):
+            feat = Classification(
+                x_train=data.copy(), target="label", x_test=data.copy()
+            )
+            getattr(feat, method)(**kwargs)
+
+            return feat
+
+        at.options.feature_cache = True
+        try:
+            with mock.patch(
+                "aethos.feature_engineering.cache._make_cache_dir",
+                return_value=cache_dir,
+            ):
+                for method, kwargs in [
+                    ("polynomial_features", {"list_of_cols": ["a", "b"]}),
+                    ("pca", {"n_components": 2, "whiten": True}),
+                ]:
+                    computed = run(method, **kwargs)
+                    cached = run(method, **kwargs)
+
+                    pd.testing.assert_frame_equal(computed.x_train, cached.x_train)
+                    pd.testing.assert_frame_equal(computed.x_test, cached.x_test)
+
+                unwhitened = run("pca", n_components=2)
+
+                # Hits are copy on write, edits do not change the entry
+                edited = run("pca", n_components=2, whiten=True)
+                edited.x_train.iloc[0, 0] = 5.0
+                edited.x_test.loc[0, "0"] = 3.0
+                reloaded = run("pca", n_components=2, whiten=True)
+        finally:
+            at.reset_option("feature_cache")
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        def is_memmap(values):
+            while values is not None:
+                if isinstance(values, np.memmap):
+                    return True
+                values = values.base
+
+            return False
+
+        feat = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        big = np.zeros(10000)
+        changed = big.copy()
+        changed[5000] = 1
+
+        self.assertFalse(np.allclose(unwhitened.x_train["0"], cached.x_train["0"]))
+        self.assertListEqual(
+            [edited.x_train.iloc[0, 0], edited.x_test.loc[0, "0"]], [5.0, 3.0]
+        )
+        pd.testing.assert_frame_equal(reloaded.x_train, cached.x_train)
+        self.assertTrue(
+            any(is_memmap(block.values) for block in cached.x_train._mgr.blocks)
+        )
+        self.assertNotEqual(
+            _cache_key("pca", feat, (big,), {}), _cache_key("pca", feat, (changed,), {})
+        )
+
+    def test_feature_datetime_features(self):
+
+        data = pd.DataFrame(
+            {
+                "date": ["2020-12-31 23:00", "2021-01-02 10:30", None],
+                "store": ["a", "b", "a"],
+                "sales": [1.0, 2.0, 3.0],
+            }
+        )
+
+        feat = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        feat.datetime_features(
+            "date", parts=["year", "month", "is_weekend", "month_cyclic"], keep_col=False
+        )
+
+        self.assertListEqual(
+            feat.x_train.columns.tolist(),
+            [
+                "store",
+                "sales",
+                "date_year",
+                "date_month",
+                "date_is_weekend",
+                "date_month_sin",
+                "date_month_cos",
+            ],
+        )
+        self.assertEqual(str(feat.x_train["date_month"].dtype), "Int8")
+        self.assertListEqual(feat.x_test["date_is_weekend"].tolist()[:2], [0, 1])
+        self.assertAlmostEqual(
+            feat.x_train["date_month_cos"][0], np.cos(2 * np.pi * 11 / 12), 5
+        )
+
+        data = pd.DataFrame(
+            {
+                "time": [3, 1, 2, 1, 2],
+                "store": ["a", "a", "a", "b", "b"],
+                "sales": [30.0, 10.0, 20.0, 5.0, np.nan],
+            }
+        )
+
+        feat = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        feat.lag_features(
+            "sales", time_col="time", entity_col="store", windows=[2], aggs=["mean"]
+        )
+
+        self.assertListEqual(
+            feat.x_train["sales_lag_1"].fillna(-1).tolist(), [20.0, -1, 10.0, -1, 5.0]
+        )
+        self.assertListEqual(
+            feat.x_test["sales_rolling_mean_2"].tolist(), [25.0, 10.0, 15.0, 5.0, 5.0]
+        )
+
+        # Computing a lag again replaces it
+        feat.lag_features("sales", time_col="time", entity_col="store")
+
+        self.assertEqual(feat.x_train.columns.tolist().count("sales_lag_1"), 1)
+        self.assertRaises(ValueError, feat.lag_features, "sales", lags=[-1])
+
+    def test_feature_rolling_large_offset(self):
+
+        from aethos.feature_engineering.dates import lag_rolling_features
+
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "store": rng.integers(0, 3, size=100000),
+                "sales": 1e6 + rng.uniform(size=100000),
+            }
+        )
+
+        features = lag_rolling_features(
+            data,
+            ["sales"],
+            entity_col="store",
+            lags=[],
+            windows=[7],
+            aggs=["mean", "std"],
+        )
+        rolling = data.groupby("store")["sales"].rolling(7, min_periods=1)
+
+        for agg in ["mean", "std"]:
+            expected = getattr(rolling, agg)().reset_index(level=0, drop=True)
+
+            np.testing.assert_allclose(
+                features[f"sales_rolling_{agg}_7"], expected.sort_index(), atol=1e-6
+            )
+
+    def test_feature_bin(self):
+
+        from sklearn.preprocessing import KBinsDiscretizer
+        from aethos.feature_engineering.binning import Binner
+
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {"a": rng.exponential(size=1000), "b": rng.normal(size=1000)}
+        )
+        data["label"] = (data["b"] > 0.5).astype(int)
+        data.loc[3, "a"] = np.nan
+
+        feat = Classification(x_train=data.copy(), target="label", x_test=data.copy())
+        feat.bin("a", "b", n_bins=4, n_jobs=2, chunksize=100)
+
+        expected = KBinsDiscretizer(
+            n_bins=4, encode="ordinal", strategy="quantile"
+        ).fit_transform(data[["b"]])
+
+        self.assertEqual(feat.x_train["b_bin"].dtype, np.uint8)
+        self.assertEqual(feat.x_test["a_bin"][3], 4)
+        self.assertGreater((feat.x_train["b_bin"] == expected[:, 0]).mean(), 0.99)
+
+        # Sketches fit on separate chunks merge into the edges of all the data
+        merged = Binner(n_bins=4).fit(data[["b"]][:500])
+        merged.merge(Binner(n_bins=4).fit(data[["b"]][500:]))
+        self.assertTrue(
+            np.allclose(
+                merged.bin_edges()[0], feat.fitted_transformers["bin"].bin_edges()[1]
+            )
+        )
+
+        feat = Classification(x_train=data.copy(), target="label", x_test=data.copy())
+        feat.bin("b", strategy="tree", n_bins=2, keep_col=False)
+
+        self.assertListEqual(feat.x_train["b_bin"].tolist(), data["label"].tolist())
+
+    @unittest.skipUnless(importlib.util.find_spec("gensim"), "requires gensim")
+    def test_featureextractiontext_embed_text(self):
+
+        import os
+        import tempfile
+
+        from gensim.models import KeyedVectors
+        from aethos.feature_engineering.text import _word2vec_vectors, word_vectors
+
+        vectors = KeyedVectors(vector_size=2)
+        vectors.add_vectors(
+            ["red", "blue", "car"],
+            np.array([[1, 0], [0, 1], [2, 2]], dtype=np.float32),
+        )
+        vectors_dir = tempfile.mkdtemp()
+        vectors_path = os.path.join(vectors_dir, "vectors.kv")
+        vectors.save(vectors_path)
+
+        data = pd.DataFrame({"text": ["red car", "blue car car", "bike", "red"]})
+
+        feat = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        feat.embed_text("text", vectors_path=vectors_path, keep_col=False)
+
+        self.assertEqual(feat.x_train["text_emb_0"].dtype, np.float32)
+        self.assertTrue(
+            np.allclose(
+                feat.x_test.values,
+                [[1.5, 1], [4 / 3, 5 / 3], [0, 0], [1, 0]],
+            )
+        )
+
+        feat = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        feat.embed_text("text", vectors_path=vectors_path, pooling="tfidf")
+
+        idf = feat.fitted_transformers["embed_text"]["text"]
+        red, car = idf[vectors.key_to_index["red"]], idf[vectors.key_to_index["car"]]
+
+        self.assertAlmostEqual(red, np.log(5 / 3) + 1)
+        self.assertTrue(
+            np.allclose(
+                feat.x_train.iloc[0, 1:].tolist(),
+                (red * np.array([1, 0]) + car * np.array([2, 2])) / (red + car),
+            )
+        )
+
+        # Only the last word2vec format file is kept in memory
+        for name in ["a.txt", "b.txt"]:
+            vectors.save_word2vec_format(os.path.join(vectors_dir, name))
+            word_vectors(os.path.join(vectors_dir, name))
+
+        self.assertIs(word_vectors(vectors_path), word_vectors(vectors_path))
+        self.assertEqual(_word2vec_vectors.cache_info().currsize, 1)
+
+        shutil.rmtree(vectors_dir, ignore_errors=True)
+
     def test_featureextractioncategorical_onehot(self):
 
         normal_data = [
@@ -93,6 +446,85 @@ class TestFeatureExtraction(unittest.TestCase):
             [["Green", 0, 1, 1, 0], ["Other", 0, 1, 0, 1], ["Other", 1, 0, 0, 1]],
         )
 
+    def test_featureextractioncategorical_onehot_sparse_infrequent(self):
+
+        data = pd.DataFrame({"merchant": ["a"] * 5 + ["b"] * 4 + ["c", "d", "e"]})
+        test_data = pd.DataFrame({"merchant": ["a", "c", "z"]})
+
+        feature = Classification(x_train=data, target="", x_test=test_data)
+        feature.onehot_encode(
+            "merchant", keep_col=False, sparse=True, min_frequency=2, dtype=np.uint8
+        )
+
+        self.assertListEqual(
+            feature.x_train.columns.tolist(),
+            ["merchant_a", "merchant_b", "merchant_infrequent_sklearn"],
+        )
+        self.assertEqual(feature.x_train["merchant_a"].dtype, pd.SparseDtype(np.uint8, 0))
+        self.assertListEqual(
+            feature.x_test.sparse.to_dense().values.tolist(),
+            [[1, 0, 0], [0, 0, 1], [0, 0, 1]],
+        )
+        self.assertListEqual(
+            feature.fitted_transformers["onehot_encode"].infrequent_categories_[0].tolist(),
+            ["c", "d", "e"],
+        )
+
+    def test_featureextractioncategorical_hash_encode(self):
+
+        from sklearn.feature_extraction import FeatureHasher
+
+        data = pd.DataFrame(
+            {"col1": ["a", "b", "a", None], "col2": ["x", "x", "y", "z"]}
+        )
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.hash_encode("col1", "col2", n_features=32, keep_col=False)
+
+        hasher = FeatureHasher(n_features=32, input_type="string")
+        expected = hasher.transform(
+            [[f"col1={a}", f"col2={b}"] for a, b in zip(data.col1.fillna("nan"), data.col2)]
+        )
+
+        self.assertEqual(feature.x_train.shape, (4, 32))
+        self.assertListEqual(
+            feature.x_test.sparse.to_dense().values.tolist(),
+            expected.toarray().tolist(),
+        )
+
+    def test_featureextractioncategorical_target_encode(self):
+
+        data = pd.DataFrame(
+            {"col1": ["a", "a", "b", "b", "b", "c"] * 5, "label": [1, 0, 1, 1, 0, 1] * 5}
+        )
+        test_data = pd.DataFrame({"col1": ["a", "z"], "label": [0, 0]})
+
+        feature = Classification(x_train=data, target="label", x_test=test_data)
+        feature.target_encode("col1", smoothing=2, n_folds=3)
+
+        enc = feature.fitted_transformers["target_encode"]
+        prior = data.label.mean()
+
+        self.assertListEqual(
+            feature.x_test["col1_target_enc"].tolist(),
+            [(5 + 2 * prior) / (10 + 2), prior],
+        )
+
+        # Every training row is encoded without its own fold
+        kfold = KFold(n_splits=3, shuffle=True, random_state=42)
+        expected = np.empty(len(data))
+
+        for train_index, test_index in kfold.split(data):
+            fold = data.iloc[train_index]
+            fold_prior = fold.label.mean()
+            stats = fold.groupby("col1").label.agg(["sum", "count"])
+            encoded = (stats["sum"] + 2 * fold_prior) / (stats["count"] + 2)
+            expected[test_index] = data.col1.iloc[test_index].map(encoded).values
+
+        self.assertTrue(
+            np.allclose(feature.x_train["col1_target_enc"].values, expected)
+        )
+
     def test_featureextractiontext_nltkpostag(self):
 
         normal_data = [
@@ -105,6 +537,13 @@ class TestFeatureExtraction(unittest.TestCase):
 
         feature = Classification(x_train=data, target="", x_test=data)
         feature.postag_nltk()
+
+        self.assertEqual(feature.x_train.shape[1], 1)
+        self.assertEqual(
+            feature.token_arrays["text_postagged"]["train"]["doc"].max(), 1
+        )
+
+        feature.postag_nltk(offsets=False)
         validate = feature.x_train.shape[1] == 2 and feature.x_test.shape[1] == 2
 
         self.assertTrue(validate, 2)
@@ -137,6 +576,36 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_feature_apply_strategies(self):
+
+        from aethos.feature_engineering.apply import apply_rows
+
+        rng = np.random.RandomState(42)
+        data = pd.DataFrame(
+            {"col1": rng.rand(500), "col2": rng.randint(-2, 3, 500), "col3": "a"}
+        )
+        row_apply = lambda func: data.apply(func, axis=1).tolist()
+
+        vectorizable = lambda x: x["col1"] * 2 + x["col2"]
+        branching = lambda x: x["col1"] * 2 if x["col2"] > 0 else 0.0
+        strings = lambda x: x["col3"] if x["col2"] > 0 else "b"
+
+        for func, strategy in [
+            (vectorizable, "vectorized"),
+            (branching, "numba"),
+            (strings, "rows"),
+        ]:
+            result, used, rows_per_sec = apply_rows(func, data, chunksize=100)
+
+            self.assertEqual(used, strategy)
+            self.assertGreater(rows_per_sec, 0)
+            self.assertListEqual(result.tolist(), row_apply(func))
+
+        def broken(x):
+            raise RuntimeError("broken")
+
+        self.assertRaises(RuntimeError, apply_rows, broken, data)
+
     def test_feature_labelencoder(self):
 
         data = [["canada", "green", 1], ["canada", "green", 1], ["canada", "green", 0]]
@@ -148,6 +617,30 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_feature_labelencoder_unseen(self):
+
+        train = pd.DataFrame(
+            {"size": ["Low", "High", "Medium", "Low"], "color": ["b", "a", None, "b"]}
+        )
+        test = pd.DataFrame(
+            {"size": ["High", "Huge", "Low", "Low"], "color": ["a", "b", "c", "a"]}
+        )
+
+        feature = Classification(x_train=train, target="", x_test=test)
+        feature.ordinal_encode_labels(
+            "size", "color", ordered_cat={"size": ["Low", "Medium", "High"]}
+        )
+
+        self.assertEqual(feature.x_train["size"].dtype, np.int8)
+        self.assertListEqual(feature.x_train["size"].tolist(), [0, 2, 1, 0])
+        self.assertListEqual(feature.x_train["color"].tolist(), [1, 0, 2, 1])
+        self.assertListEqual(feature.x_test["size"].tolist(), [2, 3, 0, 0])
+        self.assertListEqual(feature.x_test["color"].tolist(), [0, 1, 2, 0])
+        self.assertDictEqual(
+            feature.fitted_transformers["ordinal_encode_labels"].mapping("color"),
+            {0: "a", 1: "b"},
+        )
+
     def test_feature_polynomial(self):
 
         data = np.arange(6).reshape(3, 2)
@@ -161,6 +654,65 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_feature_polynomial_kwargs(self):
+
+        data = pd.DataFrame(data=np.arange(6).reshape(3, 2), columns=["col1", "col2"])
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.polynomial_features(order="F")
+
+        expected = Classification(x_train=data, target="", x_test=data)
+        expected.polynomial_features()
+
+        pd.testing.assert_frame_equal(feature.x_train, expected.x_train)
+        self.assertRaises(TypeError, feature.polynomial_features, bad_param=1)
+
+    def test_feature_polynomial_chunked(self):
+
+        from sklearn.preprocessing import PolynomialFeatures
+
+        rng = np.random.RandomState(42)
+        data = pd.DataFrame(rng.rand(50, 4), columns=["a", "b", "c", "d"])
+        data["label"] = data.a * data.b
+        test_data = data.iloc[:10]
+
+        feature = Classification(x_train=data, target="label", x_test=test_data)
+        feature.polynomial_features(degree=3, chunksize=7)
+
+        poly = PolynomialFeatures(degree=3).fit(data[["a", "b", "c", "d"]])
+
+        self.assertListEqual(
+            feature.x_test.drop(columns="label").columns.tolist(),
+            poly.get_feature_names_out().tolist(),
+        )
+        self.assertTrue(
+            np.allclose(
+                feature.x_test.drop(columns="label").values,
+                poly.transform(test_data[["a", "b", "c", "d"]]),
+            )
+        )
+
+        budget = Classification(x_train=data, target="label", x_test=test_data)
+        budget.polynomial_features(max_features=1, include_bias=False)
+
+        self.assertListEqual(
+            budget.x_train.columns.tolist(), ["label", "a", "b", "c", "d", "a b"]
+        )
+
+    def test_feature_polynomial_sparse(self):
+
+        data = pd.DataFrame({"a": [0.0, 1.0, 2.0, 0.0], "b": [1.0, 0.0, 3.0, 0.0]})
+        sparse_data = data.astype(pd.SparseDtype(float, 0))
+
+        feature = Classification(x_train=sparse_data, target="", x_test=sparse_data)
+        feature.polynomial_features(include_bias=False)
+
+        self.assertTrue(isinstance(feature.x_train["a b"].dtype, pd.SparseDtype))
+        self.assertListEqual(
+            feature.x_test.sparse.to_dense().values.tolist(),
+            [[0, 1, 0, 0, 1], [1, 0, 1, 0, 0], [2, 3, 4, 6, 9], [0, 0, 0, 0, 0]],
+        )
+
     def test_featureextractiontext_spacypostag(self):
 
         normal_data = [
@@ -209,6 +761,72 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate, 2)
 
+    def test_featureextractiontext_spacy_registry(self):
+
+        import tempfile
+
+        import aethos as at
+        import spacy
+        from aethos.feature_engineering.text import SPACY_FEATURES, spacy_model
+
+        model_dir = tempfile.mkdtemp()
+        blank = spacy.blank("en")
+        blank.add_pipe("sentencizer")
+        blank.to_disk(model_dir)
+
+        data = pd.DataFrame(["hi welcome to aethos", "hi there"] * 2, columns=["text"])
+
+        at.options.spacy_model = model_dir
+        at.options.spacy_batch_size = 2
+        try:
+            feature = Classification(x_train=data, target="", x_test=data)
+            feature.postag_spacy_detailed()
+        finally:
+            at.reset_option("spacy_model")
+            at.reset_option("spacy_batch_size")
+            shutil.rmtree(model_dir)
+
+        nlp = spacy_model(model_dir, SPACY_FEATURES["d"][0])
+
+        self.assertIs(nlp, spacy_model(model_dir, SPACY_FEATURES["d"][0]))
+        self.assertListEqual(nlp.pipe_names, [])
+        self.assertListEqual(
+            feature.x_test["text_postagged"].tolist()[1], [("hi", ""), ("there", "")]
+        )
+
+    def test_featureextractiontext_textblob_parallel(self):
+
+        from aethos.feature_engineering.text import textblob_features
+
+        data = pd.DataFrame(
+            ["I love aethos", "This is terrible", "ok then", "I love aethos"] * 3,
+            columns=["text"],
+        )
+
+        serial, _ = textblob_features(data.copy(), None, "polarity", ["text"], "_pol")
+        parallel, _ = textblob_features(
+            data.copy(), None, "polarity", ["text"], "_pol", n_jobs=2, chunksize=1
+        )
+
+        self.assertListEqual(serial["text_pol"].tolist(), parallel["text_pol"].tolist())
+        self.assertGreater(serial["text_pol"].iloc[0], 0)
+
+    def test_featureextractiontext_token_arrays(self):
+
+        from aethos.feature_engineering.text import flatten_tokens, token_lists
+
+        tags = [[("I", "PRP"), ("love", "VBP")], [], [("ok", "JJ")]]
+        codes = [0, 2, 1, 0]
+
+        arrays = flatten_tokens(tags, codes, ["token", "tag"])
+
+        self.assertListEqual(arrays["doc"].tolist(), [0, 0, 1, 3, 3])
+        self.assertListEqual(arrays["tag"].tolist(), ["PRP", "VBP", "JJ", "PRP", "VBP"])
+        self.assertEqual(arrays["token"].cat.codes.dtype, np.int8)
+        self.assertListEqual(
+            token_lists(arrays, len(codes)).tolist(), [tags[code] for code in codes]
+        )
+
     def test_featureextractiontext_nltkphrases(self):
 
         normal_data = [
@@ -221,6 +839,11 @@ class TestFeatureExtraction(unittest.TestCase):
 
         feature = Classification(x_train=data, target="", x_test=data)
         feature.nounphrases_nltk()
+
+        self.assertEqual(feature.x_train.shape[1], 1)
+        self.assertIn("text_phrases", feature.token_arrays)
+
+        feature.nounphrases_nltk(offsets=False)
         validate = feature.x_train.shape[1] == 2 and feature.x_test.shape[1] == 2
 
         self.assertTrue(validate, 2)
@@ -237,6 +860,119 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_featureextractiontext_hash_parallel(self):
+
+        import threading
+
+        import aethos as at
+        from aethos.feature_engineering.parallel import map_columns
+
+        data = pd.DataFrame(
+            {
+                "title": ["red car", "blue car", "red bike"],
+                "body": ["fast car", "slow bike", "fast bike"],
+            }
+        )
+
+        serial = Classification(x_train=data.copy(), target="", x_test=data.copy())
+        serial.text_hash("title", "body", keep_col=False, n_features=8, n_jobs=1)
+
+        at.options.n_jobs = 2
+        try:
+            parallel = Classification(
+                x_train=data.copy(), target="", x_test=data.copy()
+            )
+            parallel.text_hash("title", "body", keep_col=False, n_features=8)
+
+            # A memory budget of one job runs the jobs one at a time
+            at.options.memory_budget = 100
+            workers = map_columns(
+                lambda x: threading.get_ident(),
+                [(i,) for i in range(4)],
+                job_bytes=100,
+            )
+        finally:
+            at.reset_option("n_jobs")
+            at.reset_option("memory_budget")
+
+        self.assertEqual(serial.x_train.shape, (3, 16))
+        self.assertListEqual(
+            serial.x_test.values.tolist(), parallel.x_test.values.tolist()
+        )
+        self.assertListEqual(workers, [threading.get_ident()] * 4)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requires pyarrow")
+    def test_featureextractiontext_hash_stream(self):
+
+        import tempfile
+
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import SGDClassifier
+        from aethos.feature_engineering.text import stream_text_hash
+
+        data = pd.DataFrame(
+            {
+                "text": ["red car", "blue car", None, "red bike", "fast bike"] * 2,
+                "label": [0, 1, 0, 1, 1] * 2,
+            }
+        )
+
+        output_dir = tempfile.mkdtemp()
+        try:
+            source = str(Path(output_dir, "data.parquet"))
+            data.to_parquet(source)
+
+            model = SGDClassifier(random_state=42)
+            paths, n_rows = stream_text_hash(
+                source,
+                "text",
+                chunksize=4,
+                output_dir=output_dir,
+                estimator=model,
+                target="label",
+                classes=[0, 1],
+                n_features=16,
+            )
+            blocks = sp.vstack([sp.load_npz(path) for path in paths])
+
+            feature = Classification(
+                x_train=data.copy(), target="label", x_test=data.copy()
+            )
+            feature.text_hash(
+                "text", output_dir=output_dir, chunksize=6, n_features=16
+            )
+            streamed = feature.fitted_transformers["text_hash"]["paths"]
+            test_blocks = [sp.load_npz(path) for path in streamed["test"]["text"]]
+        finally:
+            shutil.rmtree(output_dir)
+
+        expected = HashingVectorizer(n_features=16).transform(data["text"].fillna(""))
+
+        self.assertEqual(n_rows, 10)
+        self.assertEqual(len(paths), 3)
+        self.assertEqual((blocks != expected).nnz, 0)
+        self.assertListEqual(model.classes_.tolist(), [0, 1])
+        self.assertListEqual([block.shape[0] for block in test_blocks], [6, 4])
+        self.assertListEqual(feature.x_train.columns.tolist(), ["text", "label"])
+
+    def test_feature_auto_interactions(self):
+
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(rng.normal(size=(2000, 6)), columns=list("abcdef"))
+        data["label"] = (data["b"] * data["e"] > 0).astype(int)
+
+        feat = Classification(x_train=data.copy(), target="label", x_test=data.copy())
+        feat.auto_interactions(max_features=2, operations=["*", "+"], sample_size=1000)
+
+        found = feat.fitted_transformers["auto_interactions"]
+
+        self.assertEqual(found["interactions"][0], (1, "*", 4))
+        self.assertLessEqual(len(found["interactions"]), 2)
+        self.assertTrue(np.allclose(feat.x_test["b*e"], data["b"] * data["e"]))
+        self.assertListEqual(
+            feat.x_train.columns.tolist(), list(data.columns) + list(found["scores"])
+        )
+
     def test_feature_pca(self):
 
         data = np.arange(6).reshape(3, 2)
@@ -263,6 +999,51 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_feature_tsvd_arpack(self):
+
+        from sklearn.decomposition import TruncatedSVD
+
+        data = pd.DataFrame(
+            np.random.RandomState(0).rand(10, 4), columns=["a", "b", "c", "d"]
+        )
+
+        feature = Classification(x_train=data, target="", x_test=data)
+        feature.truncated_svd(n_components=2, algorithm="arpack", dtype=np.float64)
+        expected = TruncatedSVD(n_components=2, algorithm="arpack").fit_transform(data)
+
+        self.assertEqual(feature.x_train.shape[1], 2)
+        np.testing.assert_allclose(
+            np.abs(feature.x_train.values), np.abs(expected), atol=1e-6
+        )
+
+    def test_feature_tsvd_sparse(self):
+
+        from sklearn.decomposition import TruncatedSVD
+
+        data = pd.DataFrame(
+            {
+                "text": ["red car", "blue car", "red bike", "fast blue bike"] * 5,
+                "label": [0, 1] * 10,
+            }
+        )
+
+        feature = Classification(x_train=data, target="label", x_test=data)
+        feature.tfidf("text", keep_col=False, sparse=True)
+        tfidf = _model_input(feature.train_data)
+
+        feature.truncated_svd(
+            n_components=2, n_oversamples=4, n_iter=3, batch_size=6, random_state=42
+        )
+        expected = TruncatedSVD(
+            n_components=2, n_oversamples=4, n_iter=3, random_state=42
+        ).fit_transform(tfidf.astype(np.float32))
+
+        self.assertListEqual(feature.x_train.columns.tolist(), ["0", "1", "label"])
+        self.assertEqual(feature.x_test["0"].dtype, np.float32)
+        np.testing.assert_allclose(
+            np.abs(feature.x_test[["0", "1"]].values), np.abs(expected), atol=1e-5
+        )
+
     def test_feature_pcatarget(self):
 
         data = np.arange(9).reshape(3, 3)
@@ -276,6 +1057,45 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_feature_pca_modes(self):
+
+        from sklearn.decomposition import PCA
+
+        rng = np.random.RandomState(42)
+        data = pd.DataFrame(rng.rand(300, 2) @ rng.rand(2, 8), index=range(1000, 1300))
+        data.columns = [f"col{i}" for i in range(8)]
+        data["label"] = rng.randint(2, size=300)
+        features = data.drop(columns="label")
+
+        full = PCA(n_components=2).fit(features)
+
+        for mode in ["full", "randomized", "incremental"]:
+            feature = Classification(x_train=data, target="label", x_test=data.copy())
+            feature.pca(n_components=2, mode=mode, batch_size=64, random_state=42)
+
+            self.assertListEqual(feature.x_train.columns.tolist(), ["0", "1", "label"])
+            self.assertEqual(feature.x_train["0"].dtype, np.float32)
+            self.assertListEqual(feature.x_test.label.tolist(), data.label.tolist())
+            self.assertTrue(
+                np.allclose(
+                    np.abs(feature.x_test[["0", "1"]].values),
+                    np.abs(full.transform(features)),
+                    atol=1e-3,
+                )
+            )
+
+        sampled = Classification(x_train=data, target="label", x_test=data.copy())
+        sampled.pca(n_components=2, sample_size=0.5, batch_size=100)
+
+        self.assertEqual(sampled.fitted_transformers["pca"].n_samples_, 150)
+        self.assertEqual(sampled.x_train.shape, (300, 3))
+
+        sampled = Classification(x_train=data, target="label", x_test=data.copy())
+        sampled.pca(n_components=2, sample_size=np.int64(120))
+
+        self.assertEqual(sampled.fitted_transformers["pca"].n_samples_, 120)
+        self.assertRaises(ValueError, sampled.pca, n_components=2, sample_size="120")
+
     def test_util_corr(self):
 
         int_missing_data = [
@@ -295,6 +1115,38 @@ class TestFeatureExtraction(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_util_corr_blockwise(self):
+
+        from aethos.stats.correlation import correlation_engine
+
+        rng = np.random.RandomState(42)
+        data = pd.DataFrame(rng.rand(200, 6), columns=list("abcdef"))
+        data["a2"] = data.a * 2 + rng.rand(200) * 0.01
+        data["b2"] = -data.b
+        data["a3"] = data.a2 + rng.rand(200) * 0.01
+        data["label"] = data.a
+
+        feat = Classification(x_train=data.copy(), target="label", x_test=data.copy())
+        feat.drop_correlated_features(threshold=0.95, block_size=3)
+
+        self.assertListEqual(
+            feat.x_train.columns.tolist(), ["a", "b", "c", "d", "e", "f", "label"]
+        )
+        self.assertListEqual(feat.x_test.columns.tolist(), feat.x_train.columns.tolist())
+
+        engine = feat.fitted_transformers["correlation"]
+
+        self.assertIs(engine, correlation_engine(feat.x_train, engine=engine))
+        self.assertIs(engine, correlation_engine(data[["a", "b2"]], engine=engine))
+        dropped = engine.correlated_features(0.95, columns=data.columns.tolist())
+        self.assertTrue(
+            np.allclose(engine.matrix().values, data.corr().values, atol=1e-5)
+        )
+        self.assertIsNone(engine.Z)
+        self.assertListEqual(
+            engine.correlated_features(0.95, columns=data.columns.tolist()), dropped
+        )
+
     def test_numeric_chi2(self):
 
         int_missing_data = [
@@ -319,6 +1171,39 @@ class TestFeatureExtraction(unittest.TestCase):
             feat.x_train.columns.tolist(), feat.x_test.columns.tolist()
         )
 
+    def test_select_features_sparse(self):
+
+        from sklearn.feature_selection import chi2, f_classif
+
+        data = pd.DataFrame(
+            {
+                "text": ["red car", "blue car", "red bike", "green bike"] * 3,
+                "label": [1, 0, 1, 0] * 3,
+            }
+        )
+
+        feat = Classification(x_train=data.copy(), target="label", x_test=data.copy())
+        feat.tfidf("text", keep_col=False, sparse=True)
+
+        X = _model_input(feat.train_data)
+        expected = feat.train_data.columns[np.argsort(chi2(X, data.label)[0])[-2:]]
+
+        feat.select_features(k=2, method="chi2", n_jobs=2, block_size=2)
+        selector = feat.fitted_transformers["select_features"]
+
+        self.assertListEqual(
+            feat.x_train.columns.tolist(), sorted(expected.tolist()) + ["label"]
+        )
+        self.assertListEqual(feat.x_test.columns.tolist(), feat.x_train.columns.tolist())
+        self.assertTrue(
+            np.allclose(selector.scores_, chi2(X, data.label)[0], equal_nan=True)
+        )
+
+        anova = FeatureSelector(method="f_classif", k="all").fit(X, data.label)
+        self.assertTrue(
+            np.allclose(anova.scores_, f_classif(X.toarray(), data.label)[0])
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
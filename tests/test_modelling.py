@@ -76,6 +76,18 @@ class TestModelling(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    def test_model_kmeans_nok_sparse(self):
+
+        data, _ = make_blobs(n_samples=300, n_features=12, centers=4, random_state=42)
+        data = pd.DataFrame(data=data).clip(lower=0).astype(pd.SparseDtype(float, 0))
+
+        model = Unsupervised(
+            x_train=data,
+        )
+        model.KMeans(random_state=0, run=True)
+
+        self.assertIn(model.km.model.n_clusters, range(4, 12))
+
     def test_model_dbscan(self):
 
         data = [[1, 2], [2, 2], [2, 3], [8, 7], [8, 8], [25, 80]]
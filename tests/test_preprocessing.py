@@ -1,3 +1,4 @@
+import importlib.util
 import shutil
 import unittest
 from pathlib import Path
@@ -46,6 +47,60 @@ class TestPreprocessing(unittest.TestCase):
 
         self.assertTrue(True)
 
+    def test_preprocessnumeric_log_shift(self):
+
+        unnormal_data = [[0.0, -2.0, 2.0], [-1.0, 1.0, 3.0], [4.0, 1.0, -2.0]]
+
+        columns = ["col1", "col2", "col3"]
+        data = pd.DataFrame(unnormal_data, columns=columns)
+
+        preprocess = Classification(x_train=data, target="col3", x_test=data.copy())
+        preprocess.normalize_log(method="shift", dtype=np.float32)
+
+        self.assertEqual(preprocess.x_train["col1"].dtype, np.float32)
+        self.assertDictEqual(
+            preprocess.fitted_transformers["normalize_log"]["shift"],
+            {"col1": 2.0, "col2": 3.0},
+        )
+        self.assertEqual(preprocess.x_train["col2"].min(), 0)
+        self.assertListEqual(preprocess.x_train["col3"].tolist(), [2.0, 3.0, -2.0])
+
+    def test_preprocessnumeric_streaming_normalize(self):
+
+        unnormal_data = [[5.0, 3, 1], [2.0, 2, 1], [10.0, 1, 1], [10.0, 1, 1]]
+
+        columns = ["col1", "col2", "col3"]
+        data = pd.DataFrame(unnormal_data, columns=columns)
+
+        preprocess = Classification(x_train=data, target="col3", x_test=data.copy())
+        preprocess.normalize_numeric(chunksize=3, dtype=np.float32)
+
+        self.assertEqual(preprocess.x_train["col1"].dtype, np.float32)
+        self.assertListEqual(
+            preprocess.x_train["col1"].tolist(), [0.375, 0.0, 1.0, 1.0]
+        )
+        self.assertListEqual(
+            preprocess.x_test["col2"].tolist(), preprocess.x_train["col2"].tolist()
+        )
+
+    def test_preprocessnumeric_streaming_merge(self):
+
+        from aethos.preprocessing.numeric import StreamingScaler
+        from sklearn.preprocessing import RobustScaler, StandardScaler
+
+        data = np.random.RandomState(42).normal(size=(1000, 3))
+
+        for method, sk_scaler in [
+            ("standard", StandardScaler()),
+            ("robust", RobustScaler()),
+        ]:
+            scaler = StreamingScaler(method=method).partial_fit(data[:400])
+            scaler.merge(StreamingScaler(method=method).fit(data[400:], chunksize=250))
+
+            np.testing.assert_allclose(
+                scaler.transform(data), sk_scaler.fit_transform(data), atol=1e-8
+            )
+
     def test_preprocess_traindata(self):
 
         unnormal_x_train = [[5.0, 3, 1], [2.0, 2, 1], [10.0, 1, 1]]
@@ -87,6 +142,32 @@ class TestPreprocessing(unittest.TestCase):
             ],
         )
 
+    def test_preprocess_splitsentences_rule_offsets(self):
+
+        from aethos.preprocessing.text import explode_sentences
+
+        text_data = [
+            "Hi my name is aethos.exe! Please split me.",
+            "This function is going to split by sentence. Automation is great",
+        ]
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["col3"] = [1, 2]
+
+        prep = Classification(x_train=data, target="col3", x_test=data)
+        prep.split_sentences("data", method="rule", offsets=True)
+        offsets = prep.sentence_offsets["data_sentences"]["train"]
+
+        self.assertListEqual(offsets["doc"].tolist(), [0, 0, 1, 1])
+        self.assertListEqual(
+            explode_sentences(prep.x_train["data"], offsets).tolist(),
+            [
+                "Hi my name is aethos.exe!",
+                "Please split me.",
+                "This function is going to split by sentence.",
+                "Automation is great",
+            ],
+        )
+
     def test_preprocess_nltkstem(self):
 
         text_data = [
@@ -102,6 +183,45 @@ class TestPreprocessing(unittest.TestCase):
 
         self.assertEqual(validate, 3)
 
+    def test_preprocess_nltkstem_dedup(self):
+
+        import aethos as at
+
+        text_data = ["Dogs and churches", "Dogs and churches", "Running cats"]
+        data = pd.DataFrame(data=text_data * 3, columns=["data"])
+        data["col3"] = 1
+
+        prep = Classification(x_train=data, target="col3", x_test=data.copy())
+        prep.stem_nltk("data")
+
+        at.options.text_dedup_ratio = 1.0
+        try:
+            no_dedup = Classification(x_train=data, target="col3", x_test=data.copy())
+            no_dedup.stem_nltk("data")
+        finally:
+            at.reset_option("text_dedup_ratio")
+
+        self.assertListEqual(
+            prep.x_train["data_stemmed"].tolist(),
+            no_dedup.x_train["data_stemmed"].tolist(),
+        )
+        self.assertEqual(prep.x_train["data_stemmed"][2], "run cat")
+
+    def test_preprocess_map_unique(self):
+
+        from aethos.util import _map_unique
+
+        data = pd.Series(["red car", "blue car"] * 5, name="text")
+
+        with self.assertLogs("aethos.util", level="INFO") as logs:
+            words = _map_unique(str.split, data)
+        words[0].append("fast")
+
+        self.assertIn(
+            "text: 2 distinct values of 10 rows, 80% duplicated.", logs.output[0]
+        )
+        self.assertListEqual(words[2], ["red", "car"])
+
     def test_preprocess_nltksplit(self):
 
         text_data = ["Please.exe split me."]
@@ -204,6 +324,29 @@ class TestPreprocessing(unittest.TestCase):
 
         self.assertTrue(validate)
 
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requires pyarrow")
+    def test_preprocess_arrow_text(self):
+
+        import aethos as at
+
+        text_data = ["0Please.3exe,56 split me1.", "h123ello it'1s me, testing.dll.123"]
+        data = pd.DataFrame(data=text_data, columns=["data"])
+        data["col3"] = [1, 2]
+
+        at.options.text_dtype = "string[pyarrow]"
+        try:
+            prep = Classification(x_train=data, target="col3", x_test=data)
+            prep.remove_numbers("data")
+            prep.remove_punctuation("data_rem_num")
+        finally:
+            at.reset_option("text_dtype")
+
+        self.assertEqual(prep.x_train["data_rem_num"].dtype, "string[pyarrow]")
+        self.assertListEqual(
+            prep.x_train["data_rem_num_rem_punct"].tolist(),
+            ["Pleaseexe split me", "hello its me testingdll"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()